@@ -7,18 +7,100 @@ from flask import Flask, render_template_string, jsonify, request, send_from_dir
 from flask_cors import CORS
 import os
 import json
+import gzip
+import hashlib
+import logging
+import math
+import threading
+import time
 from typing import Dict, List, Optional
 
 # Import our CountryPuff library
-from countrypuff import CountryData, CountryNotFoundError, DataFetcher, CountryCodeMapper
+from countrypuff import CountryData, CountryNotFoundError, DataFetcher, CountryCodeMapper, CountryTable
+from countrypuff.cache import LRUCache
+
+logging.basicConfig(
+    level=os.environ.get('LOG_LEVEL', 'INFO'),
+    format='%(asctime)s %(levelname)s %(name)s: %(message)s'
+)
+logger = logging.getLogger('countrypuff.app')
 
 app = Flask(__name__)
 CORS(app)  # Enable CORS for API endpoints
 
 # Initialize our data components
-data_fetcher = DataFetcher()
+# Set COUNTRYPUFF_SNAPSHOT to a local factbook.json checkout or tarball to run without GitHub.
+# CountryData uses the same shared fetcher, so every request reuses one connection pool.
+data_fetcher = DataFetcher.shared()
 code_mapper = CountryCodeMapper()
 
+# Pre-rendered /api/countries bodies, keyed by dataset version
+country_list_cache = {}
+country_list_lock = threading.Lock()
+
+# /api/rankings results, keyed by (indicator, parameters, dataset version, table build)
+ranking_cache = LRUCache(maxsize=1024, ttl=None)
+
+# Cache warm-up state, exposed through /healthz/ready
+warm_up_state = {
+    'enabled': os.environ.get('COUNTRYPUFF_WARMUP', '').lower() in ('1', 'true', 'yes'),
+    'ready': False,
+    'completed': 0,
+    'total': 0,
+    'errors': 0,
+    'started_at': None,
+    'finished_at': None
+}
+
+
+def warm_up_cache():
+    """Prefetch every country into the cache, then mark the service ready."""
+    warm_up_state['started_at'] = time.time()
+    total = len(data_fetcher.warm_up_codes())
+    warm_up_state['total'] = total
+    logger.info("Warming up cache with %d countries", total)
+    
+    def report(done, total):
+        warm_up_state['completed'] = done
+        if done % 25 == 0 or done == total:
+            logger.info("Warm-up progress: %d/%d", done, total)
+    
+    try:
+        result = data_fetcher.warm_up(progress=report)
+        warm_up_state['errors'] = len(result['errors'])
+        for identifier, error in sorted(result['errors'].items()):
+            logger.debug("Warm-up skipped %s: %s", identifier, error)
+        # Countries are cached now, so this only re-indexes ones whose data changed
+        index = data_fetcher.build_text_index()
+        logger.info("Text index covers %d countries (%d fields)", len(index.countries()), len(index))
+        try:
+            table = CountryTable.for_fetcher(data_fetcher)
+            logger.info("Indicator table covers %d entities", len(table))
+        except ImportError:
+            logger.info("numpy is not installed; /api/rankings is unavailable")
+    except Exception:
+        logger.exception("Cache warm-up failed; serving with a cold cache")
+    
+    warm_up_state['finished_at'] = time.time()
+    warm_up_state['ready'] = True
+    logger.info("Warm-up finished in %.1fs (%d unavailable)",
+                warm_up_state['finished_at'] - warm_up_state['started_at'], warm_up_state['errors'])
+
+
+def country_not_found(country_identifier, error):
+    """Build the 404 response for an unknown country, with "did you mean" suggestions."""
+    return jsonify({
+        'success': False,
+        'error': f'Country not found: {str(error)}',
+        'did_you_mean': code_mapper.suggest(country_identifier)
+    }), 404
+
+
+if warm_up_state['enabled']:
+    threading.Thread(target=warm_up_cache, name='countrypuff-warmup', daemon=True).start()
+else:
+    warm_up_state['ready'] = True
+
 @app.route('/')
 def index():
     """Serve the main HTML page."""
@@ -33,15 +115,59 @@ def static_files(filename):
     """Serve static files."""
     return send_from_directory('static', filename)
 
+@app.route('/healthz')
+def healthz():
+    """Liveness check."""
+    return jsonify({'status': 'ok'})
+
+@app.route('/healthz/ready')
+def healthz_ready():
+    """Readiness check; returns 503 until the cache warm-up has finished."""
+    status_code = 200 if warm_up_state['ready'] else 503
+    return jsonify({
+        'ready': warm_up_state['ready'],
+        'warm_up': warm_up_state
+    }), status_code
+
+def country_list_payload():
+    """Render the /api/countries body once per dataset version, plain and gzipped."""
+    version = data_fetcher.dataset_version
+    with country_list_lock:
+        payload = country_list_cache.get(version)
+        if payload is None:
+            body = app.json.dumps({
+                'success': True,
+                'countries': data_fetcher.list_all_countries()
+            }).encode('utf-8')
+            digest = hashlib.sha1(body).hexdigest()[:20]
+            payload = {
+                'identity': (body, digest),
+                'gzip': (gzip.compress(body, 6), f'{digest}-gzip')
+            }
+            country_list_cache.clear()
+            country_list_cache[version] = payload
+        return payload
+
+
 @app.route('/api/countries')
 def list_countries():
     """Get list of all available countries."""
     try:
-        countries = data_fetcher.list_all_countries()
-        return jsonify({
-            'success': True,
-            'countries': countries
-        })
+        payload = country_list_payload()
+        encoding = 'gzip' if request.accept_encodings['gzip'] else 'identity'
+        body, etag = payload[encoding]
+        
+        # Either variant's ETag proves the client's copy is current
+        if any(request.if_none_match.contains(tag) for _, tag in payload.values()):
+            response = app.response_class(status=304)
+        else:
+            response = app.response_class(body, mimetype='application/json')
+            if encoding == 'gzip':
+                response.headers['Content-Encoding'] = 'gzip'
+        response.set_etag(etag)
+        response.headers['Vary'] = 'Accept-Encoding'
+        response.headers['Cache-Control'] = 'public, no-cache'
+        return response
     except Exception as e:
         return jsonify({
             'success': False,
@@ -59,8 +185,29 @@ def search_countries():
             'error': 'Query parameter "q" is required'
         }), 400
     
+    include_data = 'data' in request.args.get('include', '').split(',')
+    try:
+        limit = int(request.args['limit']) if 'limit' in request.args else None
+        if limit is not None and limit < 1:
+            raise ValueError(limit)
+    except ValueError:
+        return jsonify({
+            'success': False,
+            'error': 'Query parameter "limit" must be a positive integer'
+        }), 400
+    
+    # Each match with data is a country fetch, so cap how many one request hydrates
+    if include_data:
+        if limit is None:
+            limit = 10
+        elif limit > 50:
+            return jsonify({
+                'success': False,
+                'error': 'Query parameter "limit" must be at most 50 with include=data'
+            }), 400
+    
     try:
-        results = data_fetcher.search_countries(query)
+        results = data_fetcher.search_countries(query, include_data=include_data, limit=limit)
         return jsonify({
             'success': True,
             'results': results
@@ -71,93 +218,179 @@ def search_countries():
             'error': str(e)
         }), 500
 
+@app.route('/api/countries/suggest')
+def suggest_countries():
+    """Autocomplete country names, codes and aliases."""
+    query = request.args.get('q', '').strip()
+    
+    try:
+        limit = min(int(request.args.get('limit', 10)), 50)
+        if limit < 1:
+            raise ValueError(limit)
+    except ValueError:
+        return jsonify({
+            'success': False,
+            'error': 'Query parameter "limit" must be a positive integer'
+        }), 400
+    
+    response = jsonify({
+        'success': True,
+        'query': query,
+        'suggestions': data_fetcher.name_index.search(query, limit=limit) if query else []
+    })
+    # Suggestions only depend on the code tables, so let browsers reuse them
+    response.headers['Cache-Control'] = 'public, max-age=3600'
+    return response
+
+@app.route('/api/search')
+def search_text():
+    """Full-text search across every country's factbook text."""
+    query = request.args.get('q', '').strip()
+    
+    if not query:
+        return jsonify({
+            'success': False,
+            'error': 'Query parameter "q" is required'
+        }), 400
+    
+    try:
+        limit = min(int(request.args.get('limit', 20)), 200)
+        if limit < 1:
+            raise ValueError(limit)
+    except ValueError:
+        return jsonify({
+            'success': False,
+            'error': 'Query parameter "limit" must be a positive integer'
+        }), 400
+    
+    if not warm_up_state['ready'] and not data_fetcher.text_index().countries():
+        # The warm-up builds the index; don't start a second build in a request thread
+        response = jsonify({
+            'success': False,
+            'error': 'The search index is still being built, please retry shortly'
+        })
+        response.headers['Retry-After'] = '30'
+        return response, 503
+    
+    try:
+        hits = data_fetcher.search_text(query, limit=limit)
+        return jsonify({
+            'success': True,
+            'query': query,
+            # Distinct countries in rank order, e.g. "which countries mention lithium"
+            'countries': list(dict.fromkeys(hit['gec_code'] for hit in hits)),
+            'hits': hits
+        })
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@app.route('/api/rankings/<indicator>')
+def get_rankings(indicator):
+    """Rank every country by a numeric indicator."""
+    if indicator not in CountryTable.INDICATORS:
+        return jsonify({
+            'success': False,
+            'error': f'Unknown indicator: {indicator}',
+            'indicators': list(CountryTable.INDICATORS)
+        }), 404
+    
+    order = request.args.get('order', 'desc').lower()
+    if order not in ('asc', 'desc'):
+        return jsonify({
+            'success': False,
+            'error': 'Query parameter "order" must be "asc" or "desc"'
+        }), 400
+    
+    region = request.args.get('region') or None
+    if region is not None and region not in data_fetcher.get_all_regions():
+        return jsonify({
+            'success': False,
+            'error': f'Unknown region: {region}',
+            'regions': data_fetcher.get_all_regions()
+        }), 400
+    
+    try:
+        limit = min(int(request.args.get('limit', 20)), 500)
+        minimum = float(request.args['min']) if 'min' in request.args else None
+        maximum = float(request.args['max']) if 'max' in request.args else None
+        if limit < 1 or any(bound is not None and math.isnan(bound) for bound in (minimum, maximum)):
+            raise ValueError
+    except ValueError:
+        return jsonify({
+            'success': False,
+            'error': 'Query parameter "limit" must be a positive integer, "min" and "max" must be numbers'
+        }), 400
+    
+    include_aggregates = request.args.get('include_aggregates', '').lower() in ('1', 'true', 'yes')
+    
+    try:
+        table = CountryTable.for_fetcher(data_fetcher)
+    except ImportError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 501
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': f'Server error: {str(e)}'
+        }), 500
+    
+    # built_at tells rebuilt live tables apart, since they all have the version 'live'
+    key = (indicator, order, limit, region, minimum, maximum, include_aggregates, table.version, table.built_at)
+    result = ranking_cache.get(key)
+    if result is None:
+        rows = table.rank(indicator, descending=order == 'desc', region=region,
+                          minimum=minimum, maximum=maximum, include_aggregates=include_aggregates)
+        rankings = []
+        for rank, row in enumerate(rows[:limit].tolist(), start=1):
+            gec_code = str(table.codes[row])
+            country_info = code_mapper.get_country_info(gec_code) or {}
+            # Typed value (value, unit, multiplier, year, estimate) and its source text
+            rankings.append({
+                'rank': rank,
+                'gec_code': gec_code,
+                'iso_code': country_info.get('iso_code'),
+                'name': country_info.get('name'),
+                'region': str(table.regions[row]) or None,
+                **table.record(indicator, row).to_dict()
+            })
+        result = {
+            'success': True,
+            'indicator': indicator,
+            'order': order,
+            'region': region,
+            'dataset_version': table.version,
+            'total': len(rows),
+            'rankings': rankings
+        }
+        ranking_cache.set(key, result)
+    
+    return jsonify(result)
+
 @app.route('/api/countries/<country_identifier>')
 def get_country(country_identifier):
     """Get detailed country data."""
+    fuzzy_match = None
+    if request.args.get('fuzzy', '').lower() in ('1', 'true', 'yes'):
+        # Opt-in typo tolerance: 'Phillipines', "Côte d'Ivoire", 'Korea, South'
+        fuzzy_match = code_mapper.fuzzy_match(country_identifier)
+        if fuzzy_match:
+            country_identifier = fuzzy_match['gec_code']
+    
     try:
-        # If it's a 2-letter uppercase code, assume it's an ISO code and convert to GEC
-        if len(country_identifier) == 2 and country_identifier.isupper():
-            gec_code = code_mapper.iso_to_gec(country_identifier)
-            if gec_code:
-                try:
-                    country = CountryData.from_code(gec_code)
-                except CountryNotFoundError:
-                    # Try as country name
-                    country = CountryData.from_name(country_identifier)
-            else:
-                # Try as country name
-                country = CountryData.from_name(country_identifier)
-        else:
-            # For other formats, try direct lookup first (for GEC codes or names)
-            try:
-                country = CountryData.from_code(country_identifier)
-            except CountryNotFoundError:
-                # Try to resolve the country name/code
-                resolved_code = code_mapper.resolve_country_code(country_identifier)
-                if resolved_code:
-                    country = CountryData.from_code(resolved_code)
-                else:
-                    # Try as country name
-                    country = CountryData.from_name(country_identifier)
+        # One resolution (no network), then one data load
+        gec_code = data_fetcher.resolve_identifier(country_identifier)
+        country = CountryData.from_code(gec_code)
         
-        # Extract comprehensive data
-        country_data = {
-            # Basic Information
-            'name': country.name,
-            'official_name': country.official_name,
-            'capital': country.capital,
-            'population': country.population,
-            'area_total': country.area_total,
-            'location': country.location,
-            'coordinates': country.coordinates,
-            'climate': country.climate,
-            'natural_resources': country.natural_resources,
-            
-            # Government
-            'government_type': country.government_type,
-            'independence_date': country.independence_date,
-            
-            # Economy
-            'currency': country.currency,
-            'gdp_per_capita': country.gdp_per_capita,
-            'exports': country.exports,
-            'imports': country.imports,
-            'economic_overview': country.economic_overview,
-            'unemployment_rate': country.unemployment_rate,
-            
-            # Demographics
-            'ethnic_groups': country.ethnic_groups,
-            'languages': country.languages,
-            'religions': country.religions,
-            'life_expectancy': country.life_expectancy,
-            'age_structure': country.age_structure,
-            'birth_rate': country.birth_rate,
-            'death_rate': country.death_rate,
-            'literacy_rate': country.literacy_rate,
-            
-            # Communications
-            'internet_users': country.internet_users,
-            'mobile_phones': country.mobile_phones,
-            'broadband_subscriptions': country.broadband_subscriptions,
-            
-            # Energy
-            'electricity_access': country.electricity_access,
-            'energy_consumption_per_capita': country.energy_consumption_per_capita,
-            'electricity_generation_sources': country.electricity_generation_sources,
-            
-            # Transportation
-            'airports': country.airports,
-            'railways': country.railways,
-            'ports': country.ports,
-            
-            # Environment
-            'environment_issues': country.environment_issues,
-            'air_pollutants': country.air_pollutants,
-            
-            # Military
-            'military_expenditure': country.military_expenditure,
-            'military_service_age': country.military_service_age
-        }
+        # Extract comprehensive data: every field in the registry, one pass
+        country_data = country.extract()
+        
+        # Code information for the fallback flag and the GEC reference below
+        country_info = code_mapper.get_country_info(gec_code)
         
         # Extract the proper ISO code from the CIA Factbook data itself
         internet_country_code = country.get_field('Communications', 'Internet country code', 'text')
@@ -177,8 +410,7 @@ def get_country(country_identifier):
             country_data['iso_code'] = iso_code
             country_data['flag_url'] = f"https://flagcdn.com/w320/{flag_code.lower()}.png"
         else:
-            # Get country code information from mapper as fallback
-            country_info = code_mapper.get_country_info(country_identifier)
+            # Use country code information from mapper as fallback
             if country_info and country_info['iso_code']:
                 country_data.update({
                     'iso_code': country_info['iso_code'],
@@ -186,22 +418,27 @@ def get_country(country_identifier):
                 })
                 country_data['flag_url'] = f"https://flagcdn.com/w320/{country_info['iso_code'].lower()}.png"
         
-        # Always try to get GEC code for reference
-        country_info = code_mapper.get_country_info(country_identifier)
+        # Always try to get GEC, alpha-3 and numeric codes for reference
         if country_info:
             country_data['gec_code'] = country_info['gec_code']
+            country_data['alpha3_code'] = country_info['alpha3_code']
+            country_data['numeric_code'] = country_info['numeric_code']
         
-        return jsonify({
+        if request.args.get('typed', '').lower() in ('1', 'true', 'yes'):
+            # Parsed figures: value, unit, multiplier, year, estimate, text
+            country_data['typed'] = country.numeric_values()
+        
+        response = {
             'success': True,
             'country': country_data,
             'raw_data': country.to_dict()  # Include raw data for debugging
-        })
+        }
+        if fuzzy_match:
+            response['match'] = fuzzy_match
+        return jsonify(response)
         
     except CountryNotFoundError as e:
-        return jsonify({
-            'success': False,
-            'error': f'Country not found: {str(e)}'
-        }), 404
+        return country_not_found(country_identifier, e)
     except Exception as e:
         return jsonify({
             'success': False,
@@ -212,11 +449,12 @@ def get_country(country_identifier):
 def get_country_summary(country_identifier):
     """Get country summary data."""
     try:
-        country = CountryData.from_code(country_identifier)
+        gec_code = data_fetcher.resolve_identifier(country_identifier)
+        country = CountryData.from_code(gec_code)
         summary = country.summary()
         
         # Add additional info
-        country_info = code_mapper.get_country_info(country_identifier)
+        country_info = code_mapper.get_country_info(gec_code)
         if country_info:
             summary.update({
                 'iso_code': country_info['iso_code'],
@@ -232,10 +470,7 @@ def get_country_summary(country_identifier):
         })
         
     except CountryNotFoundError as e:
-        return jsonify({
-            'success': False,
-            'error': f'Country not found: {str(e)}'
-        }), 404
+        return country_not_found(country_identifier, e)
     except Exception as e:
         return jsonify({
             'success': False,
@@ -254,8 +489,26 @@ def search_country_fields(country_identifier):
         }), 400
     
     try:
-        country = CountryData.from_code(country_identifier)
-        results = country.search_fields(query)
+        limit = int(request.args['limit']) if 'limit' in request.args else None
+        if limit is not None and limit < 1:
+            raise ValueError(limit)
+    except ValueError:
+        return jsonify({
+            'success': False,
+            'error': 'Query parameter "limit" must be a positive integer'
+        }), 400
+    # Client-supplied patterns can backtrack for minutes (ReDoS), so regular
+    # expression search is only offered by the library
+    if request.args.get('regex', '').lower() in ('1', 'true', 'yes'):
+        return jsonify({
+            'success': False,
+            'error': 'Regular expression search is not available over the API; use CountryData.search_fields'
+        }), 400
+    whole_word = request.args.get('whole_word', '').lower() in ('1', 'true', 'yes')
+    
+    try:
+        country = CountryData.from_code(data_fetcher.resolve_identifier(country_identifier))
+        results = country.search_fields(query, limit=limit, whole_word=whole_word)
         
         return jsonify({
             'success': True,
@@ -264,11 +517,13 @@ def search_country_fields(country_identifier):
             'results': results
         })
         
-    except CountryNotFoundError as e:
+    except ValueError as e:
         return jsonify({
             'success': False,
-            'error': f'Country not found: {str(e)}'
-        }), 404
+            'error': str(e)
+        }), 400
+    except CountryNotFoundError as e:
+        return country_not_found(country_identifier, e)
     except Exception as e:
         return jsonify({
             'success': False,
@@ -284,12 +539,17 @@ def api_info():
         'description': 'CIA World Factbook country data API',
         'endpoints': {
             'GET /api/countries': 'List all available countries',
-            'GET /api/countries/search?q=<query>': 'Search countries by name',
-            'GET /api/countries/<identifier>': 'Get detailed country data',
+            'GET /api/countries/search?q=<query>[&include=data][&limit=<n>]': 'Search countries by name',
+            'GET /api/countries/suggest?q=<prefix>[&limit=<n>]': 'Ranked autocomplete suggestions',
+            'GET /api/search?q=<text>[&limit=<n>]': 'Full-text search across all countries\' factbook text',
+            'GET /api/rankings/<indicator>[?order=asc|desc][&limit=<n>][&region=<region>][&min=<x>][&max=<x>]': 'Rank countries by a numeric indicator',
+            'GET /api/countries/<identifier>[?fuzzy=1][&typed=1]': 'Get detailed country data (fuzzy=1 tolerates typos, typed=1 adds parsed figures)',
             'GET /api/countries/<identifier>/summary': 'Get country summary',
-            'GET /api/countries/<identifier>/search?q=<query>': 'Search within country data'
+            'GET /api/countries/<identifier>/search?q=<query>[&limit=<n>][&whole_word=1]': 'Search within country data',
+            'GET /healthz': 'Liveness check',
+            'GET /healthz/ready': 'Readiness check (503 until cache warm-up finishes)'
         },
-        'country_identifiers': 'Use ISO codes (US, DE), GEC codes (us, gm), or country names (United States, Germany)'
+        'country_identifiers': 'Use ISO codes (US, DE), ISO alpha-3 codes (USA, DEU), ISO numeric codes (840, 276), GEC codes (us, gm), or country names (United States, Germany)'
     })
 
 @app.route('/curl')
@@ -302,21 +562,49 @@ def curl_examples():
 # List all countries
 curl {base_url}/api/countries
 
+# Autocomplete country names
+curl "{base_url}/api/countries/suggest?q=ger"
+
 # Search for countries
 curl "{base_url}/api/countries/search?q=united"
 
+# Search for countries and include their full data
+curl "{base_url}/api/countries/search?q=united&include=data&limit=5"
+
+# Full-text search across every country (e.g. which countries mention lithium)
+curl "{base_url}/api/search?q=lithium"
+
+# Top 20 countries by GDP per capita
+curl {base_url}/api/rankings/gdp_per_capita
+
+# Bottom 10 European countries by literacy, among those above 90%
+curl "{base_url}/api/rankings/literacy_rate?order=asc&limit=10&region=europe&min=90"
+
 # Get country data (using ISO code)
 curl {base_url}/api/countries/US
 
+# Get country data (using ISO alpha-3 or numeric codes)
+curl {base_url}/api/countries/DEU
+curl {base_url}/api/countries/276
+
 # Get country data (using country name)
 curl {base_url}/api/countries/Germany
 
+# Get country data, tolerating typos
+curl "{base_url}/api/countries/Phillipines?fuzzy=1"
+
+# Get country data with numeric fields parsed
+curl "{base_url}/api/countries/US?typed=1"
+
 # Get country summary
 curl {base_url}/api/countries/NG/summary
 
 # Search within country data
 curl "{base_url}/api/countries/BR/search?q=oil"
 
+# Search within country data for whole words only, first 5 matches
+curl "{base_url}/api/countries/BR/search?q=oil&whole_word=1&limit=5"
+
 # API information
 curl {base_url}/api
 """
@@ -337,21 +625,64 @@ def docs():
             '/api/countries': {
                 'method': 'GET',
                 'description': 'List all available countries with their codes',
-                'response': 'Array of country objects with iso_code, gec_code, and name'
+                'response': 'Array of country objects with iso_code, gec_code, and name',
+                'caching': 'Strong ETag per dataset version; send If-None-Match for a 304, Accept-Encoding: gzip for a compressed body'
             },
             '/api/countries/search': {
                 'method': 'GET',
-                'parameters': {'q': 'Search query (required)'},
-                'description': 'Search for countries by name',
+                'parameters': {
+                    'q': 'Search query (required)',
+                    'include': 'Set to "data" to include full country data for each match',
+                    'limit': 'Maximum number of matches to return (with include=data: default 10, max 50)'
+                },
+                'description': 'Search for countries by name (codes and names only unless include=data)',
                 'example': '/api/countries/search?q=united'
             },
+            '/api/countries/suggest': {
+                'method': 'GET',
+                'parameters': {
+                    'q': 'Partial name, alias or code',
+                    'limit': 'Maximum number of suggestions (default: 10, max: 50)'
+                },
+                'description': 'Ranked autocomplete suggestions: exact, prefix, word-prefix, then substring matches',
+                'example': '/api/countries/suggest?q=ger'
+            },
+            '/api/search': {
+                'method': 'GET',
+                'parameters': {
+                    'q': 'Search text (required)',
+                    'limit': 'Maximum number of hits (default: 20, max: 200)'
+                },
+                'description': 'BM25-ranked full-text search over every country\'s factbook text',
+                'response': 'Hits with gec_code, iso_code, name, field path, snippet and score, plus the matching countries in rank order',
+                'example': '/api/search?q=lithium'
+            },
+            '/api/rankings/{indicator}': {
+                'method': 'GET',
+                'parameters': {
+                    'indicator': 'Numeric field: ' + ', '.join(CountryTable.INDICATORS),
+                    'order': 'desc (default, largest first) or asc',
+                    'limit': 'Maximum number of countries (default: 20, max: 500)',
+                    'region': 'Only rank countries of this factbook region (e.g. europe)',
+                    'min': 'Only include values of at least this much',
+                    'max': 'Only include values of at most this much',
+                    'include_aggregates': 'Set to 1 to also rank the World, the oceans and the European Union'
+                },
+                'description': 'Rank countries by a numeric indicator, served from the precomputed indicator table',
+                'response': 'Ranked countries with gec_code, iso_code, name, region, the typed value (value, unit, multiplier, year, estimate) and its source text; total counts every match before the limit',
+                'requires': 'numpy',
+                'example': '/api/rankings/gdp_per_capita?limit=20'
+            },
             '/api/countries/{identifier}': {
                 'method': 'GET',
                 'description': 'Get comprehensive country data',
                 'parameters': {
-                    'identifier': 'ISO code (US), GEC code (us), or country name (United States)'
+                    'identifier': 'ISO code (US), ISO alpha-3 (USA), ISO numeric (840), GEC code (us), or country name (United States)',
+                    'fuzzy': 'Set to 1 to accept misspelled or accented names (match details in "match")',
+                    'typed': 'Set to 1 to add "typed": numeric fields parsed into value, unit, multiplier, year and estimate'
                 },
-                'response': 'Complete country data including demographics, geography, economy, government'
+                'response': 'Complete country data including demographics, geography, economy, government',
+                'errors': '404 responses include "did_you_mean" suggestions'
             },
             '/api/countries/{identifier}/summary': {
                 'method': 'GET',
@@ -360,7 +691,11 @@ def docs():
             },
             '/api/countries/{identifier}/search': {
                 'method': 'GET',
-                'parameters': {'q': 'Search query within country data'},
+                'parameters': {
+                    'q': 'Search query within country data',
+                    'limit': 'Maximum number of matches to return',
+                    'whole_word': 'Set to 1 to match q as a whole word only'
+                },
                 'description': 'Search for specific information within a country\'s data'
             }
         }
@@ -406,6 +741,9 @@ if __name__ == '__main__':
     
     print("🌍 Starting CountryPuff Web Server...")
     print(f"📍 Environment: {flask_env}")
+    if data_fetcher.snapshot:
+        print(f"📦 Snapshot: {data_fetcher.snapshot.path} "
+              f"({len(data_fetcher.snapshot)} entities, version {data_fetcher.snapshot.version})")
     print(f"📍 Main page: http://localhost:{port}")
     print(f"🔗 API docs: http://localhost:{port}/docs")
     print(f"📋 cURL examples: http://localhost:{port}/curl")
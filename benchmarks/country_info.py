@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Benchmark country code lookups over the full code set.
+
+Compares CountryCodeMapper.get_country_info and list_all_countries with the
+old implementations, which scanned NAME_TO_ISO for every ISO code to find a
+display name (so listing every country was quadratic).
+
+Usage:
+    python benchmarks/country_info.py [--number 200]
+"""
+
+import argparse
+import os
+import sys
+import timeit
+
+# Add the parent directory to the path so we can import countrypuff
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from countrypuff import CountryCodeMapper
+
+
+def legacy_name(iso_code):
+    """The pre-table name lookup: first alias in NAME_TO_ISO for the ISO code."""
+    for name, iso in CountryCodeMapper.NAME_TO_ISO.items():
+        if iso == iso_code:
+            return name.title()
+    return None
+
+
+def legacy_country_info(identifier):
+    """The pre-table get_country_info."""
+    gec_code = CountryCodeMapper.resolve_country_code(identifier)
+    if not gec_code:
+        return None
+    iso_code = CountryCodeMapper.gec_to_iso(gec_code)
+    return {'gec_code': gec_code, 'iso_code': iso_code, 'name': legacy_name(iso_code)}
+
+
+def legacy_list_all_countries():
+    """The pre-table list_all_countries: one NAME_TO_ISO scan per ISO code."""
+    countries = []
+    for iso_code, gec_code in CountryCodeMapper.ISO_TO_GEC.items():
+        countries.append((iso_code, gec_code, legacy_name(iso_code) or f"Country {iso_code}"))
+    return sorted(countries, key=lambda x: x[2])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--number', type=int, default=200, help='Repetitions per measurement')
+    args = parser.parse_args()
+
+    codes = list(CountryCodeMapper.ISO_TO_GEC)
+
+    def all_info(lookup):
+        for iso_code in codes:
+            lookup(iso_code)
+
+    rows = [
+        ('get_country_info', len(codes),
+         lambda: all_info(legacy_country_info),
+         lambda: all_info(CountryCodeMapper.get_country_info)),
+        ('list_all_countries', 1,
+         legacy_list_all_countries,
+         CountryCodeMapper.list_all_countries),
+    ]
+
+    print(f"📇 Country code lookup benchmark ({len(codes)} ISO codes, {args.number} repetitions)")
+    print("=" * 62)
+    print(f"{'operation':<22}{'before':>14}{'after':>14}{'speedup':>12}")
+
+    for label, calls, before, after in rows:
+        old = timeit.timeit(before, number=args.number) / (args.number * calls)
+        new = timeit.timeit(after, number=args.number) / (args.number * calls)
+        print(f"{label:<22}{old * 1e6:>11.2f} µs{new * 1e6:>11.2f} µs{old / new:>11.1f}x")
+
+    print("-" * 62)
+    print("get_country_info times are per call, averaged over every ISO code.")
+
+
+if __name__ == '__main__':
+    main()
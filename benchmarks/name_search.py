@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Benchmark country name search.
+
+Compares the ranked NameIndex used by /api/countries/suggest with the old
+unranked substring scan over CountryCodeMapper.NAME_TO_ISO, and measures the
+server time of the suggest endpoint through Flask's test client. NameIndex
+is timed both cold (ranking from scratch) and memoized (repeat queries, the
+common case for keystroke traffic).
+
+Usage:
+    python benchmarks/name_search.py [--number 2000]
+"""
+
+import argparse
+import os
+import sys
+import timeit
+
+# Add the parent directory to the path so we can import countrypuff
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from countrypuff import CountryCodeMapper
+from countrypuff.name_index import NameIndex
+
+
+QUERIES = ['a', 'ge', 'ger', 'united', 'korea', 'land', 'zz', 'DE']
+
+
+def linear_scan(query):
+    """The pre-index search: substring test against every name, unranked."""
+    query_lower = query.lower()
+    return [(name, iso_code) for name, iso_code in CountryCodeMapper.NAME_TO_ISO.items()
+            if query_lower in name]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--number', type=int, default=2000, help='Calls per measurement')
+    args = parser.parse_args()
+
+    index = NameIndex.default()
+
+    print(f"🔎 Name search benchmark ({args.number} calls per query)")
+    print("=" * 74)
+    print(f"{'query':<10}{'linear scan':>14}{'index cold':>14}{'index warm':>14}{'endpoint':>14}")
+
+    # Imported late so app start-up messages do not interleave with the table
+    import app
+    client = app.app.test_client()
+
+    for query in QUERIES:
+        linear = timeit.timeit(lambda: linear_scan(query), number=args.number) / args.number
+        normalized = index.normalize(query)
+        cold = timeit.timeit(lambda: index._rank(normalized, 10), number=args.number) / args.number
+        warm = timeit.timeit(lambda: index.search(query, limit=10), number=args.number) / args.number
+        endpoint_calls = max(args.number // 10, 1)
+        endpoint = timeit.timeit(
+            lambda: client.get('/api/countries/suggest', query_string={'q': query}),
+            number=endpoint_calls
+        ) / endpoint_calls
+        print(f"{query:<10}{linear * 1e6:>11.1f} µs{cold * 1e6:>11.1f} µs"
+              f"{warm * 1e6:>11.1f} µs{endpoint * 1e6:>11.1f} µs")
+
+    print("-" * 74)
+    print("Endpoint time includes Flask request handling and JSON encoding.")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Benchmark sequential vs parallel region probing in DataFetcher.
+
+Starts a local stub of the factbook.json layout that adds a fixed delay to
+every request, then times lookups that have to scan regions because no
+region index is available. The worst case is a country stored in one of the
+last regions DataFetcher probes (India, under 'south-asia').
+
+Usage:
+    python benchmarks/region_probe.py [--latency 0.05] [--rounds 5]
+"""
+
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Add the parent directory to the path so we can import countrypuff
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from countrypuff import DataFetcher, RegionIndex
+from countrypuff.cache import LRUCache
+
+
+# (gec, region) pairs served by the stub; 'south-asia' is probed 11th of 13
+STUB_COUNTRIES = {
+    ('ag', 'africa'): {'Government': {'Capital': {'name': {'text': 'Algiers'}}}},
+    ('gm', 'europe'): {'Government': {'Capital': {'name': {'text': 'Berlin'}}}},
+    ('in', 'south-asia'): {'Government': {'Capital': {'name': {'text': 'New Delhi'}}}},
+}
+
+
+def make_handler(latency):
+    class StubHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            time.sleep(latency)
+            parts = self.path.strip('/').split('/')
+            data = None
+            if len(parts) == 2 and parts[1].endswith('.json'):
+                data = STUB_COUNTRIES.get((parts[1][:-len('.json')], parts[0]))
+
+            if data is None:
+                self.send_response(404)
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+                return
+
+            body = json.dumps(data).encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return StubHandler
+
+
+def time_lookups(fetcher, gec_code, rounds):
+    timings = []
+    for _ in range(rounds):
+        # Start every lookup cold: no cached country and no remembered 404s
+        fetcher.memory_cache.invalidate()
+        fetcher.negative_cache.invalidate()
+        start = time.perf_counter()
+        fetcher.get_country_data(gec_code)
+        timings.append(time.perf_counter() - start)
+    return sum(timings) / len(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--latency', type=float, default=0.05, help='Per-request delay in seconds')
+    parser.add_argument('--rounds', type=int, default=5, help='Lookups per measurement')
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), make_handler(args.latency))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}/"
+
+    print(f"⏱️  Region probing benchmark ({args.latency * 1000:.0f} ms per request, {args.rounds} rounds)")
+    print("=" * 60)
+
+    results = {}
+    for mode in ('sequential', 'parallel'):
+        fetcher = DataFetcher(
+            base_url=base_url,
+            region_index=RegionIndex(),  # force a region scan
+            memory_cache=LRUCache(),
+            negative_cache=LRUCache(),
+            probe_mode=mode
+        )
+        for gec_code, region in STUB_COUNTRIES:
+            elapsed = time_lookups(fetcher, gec_code, args.rounds)
+            results[(mode, gec_code)] = elapsed
+            print(f"{mode:>10}  {gec_code} ({region:<10}) {elapsed * 1000:8.1f} ms")
+
+    worst_sequential = results[('sequential', 'in')]
+    worst_parallel = results[('parallel', 'in')]
+    print("-" * 60)
+    print(f"Worst case speed-up: {worst_sequential / worst_parallel:.1f}x")
+
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -8,9 +8,15 @@ CIA World Factbook, including demographics, geography, economy, government, and
 from .country_data import CountryData, CountryNotFoundError
 from .data_fetcher import DataFetcher
 from .country_codes import CountryCodeMapper
+from .region_index import RegionIndex
+from .alias_index import AliasIndex
+from .snapshot import Snapshot
+from .async_fetcher import AsyncDataFetcher, AsyncCountryData
+from .country_table import CountryTable
 
 __version__ = "0.1.0"
 __author__ = "Paul Bertain"
 __email__ = "paul+countrypuff@bertain.net"
 
-__all__ = ["CountryData", "CountryNotFoundError", "DataFetcher", "CountryCodeMapper"]
\ No newline at end of file
+__all__ = ["CountryData", "CountryNotFoundError", "DataFetcher", "CountryCodeMapper", "RegionIndex", "AliasIndex",
+           "Snapshot", "AsyncDataFetcher", "AsyncCountryData", "CountryTable"]
\ No newline at end of file
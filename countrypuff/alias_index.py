@@ -0,0 +1,216 @@
+"""
+Country name alias index built from the factbook's own "Country name" fields.
+
+Every country's ``Government -> Country name`` section lists its conventional
+and local long and short forms, former names and abbreviations, e.g.
+'Bundesrepublik Deutschland', 'Deutschland', 'FRG' and 'German Empire' for
+Germany. Indexing them lets the resolver answer those names from memory
+instead of treating them as unknown identifiers.
+
+The index is built from a snapshot at runtime when one is configured. It can
+also be generated once and shipped as ``alias_index.json`` with::
+
+    python -m countrypuff.alias_index <snapshot_path> [output_path]
+"""
+
+import json
+import os
+import re
+import sys
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .country_codes import CountryCodeMapper
+
+
+class AliasIndex:
+    """
+    Maps folded country name aliases to GEC codes.
+    """
+
+    DEFAULT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'alias_index.json')
+
+    # Subfields of Government -> Country name that hold names
+    NAME_FIELDS = (
+        'conventional long form',
+        'conventional short form',
+        'local long form',
+        'local short form',
+        'former',
+        'abbreviation'
+    )
+
+    # Fields that list several names separated by commas
+    LIST_FIELDS = ('former',)
+
+    _default = None
+
+    def __init__(self, mapping: Optional[Dict[str, str]] = None):
+        """
+        Initialize the AliasIndex.
+
+        Args:
+            mapping: Dictionary of alias -> GEC code; aliases are folded
+                with CountryCodeMapper.fold_name
+        """
+        self._aliases = {}
+        for alias, gec_code in (mapping or {}).items():
+            key = CountryCodeMapper.fold_name(alias)
+            if key:
+                self._aliases[key] = gec_code.lower()
+
+    @classmethod
+    def load(cls, path: Optional[str] = None) -> 'AliasIndex':
+        """
+        Load an index from a JSON file.
+
+        Args:
+            path: Path to the index file (default: alias_index.json in the package)
+
+        Returns:
+            AliasIndex instance (empty if the file does not exist)
+        """
+        path = path or cls.DEFAULT_PATH
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return cls(json.load(f))
+        except FileNotFoundError:
+            return cls()
+
+    @classmethod
+    def default(cls) -> 'AliasIndex':
+        """
+        Get the index shipped with the package, loading it on first use.
+
+        Returns:
+            Shared AliasIndex instance (empty if none has been generated)
+        """
+        if cls._default is None:
+            cls._default = cls.load()
+        return cls._default
+
+    @classmethod
+    def from_countries(cls, countries: Iterable[Tuple[str, Dict]]) -> 'AliasIndex':
+        """
+        Build an index from country data.
+
+        Aliases claimed by more than one country (e.g. 'Congo') are left out
+        rather than resolved arbitrarily.
+
+        Args:
+            countries: (GEC code, country data) pairs
+
+        Returns:
+            AliasIndex instance
+        """
+        owners: Dict[str, set] = {}
+        for gec_code, data in countries:
+            for name in cls.extract_names(data):
+                key = CountryCodeMapper.fold_name(name)
+                if len(key) > 1:
+                    owners.setdefault(key, set()).add(gec_code.lower())
+
+        index = cls()
+        index._aliases = {key: codes.pop() for key, codes in owners.items() if len(codes) == 1}
+        return index
+
+    @classmethod
+    def from_snapshot(cls, snapshot) -> 'AliasIndex':
+        """
+        Build an index from every country in a snapshot.
+
+        Args:
+            snapshot: Snapshot instance
+
+        Returns:
+            AliasIndex instance
+        """
+        return cls.from_countries((gec_code, snapshot.get(gec_code)) for gec_code in snapshot.codes())
+
+    @classmethod
+    def extract_names(cls, data: Dict) -> List[str]:
+        """
+        Get the names a country's data lists for itself.
+
+        Parenthetical remarks are dropped, 'none' entries are skipped, and
+        entries listing alternatives ('US or USA', 'Suomi/Finland') are split.
+
+        Args:
+            data: Country data
+
+        Returns:
+            List of names, in field order
+        """
+        section = data.get('Government', {}).get('Country name', {})
+        if not isinstance(section, dict):
+            return []
+
+        names = []
+        for field in cls.NAME_FIELDS:
+            entry = section.get(field)
+            text = entry.get('text') if isinstance(entry, dict) else None
+            if not isinstance(text, str):
+                continue
+            text = re.sub(r'\([^)]*\)', ' ', text)
+            separators = r';|/|\s+or\s+|,' if field in cls.LIST_FIELDS else r';|/|\s+or\s+'
+            for name in re.split(separators, text):
+                name = name.strip()
+                if name and name.lower() != 'none':
+                    names.append(name)
+        return names
+
+    def save(self, path: Optional[str] = None) -> None:
+        """
+        Write the index to a JSON file.
+
+        Args:
+            path: Destination path (default: alias_index.json in the package)
+        """
+        path = path or self.DEFAULT_PATH
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self._aliases, f, indent=2, sort_keys=True, ensure_ascii=False)
+            f.write('\n')
+        os.replace(tmp_path, path)
+
+    def resolve(self, name: str) -> Optional[str]:
+        """
+        Look up a name.
+
+        Args:
+            name: Country name in any form (folded before lookup)
+
+        Returns:
+            GEC code or None if the name is not in the index
+        """
+        return self._aliases.get(CountryCodeMapper.fold_name(name))
+
+    def names_for(self, gec_code: str) -> List[str]:
+        """
+        Get every alias of a country.
+
+        Args:
+            gec_code: GEC code (e.g., 'gm')
+
+        Returns:
+            Sorted list of folded aliases
+        """
+        gec_code = gec_code.lower()
+        return sorted(alias for alias, code in self._aliases.items() if code == gec_code)
+
+    def __contains__(self, name: str) -> bool:
+        return self.resolve(name) is not None
+
+    def __len__(self) -> int:
+        return len(self._aliases)
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2:
+        sys.exit("usage: python -m countrypuff.alias_index <snapshot_path> [output_path]")
+
+    from .snapshot import Snapshot
+
+    output_path = sys.argv[2] if len(sys.argv) > 2 else None
+    index = AliasIndex.from_snapshot(Snapshot.open(sys.argv[1]))
+    index.save(output_path)
+    print(f"Wrote {len(index)} aliases to {output_path or AliasIndex.DEFAULT_PATH}")
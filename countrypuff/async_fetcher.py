@@ -0,0 +1,373 @@
+"""
+Asynchronous data fetching built on aiohttp.
+
+``AsyncDataFetcher`` mirrors ``DataFetcher`` for asyncio applications. It
+shares identifier resolution, the region index, the snapshot source and the
+parsed-country cache with the synchronous fetcher, but performs HTTP requests
+through a single pooled ``aiohttp.ClientSession`` per event loop.
+
+aiohttp is an optional dependency (``pip install aiohttp``).
+"""
+
+import asyncio
+import functools
+import json
+import weakref
+from typing import Dict, Iterable, List, Optional
+from urllib.parse import urljoin
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - optional dependency
+    aiohttp = None
+
+from .country_data import CountryData
+from .data_fetcher import DataFetcher, CountryNotFoundError
+
+
+class AsyncDataFetcher:
+    """
+    Fetches country data from the factbook.json GitHub repository using asyncio.
+    """
+
+    # One pooled client per event loop, shared by every AsyncDataFetcher
+    _sessions: 'weakref.WeakKeyDictionary' = weakref.WeakKeyDictionary()
+
+    def __init__(self, timeout: int = 30, max_concurrency: int = 10,
+                 fetcher: Optional[DataFetcher] = None, **fetcher_options):
+        """
+        Initialize the AsyncDataFetcher.
+
+        Args:
+            timeout: Request timeout in seconds (default: 30)
+            max_concurrency: Maximum number of requests in flight at once (default: 10)
+            fetcher: DataFetcher providing resolution, region index and caches
+                (default: the shared fetcher, or a new one if fetcher_options are given)
+            **fetcher_options: Options for a dedicated DataFetcher (region_index, cache_dir,
+                memory_cache, snapshot_path, base_url)
+
+        Raises:
+            ImportError: If aiohttp is not installed
+        """
+        if aiohttp is None:
+            raise ImportError("AsyncDataFetcher requires aiohttp. Install it with: pip install aiohttp")
+
+        self.timeout = timeout
+        self.max_concurrency = max_concurrency
+        # The synchronous fetcher owns resolution, the region index and caches
+        if fetcher is None:
+            fetcher = DataFetcher(timeout=timeout, **fetcher_options) if fetcher_options else DataFetcher.shared()
+        self._fetcher = fetcher
+        self._semaphores: 'weakref.WeakKeyDictionary' = weakref.WeakKeyDictionary()
+
+    @property
+    def code_mapper(self):
+        return self._fetcher.code_mapper
+
+    @property
+    def region_index(self):
+        return self._fetcher.region_index
+
+    @property
+    def snapshot(self):
+        return self._fetcher.snapshot
+
+    @property
+    def memory_cache(self):
+        return self._fetcher.memory_cache
+
+    @property
+    def dataset_version(self) -> str:
+        return self._fetcher.dataset_version
+
+    async def get_country_data(self, country_identifier: str, region: Optional[str] = None) -> Dict:
+        """
+        Fetch country data by country code or name.
+
+        Args:
+            country_identifier: Country code (e.g., 'us', 'gm') or country name
+            region: Optional region to search in (speeds up lookup)
+
+        Returns:
+            Dictionary containing country data
+
+        Raises:
+            CountryNotFoundError: If country is not found
+            aiohttp.ClientError: If network request fails
+        """
+        country_code = self._fetcher.resolve_identifier(country_identifier)
+        return await self._get_by_code(country_code, region, country_identifier)
+
+    async def get_many(self, identifiers: Iterable[str], max_in_flight: Optional[int] = None) -> Dict[str, Dict]:
+        """
+        Fetch several countries concurrently.
+
+        Identifiers are resolved up front and de-duplicated by GEC code, so
+        'DE', 'gm' and 'Germany' cost a single fetch.
+
+        Args:
+            identifiers: Country codes or names
+            max_in_flight: Maximum concurrent fetches (default: max_concurrency)
+
+        Returns:
+            Dictionary with 'results' (identifier -> country data) and
+            'errors' (identifier -> error message)
+        """
+        results: Dict[str, Dict] = {}
+        errors: Dict[str, str] = {}
+
+        by_code: Dict[str, List[str]] = {}
+        for identifier in identifiers:
+            try:
+                country_code = self._fetcher.resolve_identifier(identifier)
+            except CountryNotFoundError as e:
+                errors[identifier] = str(e)
+                continue
+            by_code.setdefault(country_code, []).append(identifier)
+
+        limit = asyncio.Semaphore(max_in_flight or self.max_concurrency)
+
+        async def fetch(country_code: str, names: List[str]) -> None:
+            async with limit:
+                try:
+                    data = await self._get_by_code(country_code, None, names[0])
+                except Exception as e:
+                    for name in names:
+                        errors[name] = str(e)
+                    return
+            for name in names:
+                results[name] = data
+
+        await asyncio.gather(*(fetch(code, names) for code, names in by_code.items()))
+        return {'results': results, 'errors': errors}
+
+    async def search_countries(self, query: str, include_data: bool = False,
+                               limit: Optional[int] = None) -> List[Dict]:
+        """
+        Search for countries by name.
+
+        Args:
+            query: Search query
+            include_data: Also fetch each match's full country data (default: False)
+            limit: Maximum number of matches to return (default: no limit)
+
+        Returns:
+            List of matching countries with their information
+        """
+        results = self._fetcher.search_countries(query, limit=limit)
+
+        if include_data and results:
+            fetched = await self.get_many(result['gec_code'] for result in results)
+            for result in results:
+                result['data'] = fetched['results'].get(result['gec_code'])
+
+        return results
+
+    def list_all_countries(self) -> List[Dict]:
+        """
+        List all available countries with their codes.
+
+        Returns:
+            List of dictionaries with country information
+        """
+        return self._fetcher.list_all_countries()
+
+    @classmethod
+    async def close(cls) -> None:
+        """Close the pooled client for the running event loop."""
+        session = cls._sessions.pop(asyncio.get_running_loop(), None)
+        if session is not None:
+            await session.close()
+
+    async def __aenter__(self) -> 'AsyncDataFetcher':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def _get_by_code(self, country_code: str, region: Optional[str], country_identifier: str) -> Dict:
+        data = self.memory_cache.get(self._fetcher.cache_key(country_code))
+        if data is None:
+            data = await self._fetch_country(country_code, region, country_identifier)
+            self.memory_cache.set(self._fetcher.cache_key(country_code), data)
+        return data
+
+    async def _fetch_country(self, country_code: str, region: Optional[str], country_identifier: str) -> Dict:
+        """
+        Fetch country data from upstream, using the region index when possible.
+
+        Mirrors DataFetcher._fetch_country, except that a full region scan
+        probes every remaining region concurrently.
+        """
+        if self.snapshot is not None:
+            data = self.snapshot.get(country_code)
+            if data is None:
+                raise CountryNotFoundError(f"Country '{country_identifier}' not found")
+            return data
+
+        tried = set()
+        if region:
+            tried.add(region)
+            try:
+                return await self._fetch_from_region(country_code, region)
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                pass
+
+        if len(self.region_index):
+            indexed_region = self.region_index.region_for(country_code)
+            if not indexed_region:
+                raise CountryNotFoundError(f"Country '{country_identifier}' not found")
+
+            if indexed_region not in tried:
+                tried.add(indexed_region)
+                try:
+                    return await self._fetch_from_region(country_code, indexed_region)
+                except aiohttp.ClientResponseError as e:
+                    # A 404 means the index is stale; fall back to a full scan
+                    if e.status != 404:
+                        raise
+
+        candidates = [name for name in self._fetcher.REGIONS if name not in tried]
+        tasks = [asyncio.ensure_future(self._fetch_from_region(country_code, name)) for name in candidates]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                try:
+                    return await next_done
+                except (aiohttp.ClientError, asyncio.TimeoutError):
+                    continue
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        raise CountryNotFoundError(f"Country '{country_identifier}' not found")
+
+    async def _fetch_from_region(self, country_code: str, region: str) -> Dict:
+        """
+        Fetch country data from a specific region.
+
+        Raises:
+            aiohttp.ClientError: If request fails
+        """
+        url = urljoin(self._fetcher.base_url, f"{region}/{country_code}.json")
+        negative_key = ('region', self._fetcher.base_url, country_code, region)
+        if self._fetcher.negative_cache.get(negative_key):
+            raise aiohttp.ClientResponseError(None, (), status=404, message='Not Found (cached)')
+
+        try:
+            return await self._request_json(url)
+        except aiohttp.ClientResponseError as e:
+            if e.status == 404:
+                self._fetcher.negative_cache.set(negative_key, True)
+            raise
+
+    async def _request_json(self, url: str) -> Dict:
+        """
+        GET a JSON document, revalidating against the HTTP cache if enabled.
+
+        The HTTP cache reads and writes files, so it runs in the default
+        executor instead of blocking the event loop.
+
+        Raises:
+            aiohttp.ClientError: If request fails
+        """
+        http_cache = self._fetcher.http_cache
+        headers = await self._in_executor(http_cache.conditional_headers, url) if http_cache is not None else {}
+
+        async with self._semaphore():
+            async with self._session().get(url, headers=headers) as response:
+                if response.status == 304 and http_cache is not None:
+                    data = await self._in_executor(http_cache.load, url)
+                    if data is not None:
+                        return data
+                else:
+                    response.raise_for_status()
+                    body = await response.read()
+                    if http_cache is None:
+                        return json.loads(body)
+                    return await self._store(url, body, response)
+
+            # Cached body disappeared after a 304; fetch it again unconditionally
+            async with self._session().get(url) as response:
+                response.raise_for_status()
+                body = await response.read()
+                return await self._store(url, body, response)
+
+    async def _store(self, url: str, body: bytes, response: 'aiohttp.ClientResponse') -> Dict:
+        return await self._in_executor(functools.partial(
+            self._fetcher.http_cache.store,
+            url,
+            body,
+            etag=response.headers.get('ETag'),
+            last_modified=response.headers.get('Last-Modified')
+        ))
+
+    @staticmethod
+    async def _in_executor(func, *args):
+        return await asyncio.get_running_loop().run_in_executor(None, func, *args)
+
+    def _session(self) -> 'aiohttp.ClientSession':
+        loop = asyncio.get_running_loop()
+        session = self._sessions.get(loop)
+        if session is None or session.closed:
+            session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                headers=dict(self._fetcher.session.headers)
+            )
+            self._sessions[loop] = session
+        return session
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphores[loop] = semaphore
+        return semaphore
+
+
+class AsyncCountryData(CountryData):
+    """
+    CountryData with awaitable constructors for asyncio applications.
+    """
+
+    _default_fetcher: Optional[AsyncDataFetcher] = None
+
+    @classmethod
+    def _get_fetcher(cls, fetcher: Optional[AsyncDataFetcher]) -> AsyncDataFetcher:
+        if fetcher is not None:
+            return fetcher
+        if AsyncCountryData._default_fetcher is None:
+            AsyncCountryData._default_fetcher = AsyncDataFetcher()
+        return AsyncCountryData._default_fetcher
+
+    @classmethod
+    async def from_code(cls, country_code: str, fetcher: Optional[AsyncDataFetcher] = None) -> 'AsyncCountryData':
+        """
+        Create AsyncCountryData instance from country code.
+
+        Args:
+            country_code: Country code (e.g., 'us', 'gm')
+            fetcher: AsyncDataFetcher to use (default: a shared instance)
+
+        Returns:
+            AsyncCountryData instance
+        """
+        fetcher = cls._get_fetcher(fetcher)
+        data = await fetcher.get_country_data(country_code)
+        return cls(data=data, fetcher=fetcher._fetcher)
+
+    @classmethod
+    async def from_name(cls, country_name: str, fetcher: Optional[AsyncDataFetcher] = None) -> 'AsyncCountryData':
+        """
+        Create AsyncCountryData instance from country name.
+
+        Args:
+            country_name: Country name (e.g., 'United States', 'Germany')
+            fetcher: AsyncDataFetcher to use (default: a shared instance)
+
+        Returns:
+            AsyncCountryData instance
+        """
+        fetcher = cls._get_fetcher(fetcher)
+        data = await fetcher.get_country_data(country_name)
+        return cls(data=data, fetcher=fetcher._fetcher)
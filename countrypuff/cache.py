@@ -0,0 +1,133 @@
+"""
+In-memory caching utilities shared across the library.
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+
+class LRUCache:
+    """
+    Thread-safe, size-bounded cache with least-recently-used eviction and a TTL.
+
+    Entries older than ``ttl`` seconds are treated as missing. When the cache
+    is full, the least recently used entry is evicted to make room.
+    """
+
+    def __init__(self, maxsize: int = 512, ttl: Optional[float] = 3600):
+        """
+        Initialize the LRUCache.
+
+        Args:
+            maxsize: Maximum number of entries to keep (default: 512)
+            ttl: Entry lifetime in seconds, or None to never expire (default: 3600)
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: 'OrderedDict[Hashable, tuple]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Get a cached value.
+
+        Args:
+            key: Cache key
+            default: Value to return on a miss
+
+        Returns:
+            Cached value or default if missing or expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+
+            value, expires_at = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return default
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Store a value, evicting the least recently used entry if full.
+
+        Args:
+            key: Cache key
+            value: Value to store
+        """
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+            self._entries[key] = (value, expires_at)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        """
+        Remove one entry, or every entry if no key is given.
+
+        Args:
+            key: Cache key to remove (default: clear the whole cache)
+        """
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache counters.
+
+        Returns:
+            Dictionary with hits, misses, evictions, expirations and size information
+        """
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'size': len(self._entries),
+                'maxsize': self.maxsize,
+                'ttl': self.ttl
+            }
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and (entry[1] is None or entry[1] > time.monotonic())
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+# Parsed country data keyed by (dataset, canonical GEC code), shared by every DataFetcher
+country_cache = LRUCache(
+    maxsize=int(os.environ.get('COUNTRYPUFF_CACHE_SIZE', 512)),
+    ttl=float(os.environ.get('COUNTRYPUFF_CACHE_TTL', 3600))
+)
+
+# Recent misses: (base URL, gec, region) files that returned 404
+missing_cache = LRUCache(
+    maxsize=int(os.environ.get('COUNTRYPUFF_NEGATIVE_CACHE_SIZE', 4096)),
+    ttl=float(os.environ.get('COUNTRYPUFF_NEGATIVE_CACHE_TTL', 300))
+)
@@ -2,10 +2,15 @@
 Country code mappings between ISO 3166-1 alpha-2 and CIA Factbook GEC codes.
 
 This module provides comprehensive mappings to convert between standard ISO country codes
-and the GEC (formerly FIPS) codes used by the CIA World Factbook.
+(alpha-2, alpha-3 and numeric) and the GEC (formerly FIPS) codes used by the CIA World Factbook.
 """
 
-from typing import Dict, Optional, List, Tuple
+import re
+import unicodedata
+from itertools import chain
+from typing import Any, Dict, Optional, List, Tuple, Union
+
+from .fuzzy import BKTree
 
 
 class CountryCodeMapper:
@@ -322,6 +327,916 @@ class CountryCodeMapper:
     # Reverse mapping: GEC -> ISO 3166-1 alpha-2
     GEC_TO_ISO = {v: k for k, v in ISO_TO_GEC.items()}
     
+    # ISO 3166-1 alpha-2 -> alpha-3
+    ISO_TO_ALPHA3 = {
+        # A
+        'AD': 'AND',
+        'AE': 'ARE',
+        'AF': 'AFG',
+        'AG': 'ATG',
+        'AI': 'AIA',
+        'AL': 'ALB',
+        'AM': 'ARM',
+        'AO': 'AGO',
+        'AQ': 'ATA',
+        'AR': 'ARG',
+        'AS': 'ASM',
+        'AT': 'AUT',
+        'AU': 'AUS',
+        'AW': 'ABW',
+        'AX': 'ALA',
+        'AZ': 'AZE',
+        
+        # B
+        'BA': 'BIH',
+        'BB': 'BRB',
+        'BD': 'BGD',
+        'BE': 'BEL',
+        'BF': 'BFA',
+        'BG': 'BGR',
+        'BH': 'BHR',
+        'BI': 'BDI',
+        'BJ': 'BEN',
+        'BL': 'BLM',
+        'BM': 'BMU',
+        'BN': 'BRN',
+        'BO': 'BOL',
+        'BQ': 'BES',
+        'BR': 'BRA',
+        'BS': 'BHS',
+        'BT': 'BTN',
+        'BV': 'BVT',
+        'BW': 'BWA',
+        'BY': 'BLR',
+        'BZ': 'BLZ',
+        
+        # C
+        'CA': 'CAN',
+        'CC': 'CCK',
+        'CD': 'COD',
+        'CF': 'CAF',
+        'CG': 'COG',
+        'CH': 'CHE',
+        'CI': 'CIV',
+        'CK': 'COK',
+        'CL': 'CHL',
+        'CM': 'CMR',
+        'CN': 'CHN',
+        'CO': 'COL',
+        'CR': 'CRI',
+        'CU': 'CUB',
+        'CV': 'CPV',
+        'CW': 'CUW',
+        'CX': 'CXR',
+        'CY': 'CYP',
+        'CZ': 'CZE',
+        
+        # D
+        'DE': 'DEU',
+        'DJ': 'DJI',
+        'DK': 'DNK',
+        'DM': 'DMA',
+        'DO': 'DOM',
+        'DZ': 'DZA',
+        
+        # E
+        'EC': 'ECU',
+        'EE': 'EST',
+        'EG': 'EGY',
+        'EH': 'ESH',
+        'ER': 'ERI',
+        'ES': 'ESP',
+        'ET': 'ETH',
+        
+        # F
+        'FI': 'FIN',
+        'FJ': 'FJI',
+        'FK': 'FLK',
+        'FM': 'FSM',
+        'FO': 'FRO',
+        'FR': 'FRA',
+        
+        # G
+        'GA': 'GAB',
+        'GB': 'GBR',
+        'GD': 'GRD',
+        'GE': 'GEO',
+        'GF': 'GUF',
+        'GG': 'GGY',
+        'GH': 'GHA',
+        'GI': 'GIB',
+        'GL': 'GRL',
+        'GM': 'GMB',
+        'GN': 'GIN',
+        'GP': 'GLP',
+        'GQ': 'GNQ',
+        'GR': 'GRC',
+        'GS': 'SGS',
+        'GT': 'GTM',
+        'GU': 'GUM',
+        'GW': 'GNB',
+        'GY': 'GUY',
+        
+        # H
+        'HK': 'HKG',
+        'HM': 'HMD',
+        'HN': 'HND',
+        'HR': 'HRV',
+        'HT': 'HTI',
+        'HU': 'HUN',
+        
+        # I
+        'ID': 'IDN',
+        'IE': 'IRL',
+        'IL': 'ISR',
+        'IM': 'IMN',
+        'IN': 'IND',
+        'IO': 'IOT',
+        'IQ': 'IRQ',
+        'IR': 'IRN',
+        'IS': 'ISL',
+        'IT': 'ITA',
+        
+        # J
+        'JE': 'JEY',
+        'JM': 'JAM',
+        'JO': 'JOR',
+        'JP': 'JPN',
+        
+        # K
+        'KE': 'KEN',
+        'KG': 'KGZ',
+        'KH': 'KHM',
+        'KI': 'KIR',
+        'KM': 'COM',
+        'KN': 'KNA',
+        'KP': 'PRK',
+        'KR': 'KOR',
+        'KW': 'KWT',
+        'KY': 'CYM',
+        'KZ': 'KAZ',
+        
+        # L
+        'LA': 'LAO',
+        'LB': 'LBN',
+        'LC': 'LCA',
+        'LI': 'LIE',
+        'LK': 'LKA',
+        'LR': 'LBR',
+        'LS': 'LSO',
+        'LT': 'LTU',
+        'LU': 'LUX',
+        'LV': 'LVA',
+        'LY': 'LBY',
+        
+        # M
+        'MA': 'MAR',
+        'MC': 'MCO',
+        'MD': 'MDA',
+        'ME': 'MNE',
+        'MF': 'MAF',
+        'MG': 'MDG',
+        'MH': 'MHL',
+        'MK': 'MKD',
+        'ML': 'MLI',
+        'MM': 'MMR',
+        'MN': 'MNG',
+        'MO': 'MAC',
+        'MP': 'MNP',
+        'MQ': 'MTQ',
+        'MR': 'MRT',
+        'MS': 'MSR',
+        'MT': 'MLT',
+        'MU': 'MUS',
+        'MV': 'MDV',
+        'MW': 'MWI',
+        'MX': 'MEX',
+        'MY': 'MYS',
+        'MZ': 'MOZ',
+        
+        # N
+        'NA': 'NAM',
+        'NC': 'NCL',
+        'NE': 'NER',
+        'NF': 'NFK',
+        'NG': 'NGA',
+        'NI': 'NIC',
+        'NL': 'NLD',
+        'NO': 'NOR',
+        'NP': 'NPL',
+        'NR': 'NRU',
+        'NU': 'NIU',
+        'NZ': 'NZL',
+        
+        # O
+        'OM': 'OMN',
+        
+        # P
+        'PA': 'PAN',
+        'PE': 'PER',
+        'PF': 'PYF',
+        'PG': 'PNG',
+        'PH': 'PHL',
+        'PK': 'PAK',
+        'PL': 'POL',
+        'PM': 'SPM',
+        'PN': 'PCN',
+        'PR': 'PRI',
+        'PS': 'PSE',
+        'PT': 'PRT',
+        'PW': 'PLW',
+        'PY': 'PRY',
+        
+        # Q
+        'QA': 'QAT',
+        
+        # R
+        'RE': 'REU',
+        'RO': 'ROU',
+        'RS': 'SRB',
+        'RU': 'RUS',
+        'RW': 'RWA',
+        
+        # S
+        'SA': 'SAU',
+        'SB': 'SLB',
+        'SC': 'SYC',
+        'SD': 'SDN',
+        'SE': 'SWE',
+        'SG': 'SGP',
+        'SH': 'SHN',
+        'SI': 'SVN',
+        'SJ': 'SJM',
+        'SK': 'SVK',
+        'SL': 'SLE',
+        'SM': 'SMR',
+        'SN': 'SEN',
+        'SO': 'SOM',
+        'SR': 'SUR',
+        'SS': 'SSD',
+        'ST': 'STP',
+        'SV': 'SLV',
+        'SX': 'SXM',
+        'SY': 'SYR',
+        'SZ': 'SWZ',
+        
+        # T
+        'TC': 'TCA',
+        'TD': 'TCD',
+        'TF': 'ATF',
+        'TG': 'TGO',
+        'TH': 'THA',
+        'TJ': 'TJK',
+        'TK': 'TKL',
+        'TL': 'TLS',
+        'TM': 'TKM',
+        'TN': 'TUN',
+        'TO': 'TON',
+        'TR': 'TUR',
+        'TT': 'TTO',
+        'TV': 'TUV',
+        'TW': 'TWN',
+        'TZ': 'TZA',
+        
+        # U
+        'UA': 'UKR',
+        'UG': 'UGA',
+        'UM': 'UMI',
+        'US': 'USA',
+        'UY': 'URY',
+        'UZ': 'UZB',
+        
+        # V
+        'VA': 'VAT',
+        'VC': 'VCT',
+        'VE': 'VEN',
+        'VG': 'VGB',
+        'VI': 'VIR',
+        'VN': 'VNM',
+        'VU': 'VUT',
+        
+        # W
+        'WF': 'WLF',
+        'WS': 'WSM',
+        
+        # Y
+        'YE': 'YEM',
+        'YT': 'MYT',
+        
+        # Z
+        'ZA': 'ZAF',
+        'ZM': 'ZMB',
+        'ZW': 'ZWE',
+    }
+    
+    # ISO 3166-1 alpha-2 -> numeric (zero-padded, as published)
+    ISO_TO_NUMERIC = {
+        # A
+        'AD': '020',
+        'AE': '784',
+        'AF': '004',
+        'AG': '028',
+        'AI': '660',
+        'AL': '008',
+        'AM': '051',
+        'AO': '024',
+        'AQ': '010',
+        'AR': '032',
+        'AS': '016',
+        'AT': '040',
+        'AU': '036',
+        'AW': '533',
+        'AX': '248',
+        'AZ': '031',
+        
+        # B
+        'BA': '070',
+        'BB': '052',
+        'BD': '050',
+        'BE': '056',
+        'BF': '854',
+        'BG': '100',
+        'BH': '048',
+        'BI': '108',
+        'BJ': '204',
+        'BL': '652',
+        'BM': '060',
+        'BN': '096',
+        'BO': '068',
+        'BQ': '535',
+        'BR': '076',
+        'BS': '044',
+        'BT': '064',
+        'BV': '074',
+        'BW': '072',
+        'BY': '112',
+        'BZ': '084',
+        
+        # C
+        'CA': '124',
+        'CC': '166',
+        'CD': '180',
+        'CF': '140',
+        'CG': '178',
+        'CH': '756',
+        'CI': '384',
+        'CK': '184',
+        'CL': '152',
+        'CM': '120',
+        'CN': '156',
+        'CO': '170',
+        'CR': '188',
+        'CU': '192',
+        'CV': '132',
+        'CW': '531',
+        'CX': '162',
+        'CY': '196',
+        'CZ': '203',
+        
+        # D
+        'DE': '276',
+        'DJ': '262',
+        'DK': '208',
+        'DM': '212',
+        'DO': '214',
+        'DZ': '012',
+        
+        # E
+        'EC': '218',
+        'EE': '233',
+        'EG': '818',
+        'EH': '732',
+        'ER': '232',
+        'ES': '724',
+        'ET': '231',
+        
+        # F
+        'FI': '246',
+        'FJ': '242',
+        'FK': '238',
+        'FM': '583',
+        'FO': '234',
+        'FR': '250',
+        
+        # G
+        'GA': '266',
+        'GB': '826',
+        'GD': '308',
+        'GE': '268',
+        'GF': '254',
+        'GG': '831',
+        'GH': '288',
+        'GI': '292',
+        'GL': '304',
+        'GM': '270',
+        'GN': '324',
+        'GP': '312',
+        'GQ': '226',
+        'GR': '300',
+        'GS': '239',
+        'GT': '320',
+        'GU': '316',
+        'GW': '624',
+        'GY': '328',
+        
+        # H
+        'HK': '344',
+        'HM': '334',
+        'HN': '340',
+        'HR': '191',
+        'HT': '332',
+        'HU': '348',
+        
+        # I
+        'ID': '360',
+        'IE': '372',
+        'IL': '376',
+        'IM': '833',
+        'IN': '356',
+        'IO': '086',
+        'IQ': '368',
+        'IR': '364',
+        'IS': '352',
+        'IT': '380',
+        
+        # J
+        'JE': '832',
+        'JM': '388',
+        'JO': '400',
+        'JP': '392',
+        
+        # K
+        'KE': '404',
+        'KG': '417',
+        'KH': '116',
+        'KI': '296',
+        'KM': '174',
+        'KN': '659',
+        'KP': '408',
+        'KR': '410',
+        'KW': '414',
+        'KY': '136',
+        'KZ': '398',
+        
+        # L
+        'LA': '418',
+        'LB': '422',
+        'LC': '662',
+        'LI': '438',
+        'LK': '144',
+        'LR': '430',
+        'LS': '426',
+        'LT': '440',
+        'LU': '442',
+        'LV': '428',
+        'LY': '434',
+        
+        # M
+        'MA': '504',
+        'MC': '492',
+        'MD': '498',
+        'ME': '499',
+        'MF': '663',
+        'MG': '450',
+        'MH': '584',
+        'MK': '807',
+        'ML': '466',
+        'MM': '104',
+        'MN': '496',
+        'MO': '446',
+        'MP': '580',
+        'MQ': '474',
+        'MR': '478',
+        'MS': '500',
+        'MT': '470',
+        'MU': '480',
+        'MV': '462',
+        'MW': '454',
+        'MX': '484',
+        'MY': '458',
+        'MZ': '508',
+        
+        # N
+        'NA': '516',
+        'NC': '540',
+        'NE': '562',
+        'NF': '574',
+        'NG': '566',
+        'NI': '558',
+        'NL': '528',
+        'NO': '578',
+        'NP': '524',
+        'NR': '520',
+        'NU': '570',
+        'NZ': '554',
+        
+        # O
+        'OM': '512',
+        
+        # P
+        'PA': '591',
+        'PE': '604',
+        'PF': '258',
+        'PG': '598',
+        'PH': '608',
+        'PK': '586',
+        'PL': '616',
+        'PM': '666',
+        'PN': '612',
+        'PR': '630',
+        'PS': '275',
+        'PT': '620',
+        'PW': '585',
+        'PY': '600',
+        
+        # Q
+        'QA': '634',
+        
+        # R
+        'RE': '638',
+        'RO': '642',
+        'RS': '688',
+        'RU': '643',
+        'RW': '646',
+        
+        # S
+        'SA': '682',
+        'SB': '090',
+        'SC': '690',
+        'SD': '729',
+        'SE': '752',
+        'SG': '702',
+        'SH': '654',
+        'SI': '705',
+        'SJ': '744',
+        'SK': '703',
+        'SL': '694',
+        'SM': '674',
+        'SN': '686',
+        'SO': '706',
+        'SR': '740',
+        'SS': '728',
+        'ST': '678',
+        'SV': '222',
+        'SX': '534',
+        'SY': '760',
+        'SZ': '748',
+        
+        # T
+        'TC': '796',
+        'TD': '148',
+        'TF': '260',
+        'TG': '768',
+        'TH': '764',
+        'TJ': '762',
+        'TK': '772',
+        'TL': '626',
+        'TM': '795',
+        'TN': '788',
+        'TO': '776',
+        'TR': '792',
+        'TT': '780',
+        'TV': '798',
+        'TW': '158',
+        'TZ': '834',
+        
+        # U
+        'UA': '804',
+        'UG': '800',
+        'UM': '581',
+        'US': '840',
+        'UY': '858',
+        'UZ': '860',
+        
+        # V
+        'VA': '336',
+        'VC': '670',
+        'VE': '862',
+        'VG': '092',
+        'VI': '850',
+        'VN': '704',
+        'VU': '548',
+        
+        # W
+        'WF': '876',
+        'WS': '882',
+        
+        # Y
+        'YE': '887',
+        'YT': '175',
+        
+        # Z
+        'ZA': '710',
+        'ZM': '894',
+        'ZW': '716',
+    }
+    
+    # Reverse mapping: alpha-3 -> ISO 3166-1 alpha-2
+    ALPHA3_TO_ISO = {v: k for k, v in ISO_TO_ALPHA3.items()}
+    
+    # Preferred display name per ISO 3166-1 alpha-2 code
+    ISO_TO_NAME = {
+        # A
+        'AD': 'Andorra',
+        'AE': 'United Arab Emirates',
+        'AF': 'Afghanistan',
+        'AG': 'Antigua and Barbuda',
+        'AI': 'Anguilla',
+        'AL': 'Albania',
+        'AM': 'Armenia',
+        'AO': 'Angola',
+        'AQ': 'Antarctica',
+        'AR': 'Argentina',
+        'AS': 'American Samoa',
+        'AT': 'Austria',
+        'AU': 'Australia',
+        'AW': 'Aruba',
+        'AX': 'Åland Islands',
+        'AZ': 'Azerbaijan',
+        
+        # B
+        'BA': 'Bosnia and Herzegovina',
+        'BB': 'Barbados',
+        'BD': 'Bangladesh',
+        'BE': 'Belgium',
+        'BF': 'Burkina Faso',
+        'BG': 'Bulgaria',
+        'BH': 'Bahrain',
+        'BI': 'Burundi',
+        'BJ': 'Benin',
+        'BL': 'Saint Barthélemy',
+        'BM': 'Bermuda',
+        'BN': 'Brunei',
+        'BO': 'Bolivia',
+        'BQ': 'Bonaire, Sint Eustatius and Saba',
+        'BR': 'Brazil',
+        'BS': 'Bahamas',
+        'BT': 'Bhutan',
+        'BV': 'Bouvet Island',
+        'BW': 'Botswana',
+        'BY': 'Belarus',
+        'BZ': 'Belize',
+        
+        # C
+        'CA': 'Canada',
+        'CC': 'Cocos (Keeling) Islands',
+        'CD': 'Democratic Republic of the Congo',
+        'CF': 'Central African Republic',
+        'CG': 'Congo',
+        'CH': 'Switzerland',
+        'CI': "Côte d'Ivoire",
+        'CK': 'Cook Islands',
+        'CL': 'Chile',
+        'CM': 'Cameroon',
+        'CN': 'China',
+        'CO': 'Colombia',
+        'CR': 'Costa Rica',
+        'CU': 'Cuba',
+        'CV': 'Cape Verde',
+        'CW': 'Curaçao',
+        'CX': 'Christmas Island',
+        'CY': 'Cyprus',
+        'CZ': 'Czech Republic',
+        
+        # D
+        'DE': 'Germany',
+        'DJ': 'Djibouti',
+        'DK': 'Denmark',
+        'DM': 'Dominica',
+        'DO': 'Dominican Republic',
+        'DZ': 'Algeria',
+        
+        # E
+        'EC': 'Ecuador',
+        'EE': 'Estonia',
+        'EG': 'Egypt',
+        'EH': 'Western Sahara',
+        'ER': 'Eritrea',
+        'ES': 'Spain',
+        'ET': 'Ethiopia',
+        'EU': 'European Union',
+        
+        # F
+        'FI': 'Finland',
+        'FJ': 'Fiji',
+        'FK': 'Falkland Islands',
+        'FM': 'Micronesia',
+        'FO': 'Faroe Islands',
+        'FR': 'France',
+        
+        # G
+        'GA': 'Gabon',
+        'GB': 'United Kingdom',
+        'GD': 'Grenada',
+        'GE': 'Georgia',
+        'GF': 'French Guiana',
+        'GG': 'Guernsey',
+        'GH': 'Ghana',
+        'GI': 'Gibraltar',
+        'GL': 'Greenland',
+        'GM': 'Gambia',
+        'GN': 'Guinea',
+        'GP': 'Guadeloupe',
+        'GQ': 'Equatorial Guinea',
+        'GR': 'Greece',
+        'GS': 'South Georgia and the South Sandwich Islands',
+        'GT': 'Guatemala',
+        'GU': 'Guam',
+        'GW': 'Guinea-Bissau',
+        'GY': 'Guyana',
+        
+        # H
+        'HK': 'Hong Kong',
+        'HM': 'Heard Island and McDonald Islands',
+        'HN': 'Honduras',
+        'HR': 'Croatia',
+        'HT': 'Haiti',
+        'HU': 'Hungary',
+        
+        # I
+        'ID': 'Indonesia',
+        'IE': 'Ireland',
+        'IL': 'Israel',
+        'IM': 'Isle of Man',
+        'IN': 'India',
+        'IO': 'British Indian Ocean Territory',
+        'IQ': 'Iraq',
+        'IR': 'Iran',
+        'IS': 'Iceland',
+        'IT': 'Italy',
+        
+        # J
+        'JE': 'Jersey',
+        'JM': 'Jamaica',
+        'JO': 'Jordan',
+        'JP': 'Japan',
+        
+        # K
+        'KE': 'Kenya',
+        'KG': 'Kyrgyzstan',
+        'KH': 'Cambodia',
+        'KI': 'Kiribati',
+        'KM': 'Comoros',
+        'KN': 'Saint Kitts and Nevis',
+        'KP': 'North Korea',
+        'KR': 'South Korea',
+        'KW': 'Kuwait',
+        'KY': 'Cayman Islands',
+        'KZ': 'Kazakhstan',
+        
+        # L
+        'LA': 'Laos',
+        'LB': 'Lebanon',
+        'LC': 'Saint Lucia',
+        'LI': 'Liechtenstein',
+        'LK': 'Sri Lanka',
+        'LR': 'Liberia',
+        'LS': 'Lesotho',
+        'LT': 'Lithuania',
+        'LU': 'Luxembourg',
+        'LV': 'Latvia',
+        'LY': 'Libya',
+        
+        # M
+        'MA': 'Morocco',
+        'MC': 'Monaco',
+        'MD': 'Moldova',
+        'ME': 'Montenegro',
+        'MF': 'Saint Martin',
+        'MG': 'Madagascar',
+        'MH': 'Marshall Islands',
+        'MK': 'North Macedonia',
+        'ML': 'Mali',
+        'MM': 'Myanmar',
+        'MN': 'Mongolia',
+        'MO': 'Macao',
+        'MP': 'Northern Mariana Islands',
+        'MQ': 'Martinique',
+        'MR': 'Mauritania',
+        'MS': 'Montserrat',
+        'MT': 'Malta',
+        'MU': 'Mauritius',
+        'MV': 'Maldives',
+        'MW': 'Malawi',
+        'MX': 'Mexico',
+        'MY': 'Malaysia',
+        'MZ': 'Mozambique',
+        
+        # N
+        'NA': 'Namibia',
+        'NC': 'New Caledonia',
+        'NE': 'Niger',
+        'NF': 'Norfolk Island',
+        'NG': 'Nigeria',
+        'NI': 'Nicaragua',
+        'NL': 'Netherlands',
+        'NO': 'Norway',
+        'NP': 'Nepal',
+        'NR': 'Nauru',
+        'NU': 'Niue',
+        'NZ': 'New Zealand',
+        
+        # O
+        'OM': 'Oman',
+        
+        # P
+        'PA': 'Panama',
+        'PE': 'Peru',
+        'PF': 'French Polynesia',
+        'PG': 'Papua New Guinea',
+        'PH': 'Philippines',
+        'PK': 'Pakistan',
+        'PL': 'Poland',
+        'PM': 'Saint Pierre and Miquelon',
+        'PN': 'Pitcairn',
+        'PR': 'Puerto Rico',
+        'PS': 'Palestine',
+        'PT': 'Portugal',
+        'PW': 'Palau',
+        'PY': 'Paraguay',
+        
+        # Q
+        'QA': 'Qatar',
+        
+        # R
+        'RE': 'Réunion',
+        'RO': 'Romania',
+        'RS': 'Serbia',
+        'RU': 'Russia',
+        'RW': 'Rwanda',
+        
+        # S
+        'SA': 'Saudi Arabia',
+        'SB': 'Solomon Islands',
+        'SC': 'Seychelles',
+        'SD': 'Sudan',
+        'SE': 'Sweden',
+        'SG': 'Singapore',
+        'SH': 'Saint Helena',
+        'SI': 'Slovenia',
+        'SJ': 'Svalbard and Jan Mayen',
+        'SK': 'Slovakia',
+        'SL': 'Sierra Leone',
+        'SM': 'San Marino',
+        'SN': 'Senegal',
+        'SO': 'Somalia',
+        'SR': 'Suriname',
+        'SS': 'South Sudan',
+        'ST': 'São Tomé and Príncipe',
+        'SV': 'El Salvador',
+        'SX': 'Sint Maarten',
+        'SY': 'Syria',
+        'SZ': 'Eswatini',
+        
+        # T
+        'TC': 'Turks and Caicos Islands',
+        'TD': 'Chad',
+        'TF': 'French Southern Territories',
+        'TG': 'Togo',
+        'TH': 'Thailand',
+        'TJ': 'Tajikistan',
+        'TK': 'Tokelau',
+        'TL': 'Timor-Leste',
+        'TM': 'Turkmenistan',
+        'TN': 'Tunisia',
+        'TO': 'Tonga',
+        'TR': 'Turkey',
+        'TT': 'Trinidad and Tobago',
+        'TV': 'Tuvalu',
+        'TW': 'Taiwan',
+        'TZ': 'Tanzania',
+        
+        # U
+        'UA': 'Ukraine',
+        'UG': 'Uganda',
+        'UM': 'United States Minor Outlying Islands',
+        'US': 'United States',
+        'UY': 'Uruguay',
+        'UZ': 'Uzbekistan',
+        
+        # V
+        'VA': 'Vatican City',
+        'VC': 'Saint Vincent and the Grenadines',
+        'VE': 'Venezuela',
+        'VG': 'British Virgin Islands',
+        'VI': 'US Virgin Islands',
+        'VN': 'Vietnam',
+        'VU': 'Vanuatu',
+        
+        # W
+        'WF': 'Wallis and Futuna',
+        'WS': 'Samoa',
+        
+        # Y
+        'YE': 'Yemen',
+        'YT': 'Mayotte',
+        
+        # Z
+        'ZA': 'South Africa',
+        'ZM': 'Zambia',
+        'ZW': 'Zimbabwe',
+    }
+    
     # Common country name mappings to ISO codes
     NAME_TO_ISO = {
         # Common names and variations
@@ -520,11 +1435,76 @@ class CountryCodeMapper:
         """
         return cls.GEC_TO_ISO.get(gec_code.lower())
     
+    @classmethod
+    def iso_to_alpha3(cls, iso_code: str) -> Optional[str]:
+        """
+        Convert ISO 3166-1 alpha-2 code to alpha-3 code.
+        
+        Args:
+            iso_code: ISO 3166-1 alpha-2 code (e.g., 'DE')
+            
+        Returns:
+            ISO 3166-1 alpha-3 code (e.g., 'DEU') or None if not found
+        """
+        return cls.ISO_TO_ALPHA3.get(iso_code.upper())
+    
+    @classmethod
+    def alpha3_to_iso(cls, alpha3_code: str) -> Optional[str]:
+        """
+        Convert ISO 3166-1 alpha-3 code to alpha-2 code.
+        
+        Args:
+            alpha3_code: ISO 3166-1 alpha-3 code (e.g., 'DEU')
+            
+        Returns:
+            ISO 3166-1 alpha-2 code (e.g., 'DE') or None if not found
+        """
+        return cls.ALPHA3_TO_ISO.get(alpha3_code.upper())
+    
+    @classmethod
+    def iso_to_numeric(cls, iso_code: str) -> Optional[str]:
+        """
+        Convert ISO 3166-1 alpha-2 code to numeric code.
+        
+        Args:
+            iso_code: ISO 3166-1 alpha-2 code (e.g., 'AT')
+            
+        Returns:
+            Zero-padded ISO 3166-1 numeric code (e.g., '040') or None if not found
+        """
+        return cls.ISO_TO_NUMERIC.get(iso_code.upper())
+    
+    @classmethod
+    def numeric_to_iso(cls, numeric_code: Union[str, int]) -> Optional[str]:
+        """
+        Convert ISO 3166-1 numeric code to alpha-2 code.
+        
+        Uses a dense table indexed by the code's integer value.
+        
+        Args:
+            numeric_code: ISO 3166-1 numeric code (e.g., '040', '40' or 40)
+            
+        Returns:
+            ISO 3166-1 alpha-2 code (e.g., 'AT') or None if not found
+        """
+        try:
+            number = int(numeric_code)
+        except (TypeError, ValueError):
+            return None
+        if 0 <= number < len(cls._NUMERIC_TO_ISO):
+            return cls._NUMERIC_TO_ISO[number]
+        return None
+    
     @classmethod
     def name_to_iso(cls, country_name: str) -> Optional[str]:
         """
         Convert country name to ISO 3166-1 alpha-2 code.
         
+        Names are compared after fold_name, so case, accents, punctuation,
+        '&' versus 'and', a leading 'the' and 'Korea, South' style inversions
+        do not matter. Display names (ISO_TO_NAME) are accepted as well as
+        the aliases in NAME_TO_ISO.
+        
         Args:
             country_name: Country name (e.g., 'United States', 'Germany')
             
@@ -532,7 +1512,10 @@ class CountryCodeMapper:
             ISO 3166-1 alpha-2 code or None if not found
         """
         clean_name = country_name.lower().strip()
-        return cls.NAME_TO_ISO.get(clean_name)
+        iso_code = cls.NAME_TO_ISO.get(clean_name)
+        if iso_code is None:
+            iso_code = cls._FOLDED_NAMES.get(cls.fold_name(country_name))
+        return iso_code
     
     @classmethod
     def name_to_gec(cls, country_name: str) -> Optional[str]:
@@ -551,29 +1534,183 @@ class CountryCodeMapper:
         return None
     
     @classmethod
-    def resolve_country_code(cls, identifier: str) -> Optional[str]:
+    def resolve_country_code(cls, identifier: str, fuzzy: bool = False) -> Optional[str]:
         """
         Resolve any country identifier to GEC code.
         
         Args:
             identifier: Country code (ISO or GEC) or country name
+            fuzzy: Fall back to the closest name within a small edit distance
+                (e.g. 'Phillipines', "Côte d'Ivoire", 'Korea, South')
             
         Returns:
             GEC code or None if not found
         """
-        identifier = identifier.strip()
+        if fuzzy:
+            match = cls.fuzzy_match(identifier)
+            return match['gec_code'] if match else None
         
-        # If it's already a 2-letter lowercase code, assume it's GEC
-        if len(identifier) == 2 and identifier.islower():
-            return identifier if identifier in cls.GEC_TO_ISO else None
+        identifier = identifier.strip()
+        kind = cls.identifier_kind(identifier)
         
-        # If it's a 2-letter uppercase code, assume it's ISO
-        if len(identifier) == 2 and identifier.isupper():
+        if kind == 'gec':
+            return identifier if identifier in cls.GEC_TO_ISO else cls.iso_to_gec(identifier)
+        if kind == 'iso2':
             return cls.iso_to_gec(identifier)
+        if kind == 'alpha3':
+            return cls.iso_to_gec(cls.ALPHA3_TO_ISO[identifier.upper()])
+        if kind == 'numeric':
+            iso_code = cls.numeric_to_iso(identifier)
+            return cls.iso_to_gec(iso_code) if iso_code else None
+        
+        # Mixed-case two-letter codes ('Ks'): a GEC code if there is one, else ISO
+        if len(identifier) == 2 and identifier.isascii() and identifier.isalpha():
+            return cls.resolve_country_code(identifier.lower())
         
         # Try as country name
         return cls.name_to_gec(identifier)
     
+    @classmethod
+    def identifier_kind(cls, identifier: str) -> str:
+        """
+        Classify an identifier by its shape.
+        
+        - 'gec': two lowercase letters ('gm'; read as ISO if no such GEC code)
+        - 'iso2': two uppercase letters ('DE')
+        - 'alpha3': a known ISO alpha-3 code in either case ('DEU', 'deu'),
+          unless it is also a country name ('usa', 'uae')
+        - 'numeric': one to three digits ('276', '040', '40')
+        - 'name': anything else
+        
+        Args:
+            identifier: Country identifier
+            
+        Returns:
+            Identifier kind
+        """
+        identifier = identifier.strip()
+        if not identifier.isascii():
+            return 'name'
+        if identifier.isdigit() and len(identifier) <= 3:
+            return 'numeric'
+        if identifier.isalpha():
+            if len(identifier) == 2 and identifier.islower():
+                return 'gec'
+            if len(identifier) == 2 and identifier.isupper():
+                return 'iso2'
+            if (len(identifier) == 3 and identifier.upper() in cls.ALPHA3_TO_ISO
+                    and cls.name_to_iso(identifier) is None):
+                return 'alpha3'
+        return 'name'
+    
+    @staticmethod
+    def fold_name(name: str) -> str:
+        """
+        Fold a country name into the form used by NAME_TO_ISO keys.
+        
+        Strips accents and punctuation, lowercases, spells '&' as 'and',
+        spells 'St' as 'saint', turns inverted names like 'Korea, South' into
+        'south korea' and drops a leading 'the' ('Bahamas, The' and
+        'The Bahamas' both fold to 'bahamas').
+        
+        Args:
+            name: Country name
+            
+        Returns:
+            Folded name
+        """
+        text = unicodedata.normalize('NFKD', name)
+        text = ''.join(char for char in text if not unicodedata.combining(char)).lower()
+        text = re.sub(r"[\u2019'`.]", '', text).replace('&', ' and ')
+        if text.count(',') == 1:
+            head, tail = text.split(',')
+            text = f"{tail} {head}"
+        words = re.sub(r'[^a-z0-9]+', ' ', text).split()
+        if len(words) > 1 and words[0] == 'the':
+            words = words[1:]
+        return ' '.join('saint' if word == 'st' else word for word in words)
+    
+    @classmethod
+    def fuzzy_match(cls, identifier: str, max_distance: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """
+        Resolve an identifier, tolerating accents, punctuation and typos.
+        
+        Exact codes and names score 1.0. Otherwise the folded identifier is
+        looked up in the BK-tree of folded names, allowing one edit per four
+        characters (at most 3) unless max_distance is given.
+        
+        Args:
+            identifier: Country code or name
+            max_distance: Maximum edit distance to accept
+            
+        Returns:
+            Dictionary with gec_code, iso_code, name, matched, distance and
+            score (0-1), or None if nothing is close enough
+        """
+        gec_code = cls.resolve_country_code(identifier)
+        if gec_code:
+            iso_code = cls.gec_to_iso(gec_code)
+            return cls._fuzzy_result(iso_code, gec_code, identifier.strip().lower(), 0, 1.0)
+        
+        folded = cls.fold_name(identifier)
+        if not folded:
+            return None
+        if max_distance is None:
+            max_distance = min(len(folded) // 4, 3)
+        
+        matches = cls._rank_fuzzy(folded, max_distance)
+        return matches[0] if matches else None
+    
+    @classmethod
+    def suggest(cls, identifier: str, limit: int = 3) -> List[Dict[str, Any]]:
+        """
+        Get "did you mean" suggestions for an identifier that did not resolve.
+        
+        Uses a looser edit distance than fuzzy_match (one edit per three
+        characters, at least 2) so near misses are still offered. Candidates
+        that share nothing with the identifier (as many edits as it has
+        characters, e.g. 'zz' -> 'uk') are not suggested.
+        
+        Args:
+            identifier: Country code or name
+            limit: Maximum number of suggestions (default: 3)
+            
+        Returns:
+            List of fuzzy_match-style dictionaries, best first
+        """
+        folded = cls.fold_name(identifier)
+        if not folded:
+            return []
+        candidates = cls._rank_fuzzy(folded, max(len(folded) // 3, 2))
+        return [candidate for candidate in candidates
+                if candidate['score'] > 0 and candidate['distance'] < len(folded)][:limit]
+    
+    @classmethod
+    def _rank_fuzzy(cls, folded: str, max_distance: int) -> List[Dict[str, Any]]:
+        results = []
+        seen = set()
+        for distance, matched in cls._FUZZY_INDEX.search(folded, max_distance):
+            iso_code = cls._FOLDED_NAMES[matched]
+            gec_code = cls.iso_to_gec(iso_code)
+            if iso_code in seen or not gec_code:
+                continue
+            seen.add(iso_code)
+            score = round(1 - distance / max(len(folded), len(matched)), 3)
+            results.append(cls._fuzzy_result(iso_code, gec_code, matched, distance, score))
+        return results
+    
+    @classmethod
+    def _fuzzy_result(cls, iso_code: str, gec_code: str, matched: str,
+                      distance: int, score: float) -> Dict[str, Any]:
+        return {
+            'gec_code': gec_code,
+            'iso_code': iso_code,
+            'name': cls.ISO_TO_NAME.get(iso_code),
+            'matched': matched,
+            'distance': distance,
+            'score': score
+        }
+    
     @classmethod
     def get_country_info(cls, identifier: str) -> Optional[Dict[str, str]]:
         """
@@ -583,24 +1720,20 @@ class CountryCodeMapper:
             identifier: Country code or name
             
         Returns:
-            Dictionary with ISO, GEC, and name information
+            Dictionary with GEC, ISO alpha-2, alpha-3, numeric and name information
         """
         gec_code = cls.resolve_country_code(identifier)
         if not gec_code:
             return None
         
         iso_code = cls.gec_to_iso(gec_code)
-        
-        # Find country name from reverse lookup
-        country_name = None
-        for name, iso in cls.NAME_TO_ISO.items():
-            if iso == iso_code:
-                country_name = name.title()
-                break
+        country_name = cls.ISO_TO_NAME.get(iso_code)
         
         return {
             'gec_code': gec_code,
             'iso_code': iso_code,
+            'alpha3_code': cls.ISO_TO_ALPHA3.get(iso_code),
+            'numeric_code': cls.ISO_TO_NUMERIC.get(iso_code),
             'name': country_name
         }
     
@@ -610,20 +1743,36 @@ class CountryCodeMapper:
         List all countries with their codes.
         
         Returns:
-            List of tuples (ISO code, GEC code, name)
+            List of tuples (ISO code, GEC code, name), sorted by name
         """
-        countries = []
-        for iso_code, gec_code in cls.ISO_TO_GEC.items():
-            # Find a name for this country
-            country_name = None
-            for name, iso in cls.NAME_TO_ISO.items():
-                if iso == iso_code:
-                    country_name = name.title()
-                    break
-            
-            if not country_name:
-                country_name = f"Country {iso_code}"
-            
-            countries.append((iso_code, gec_code, country_name))
-        
-        return sorted(countries, key=lambda x: x[2])  # Sort by name
\ No newline at end of file
+        return list(cls._COUNTRY_LIST)
+
+
+# (ISO, GEC, display name) for every country, sorted by name; built once at import
+CountryCodeMapper._COUNTRY_LIST = tuple(sorted(
+    ((iso_code, gec_code, CountryCodeMapper.ISO_TO_NAME.get(iso_code, f"Country {iso_code}"))
+     for iso_code, gec_code in CountryCodeMapper.ISO_TO_GEC.items()),
+    key=lambda country: country[2]
+))
+
+# Numeric code -> ISO alpha-2, as a dense table indexed by the code's value
+def _dense_numeric_table(iso_to_numeric: Dict[str, str]) -> Tuple[Optional[str], ...]:
+    table: List[Optional[str]] = [None] * 1000
+    for iso_code, numeric_code in iso_to_numeric.items():
+        table[int(numeric_code)] = iso_code
+    return tuple(table)
+
+
+CountryCodeMapper._NUMERIC_TO_ISO = _dense_numeric_table(CountryCodeMapper.ISO_TO_NUMERIC)
+
+# Folded display name or alias -> ISO code, and a BK-tree over the folded names
+# for typo-tolerant lookups; built once at import
+# (display names come last so they win if an alias folds to the same key)
+CountryCodeMapper._FOLDED_NAMES = {
+    CountryCodeMapper.fold_name(name): iso_code
+    for name, iso_code in chain(
+        CountryCodeMapper.NAME_TO_ISO.items(),
+        ((name, iso_code) for iso_code, name in CountryCodeMapper.ISO_TO_NAME.items())
+    )
+}
+CountryCodeMapper._FUZZY_INDEX = BKTree(CountryCodeMapper._FOLDED_NAMES)
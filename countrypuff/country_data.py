@@ -2,8 +2,15 @@
 Country data model and utilities for working with CIA World Factbook data.
 """
 
-from typing import Dict, List, Optional, Any, Union
+import re
+import sys
+from typing import Dict, List, Optional, Any, Tuple, Union
 from .data_fetcher import DataFetcher, CountryNotFoundError
+from .fields import FIELDS, FIELD_INDEX, FieldSpec, is_placeholder
+from .numeric import NumericValue, parse_numeric
+
+# Marks a field slot that has not been resolved yet (None is a valid value)
+_UNRESOLVED = object()
 
 
 class CountryData:
@@ -14,268 +21,73 @@ class CountryData:
     country information including demographics, geography, economy, government, etc.
     """
     
-    def __init__(self, data: Optional[Dict] = None, country_code: Optional[str] = None):
+    # Year suffix of time-keyed entries ('Real GDP per capita 2024')
+    YEAR_KEY_PATTERN = re.compile(r'\s((?:19|20)\d{2})$')
+    
+    # Properties whose text starts with a figure that numeric() can parse
+    NUMERIC_FIELDS = tuple(spec.name for spec in FIELDS if spec.numeric)
+    
+    def __init__(self, data: Optional[Dict] = None, country_code: Optional[str] = None,
+                 fetcher: Optional[DataFetcher] = None):
         """
         Initialize CountryData.
         
         Args:
             data: Raw country data dictionary
             country_code: Country code to fetch data for (if data not provided)
+            fetcher: DataFetcher to use (default: the process-wide shared fetcher)
         """
         self._data = data or {}
-        self._fetcher = DataFetcher()
+        # The shared fetcher is only looked up when data has to be fetched
+        self._fetcher = fetcher
+        # Path tuple -> value, filled in as fields are read
+        self._values: Dict[Tuple[str, ...], Any] = {}
+        # Field path -> {year: value} of its year-keyed entries, built per path on first use
+        self._series: Dict[Tuple[str, ...], Dict[int, Any]] = {}
+        # One slot per FIELDS entry, resolved on first access
+        self._slots: List[Any] = [_UNRESOLVED] * len(FIELDS)
+        # (path, value, lowercased value) for every string field, built on first search
+        self._text_table: Optional[List[Tuple[Tuple[str, ...], str, str]]] = None
+        # Field name -> parsed value, filled in by numeric()
+        self._numeric: Dict[str, Optional[NumericValue]] = {}
         
         if not data and country_code:
+            if self._fetcher is None:
+                self._fetcher = DataFetcher.shared()
             self._data = self._fetcher.get_country_data(country_code)
     
     @classmethod
-    def from_code(cls, country_code: str) -> 'CountryData':
+    def from_code(cls, country_code: str, fetcher: Optional[DataFetcher] = None) -> 'CountryData':
         """
         Create CountryData instance from country code.
         
         Args:
             country_code: Two-letter country code (e.g., 'us', 'gm')
+            fetcher: DataFetcher to use (default: the process-wide shared fetcher)
             
         Returns:
             CountryData instance
         """
-        return cls(country_code=country_code)
+        return cls(country_code=country_code, fetcher=fetcher)
     
     @classmethod
-    def from_name(cls, country_name: str) -> 'CountryData':
+    def from_name(cls, country_name: str, fetcher: Optional[DataFetcher] = None) -> 'CountryData':
         """
         Create CountryData instance from country name.
         
         Args:
             country_name: Country name (e.g., 'United States', 'Germany')
+            fetcher: DataFetcher to use (default: the process-wide shared fetcher)
             
         Returns:
             CountryData instance
         """
-        fetcher = DataFetcher()
+        fetcher = fetcher if fetcher is not None else DataFetcher.shared()
         data = fetcher.get_country_data(country_name)
-        return cls(data=data)
-    
-    # Basic Information Properties
-    @property
-    def name(self) -> Optional[str]:
-        """Get the country's conventional short form name."""
-        short_name = self._get_nested_value(['Government', 'Country name', 'conventional short form', 'text'])
-        # If short form is "none" or empty, fall back to long form
-        if not short_name or short_name.lower() == 'none':
-            return self._get_nested_value(['Government', 'Country name', 'conventional long form', 'text'])
-        return short_name
-    
-    @property
-    def official_name(self) -> Optional[str]:
-        """Get the country's conventional long form name."""
-        return self._get_nested_value(['Government', 'Country name', 'conventional long form', 'text'])
-    
-    @property
-    def capital(self) -> Optional[str]:
-        """Get the country's capital city."""
-        return self._get_nested_value(['Government', 'Capital', 'name', 'text'])
-    
-    @property
-    def population(self) -> Optional[str]:
-        """Get the country's total population."""
-        return self._get_nested_value(['People and Society', 'Population', 'total', 'text'])
-    
-    @property
-    def area_total(self) -> Optional[str]:
-        """Get the country's total area."""
-        return self._get_nested_value(['Geography', 'Area', 'total ', 'text']) or \
-               self._get_nested_value(['Geography', 'Area', 'total', 'text'])
-    
-    @property
-    def gdp_per_capita(self) -> Optional[str]:
-        """Get the country's GDP per capita."""
-        return self._get_nested_value(['Economy', 'Real GDP per capita', 'Real GDP per capita 2024', 'text']) or \
-               self._get_nested_value(['Economy', 'Real GDP per capita', 'Real GDP per capita 2023', 'text'])
-    
-    # Geography Properties
-    @property
-    def location(self) -> Optional[str]:
-        """Get the country's geographic location description."""
-        return self._get_nested_value(['Geography', 'Location', 'text'])
-    
-    @property
-    def coordinates(self) -> Optional[str]:
-        """Get the country's geographic coordinates."""
-        return self._get_nested_value(['Geography', 'Geographic coordinates', 'text'])
-    
-    @property
-    def climate(self) -> Optional[str]:
-        """Get the country's climate description."""
-        return self._get_nested_value(['Geography', 'Climate', 'text'])
-    
-    @property
-    def natural_resources(self) -> Optional[str]:
-        """Get the country's natural resources."""
-        return self._get_nested_value(['Geography', 'Natural resources', 'text'])
-    
-    # Demographics Properties
-    @property
-    def ethnic_groups(self) -> Optional[str]:
-        """Get the country's ethnic groups breakdown."""
-        return self._get_nested_value(['People and Society', 'Ethnic groups', 'text'])
-    
-    @property
-    def languages(self) -> Optional[str]:
-        """Get the country's languages."""
-        return self._get_nested_value(['People and Society', 'Languages', 'text'])
-    
-    @property
-    def religions(self) -> Optional[str]:
-        """Get the country's religions breakdown."""
-        return self._get_nested_value(['People and Society', 'Religions', 'text'])
-    
-    @property
-    def life_expectancy(self) -> Optional[str]:
-        """Get the country's life expectancy."""
-        return self._get_nested_value(['People and Society', 'Life expectancy at birth', 'total population', 'text'])
-    
-    # Government Properties
-    @property
-    def government_type(self) -> Optional[str]:
-        """Get the country's government type."""
-        return self._get_nested_value(['Government', 'Government type', 'text'])
-    
-    @property
-    def independence_date(self) -> Optional[str]:
-        """Get the country's independence date."""
-        return self._get_nested_value(['Government', 'Independence', 'text'])
-    
-    # Economy Properties
-    @property
-    def economic_overview(self) -> Optional[str]:
-        """Get the country's economic overview."""
-        return self._get_nested_value(['Economy', 'Economic overview', 'text'])
-    
-    @property
-    def currency(self) -> Optional[str]:
-        """Get the country's currency."""
-        return self._get_nested_value(['Economy', 'Exchange rates', 'Currency', 'text'])
-    
-    @property
-    def exports(self) -> Optional[str]:
-        """Get the country's export value."""
-        return self._get_nested_value(['Economy', 'Exports', 'Exports 2024', 'text']) or \
-               self._get_nested_value(['Economy', 'Exports', 'Exports 2023', 'text'])
-    
-    @property
-    def imports(self) -> Optional[str]:
-        """Get the country's import value."""
-        return self._get_nested_value(['Economy', 'Imports', 'Imports 2024', 'text']) or \
-               self._get_nested_value(['Economy', 'Imports', 'Imports 2023', 'text'])
-    
-    # Communications Properties
-    @property
-    def internet_users(self) -> Optional[str]:
-        """Get the country's internet users statistics."""
-        return self._get_nested_value(['Communications', 'Internet users', 'total', 'text'])
-    
-    @property
-    def mobile_phones(self) -> Optional[str]:
-        """Get the country's mobile phone subscriptions."""
-        return self._get_nested_value(['Communications', 'Telephones - mobile cellular', 'total subscriptions', 'text'])
-    
-    @property
-    def broadband_subscriptions(self) -> Optional[str]:
-        """Get the country's broadband subscriptions."""
-        return self._get_nested_value(['Communications', 'Broadband - fixed subscriptions', 'total', 'text'])
-    
-    # Energy Properties
-    @property
-    def electricity_access(self) -> Optional[str]:
-        """Get the country's electricity access percentage."""
-        return self._get_nested_value(['Energy', 'Electricity access', 'electrification - total population', 'text'])
-    
-    @property
-    def energy_consumption_per_capita(self) -> Optional[str]:
-        """Get the country's energy consumption per capita."""
-        return self._get_nested_value(['Energy', 'Energy consumption per capita', 'Energy consumption per capita 2024', 'text']) or \
-               self._get_nested_value(['Energy', 'Energy consumption per capita', 'Energy consumption per capita 2023', 'text'])
-    
-    @property
-    def electricity_generation_sources(self) -> Optional[Dict]:
-        """Get the country's electricity generation sources breakdown."""
-        sources = self._get_nested_value(['Energy', 'Electricity generation sources'])
-        if isinstance(sources, dict):
-            return {k: v.get('text') if isinstance(v, dict) else v for k, v in sources.items()}
-        return None
-    
-    # Transportation Properties
-    @property
-    def airports(self) -> Optional[str]:
-        """Get the country's number of airports."""
-        return self._get_nested_value(['Transportation', 'Airports', 'total', 'text'])
-    
-    @property
-    def railways(self) -> Optional[str]:
-        """Get the country's railway length."""
-        return self._get_nested_value(['Transportation', 'Railways', 'total', 'text'])
-    
-    @property
-    def ports(self) -> Optional[str]:
-        """Get the country's major ports."""
-        return self._get_nested_value(['Transportation', 'Ports', 'text'])
+        return cls(data=data, fetcher=fetcher)
     
-    # Environment Properties
-    @property
-    def environment_issues(self) -> Optional[str]:
-        """Get the country's environmental issues."""
-        return self._get_nested_value(['Environment', 'Environment - current issues', 'text'])
-    
-    @property
-    def air_pollutants(self) -> Optional[Dict]:
-        """Get the country's air pollutant data."""
-        pollutants = self._get_nested_value(['Environment', 'Air pollutants'])
-        if isinstance(pollutants, dict):
-            return {k: v.get('text') if isinstance(v, dict) else v for k, v in pollutants.items()}
-        return None
-    
-    # Military Properties
-    @property
-    def military_expenditure(self) -> Optional[str]:
-        """Get the country's military expenditure."""
-        return self._get_nested_value(['Military and Security', 'Military expenditures', 'Military expenditures 2024', 'text']) or \
-               self._get_nested_value(['Military and Security', 'Military expenditures', 'Military expenditures 2023', 'text'])
-    
-    @property
-    def military_service_age(self) -> Optional[str]:
-        """Get the country's military service age."""
-        return self._get_nested_value(['Military and Security', 'Military service age and obligation', 'text'])
-    
-    # Additional Demographics
-    @property
-    def age_structure(self) -> Optional[Dict]:
-        """Get the country's age structure breakdown."""
-        age_data = self._get_nested_value(['People and Society', 'Age structure'])
-        if isinstance(age_data, dict):
-            return {k: v.get('text') if isinstance(v, dict) else v for k, v in age_data.items()}
-        return None
-    
-    @property
-    def birth_rate(self) -> Optional[str]:
-        """Get the country's birth rate."""
-        return self._get_nested_value(['People and Society', 'Birth rate', 'births/1,000 population', 'text'])
-    
-    @property
-    def death_rate(self) -> Optional[str]:
-        """Get the country's death rate."""
-        return self._get_nested_value(['People and Society', 'Death rate', 'deaths/1,000 population', 'text'])
-    
-    @property
-    def literacy_rate(self) -> Optional[str]:
-        """Get the country's literacy rate."""
-        return self._get_nested_value(['People and Society', 'Literacy', 'total population', 'text'])
-    
-    @property
-    def unemployment_rate(self) -> Optional[str]:
-        """Get the country's unemployment rate."""
-        return self._get_nested_value(['Economy', 'Unemployment rate', 'Unemployment rate 2024', 'text']) or \
-               self._get_nested_value(['Economy', 'Unemployment rate', 'Unemployment rate 2023', 'text'])
+    # Named properties (name, population, gdp_per_capita, ...) are generated
+    # from the FIELDS registry in fields.py, below the class
     
     # Utility Methods
     def get_section(self, section_name: str) -> Optional[Dict]:
@@ -302,38 +114,171 @@ class CountryData:
         """
         return self._get_nested_value(list(path))
     
-    def search_fields(self, query: str) -> List[Dict[str, Any]]:
+    def field(self, name: str) -> Optional[Any]:
+        """
+        Get a named field from the FIELDS registry.
+        
+        Args:
+            name: Field name (e.g., 'population', 'gdp_per_capita')
+            
+        Returns:
+            Field value or None if not found
+            
+        Raises:
+            ValueError: If name is not a registered field
+        """
+        try:
+            index = FIELD_INDEX[name]
+        except KeyError:
+            raise ValueError(f"Unknown field '{name}'") from None
+        return self._slot(index)
+    
+    def extract(self, section: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Get every registered field in one pass over the FIELDS table.
+        
+        Args:
+            section: Only include fields of this section (e.g., 'Economy')
+            
+        Returns:
+            Dictionary of field name -> value, in registry order
+        """
+        return {spec.name: self._slot(index) for index, spec in enumerate(FIELDS)
+                if section is None or spec.section == section}
+    
+    def series(self, *path: str) -> Dict[int, Any]:
+        """
+        Get every year of a time-keyed field.
+        
+        Args:
+            *path: Path to the field (e.g., 'Economy', 'Exports'), whose
+                entries are keyed by year ('Exports 2024', 'Exports 2023', ...)
+            
+        Returns:
+            Dictionary of year -> value in ascending year order (empty if the
+            field has no year-keyed entries)
+        """
+        return dict(self._year_series(path))
+    
+    def latest(self, *path: str) -> Optional[Tuple[int, Any]]:
+        """
+        Get the most recent year of a time-keyed field that has a value.
+        
+        Years holding a placeholder ('NA', 'none' or empty), as the factbook
+        does for a year it has just added, are skipped.
+        
+        Args:
+            *path: Path to the field (e.g., 'Economy', 'Real GDP per capita')
+            
+        Returns:
+            (year, value) tuple or None if no year-keyed entry has a value
+        """
+        series = self._year_series(path)
+        for year in reversed(series):
+            if not is_placeholder(series[year]):
+                return year, series[year]
+        return None
+    
+    def for_year(self, year: int, *path: str) -> Optional[Any]:
+        """
+        Get one year of a time-keyed field.
+        
+        Args:
+            year: Year (e.g., 2023)
+            *path: Path to the field (e.g., 'Economy', 'Unemployment rate')
+            
+        Returns:
+            Value for that year or None if the field has no entry for it
+        """
+        return self._year_series(path).get(year)
+    
+    def numeric(self, field: str) -> Optional[NumericValue]:
+        """
+        Get a numeric property as a typed value.
+        
+        The property text (e.g. '$73.637 trillion (2023 est.)') is parsed once
+        per instance.
+        
+        Args:
+            field: Property name from NUMERIC_FIELDS (e.g., 'population')
+            
+        Returns:
+            NumericValue or None if the field is missing or not numeric
+            
+        Raises:
+            ValueError: If field is not in NUMERIC_FIELDS
+        """
+        try:
+            return self._numeric[field]
+        except KeyError:
+            pass
+        
+        if field not in self.NUMERIC_FIELDS:
+            raise ValueError(f"Unknown numeric field '{field}'. "
+                             f"Available fields: {', '.join(self.NUMERIC_FIELDS)}")
+        
+        value = parse_numeric(self._slot(FIELD_INDEX[field]))
+        self._numeric[field] = value
+        return value
+    
+    def numeric_values(self) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Get every numeric property as a typed value.
+        
+        Returns:
+            Dictionary of field name -> NumericValue.to_dict() (None if not numeric)
+        """
+        values = {}
+        for field in self.NUMERIC_FIELDS:
+            value = self.numeric(field)
+            values[field] = value.to_dict() if value else None
+        return values
+    
+    def search_fields(self, query: str, limit: Optional[int] = None, regex: bool = False,
+                      whole_word: bool = False) -> List[Dict[str, Any]]:
         """
         Search for fields containing a specific query.
         
+        Matching is case-insensitive and runs over a flattened table of the
+        country's string fields, built once per instance.
+        
         Args:
-            query: Search query
+            query: Search query (a regular expression if regex is set)
+            limit: Maximum number of matches to return (default: no limit)
+            regex: Treat the query as a regular expression
+            whole_word: Only match the query where no letter or digit adjoins
+                it, so '$58' matches '$58,900' but 'car' does not match 'cars'
             
         Returns:
             List of matching fields with their paths and values
+            
+        Raises:
+            ValueError: If limit is less than 1, or regex is set and the query
+                is not a valid pattern
         """
-        results = []
+        if limit is not None and limit < 1:
+            raise ValueError(f"limit must be at least 1, got {limit}")
+        
         query_lower = query.lower()
+        pattern = None
+        if regex:
+            try:
+                pattern = re.compile(rf'(?<!\w)(?:{query})(?!\w)' if whole_word else query, re.IGNORECASE)
+            except re.error as e:
+                raise ValueError(f"Invalid regular expression '{query}': {e}") from e
+        elif whole_word:
+            pattern = re.compile(rf'(?<!\w){re.escape(query_lower)}(?!\w)')
         
-        def search_recursive(data: Any, path: List[str] = None) -> None:
-            if path is None:
-                path = []
-            
-            if isinstance(data, dict):
-                for key, value in data.items():
-                    current_path = path + [key]
-                    if isinstance(value, str) and query_lower in value.lower():
-                        results.append({
-                            'path': current_path,
-                            'value': value
-                        })
-                    elif isinstance(value, (dict, list)):
-                        search_recursive(value, current_path)
-            elif isinstance(data, list):
-                for i, item in enumerate(data):
-                    search_recursive(item, path + [str(i)])
-        
-        search_recursive(self._data)
+        results = []
+        for path, value, lowered in self._flattened():
+            matched = pattern.search(lowered) if pattern else query_lower in lowered
+            if matched:
+                results.append({
+                    'path': list(path),
+                    'value': value
+                })
+                if limit is not None and len(results) >= limit:
+                    break
         return results
     
     def to_dict(self) -> Dict:
@@ -352,17 +297,71 @@ class CountryData:
         Returns:
             Dictionary with key country facts
         """
-        return {
-            'name': self.name,
-            'official_name': self.official_name,
-            'capital': self.capital,
-            'population': self.population,
-            'area': self.area_total,
-            'location': self.location,
-            'government_type': self.government_type,
-            'currency': self.currency,
-            'gdp_per_capita': self.gdp_per_capita
-        }
+        return {spec.summary_key: self._slot(index) for index, spec in enumerate(FIELDS)
+                if spec.summary_key}
+    
+    def _slot(self, index: int) -> Optional[Any]:
+        """
+        Get a registered field, resolving it into its slot on first access.
+        
+        Args:
+            index: Position of the field in FIELDS
+            
+        Returns:
+            The first truthy candidate value (after post-processing), else the last one
+        """
+        value = self._slots[index]
+        if value is _UNRESOLVED:
+            spec = FIELDS[index]
+            for path in spec.paths:
+                if spec.yearly:
+                    latest = self.latest(*path)
+                    value = latest[1] if latest else None
+                else:
+                    value = self._data
+                    for key in path:
+                        if isinstance(value, dict) and key in value:
+                            value = value[key]
+                        else:
+                            value = None
+                            break
+                if spec.post is not None:
+                    value = spec.post(value)
+                if value:
+                    break
+            self._slots[index] = value
+        return value
+    
+    def _year_series(self, path: Tuple[str, ...]) -> Dict[int, Any]:
+        """
+        Get the year-keyed entries of a field, indexing them on first use.
+        
+        Entries holding a 'text' value are reduced to their text.
+        
+        Args:
+            path: Path to the field
+            
+        Returns:
+            Shared dictionary of year -> value in ascending year order
+        """
+        try:
+            return self._series[path]
+        except KeyError:
+            pass
+        
+        entries = []
+        node = self._get_nested_value(list(path))
+        if isinstance(node, dict):
+            for key, value in node.items():
+                match = self.YEAR_KEY_PATTERN.search(key)
+                if match:
+                    if isinstance(value, dict) and 'text' in value:
+                        value = value['text']
+                    entries.append((int(match.group(1)), value))
+        
+        series = dict(sorted(entries, key=lambda entry: entry[0]))
+        self._series[path] = series
+        return series
     
     def _get_nested_value(self, path: List[str]) -> Optional[Any]:
         """
@@ -374,16 +373,53 @@ class CountryData:
         Returns:
             The value at the path or None if not found
         """
+        key_path = tuple(path)
+        try:
+            return self._values[key_path]
+        except KeyError:
+            pass
+        
         current = self._data
         
         for key in path:
             if isinstance(current, dict) and key in current:
                 current = current[key]
             else:
-                return None
+                current = None
+                break
         
+        self._values[key_path] = current
         return current
     
+    def _flattened(self) -> List[Tuple[Tuple[str, ...], str, str]]:
+        """
+        Get every string field as (path, value, lowercased value), in document order.
+        
+        Path components are interned, so the tuples share their strings with
+        each other and with the data's own keys.
+        
+        Returns:
+            Flattened table, built on first use
+        """
+        if self._text_table is None:
+            table = []
+            
+            def flatten(data: Any, path: Tuple[str, ...]) -> None:
+                if isinstance(data, dict):
+                    for key, value in data.items():
+                        current_path = path + (sys.intern(key),)
+                        if isinstance(value, str):
+                            table.append((current_path, value, value.lower()))
+                        elif isinstance(value, (dict, list)):
+                            flatten(value, current_path)
+                elif isinstance(data, list):
+                    for i, item in enumerate(data):
+                        flatten(item, path + (str(i),))
+            
+            flatten(self._data, ())
+            self._text_table = table
+        return self._text_table
+    
     def __str__(self) -> str:
         """String representation of the country."""
         name = self.name or "Unknown Country"
@@ -401,4 +437,16 @@ class CountryData:
     def __repr__(self) -> str:
         """Developer representation of the country."""
         name = self.name or "Unknown"
-        return f"CountryData(name='{name}')"
\ No newline at end of file
+        return f"CountryData(name='{name}')"
+
+
+def _field_property(index: int, spec: FieldSpec) -> property:
+    def getter(self: CountryData) -> Optional[Any]:
+        return self._slot(index)
+    getter.__name__ = spec.name
+    getter.__doc__ = spec.doc
+    return property(getter)
+
+
+for _index, _spec in enumerate(FIELDS):
+    setattr(CountryData, _spec.name, _field_property(_index, _spec))
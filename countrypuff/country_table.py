@@ -0,0 +1,408 @@
+"""
+Columnar table of the numeric indicators of every country, backed by NumPy.
+
+Each numeric field of CountryData (population, gdp_per_capita, ...) becomes
+a masked float64 column with one row per entity, so cross-country filtering,
+sorting and aggregation are vectorized instead of parsing one CountryData at
+a time. Tables are built once per dataset version and cached as ``.npz``.
+
+NumPy is an optional dependency (``pip install numpy``).
+"""
+
+import logging
+import os
+import tempfile
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+from .country_data import CountryData
+from .numeric import NumericValue
+
+logger = logging.getLogger(__name__)
+
+
+class CountryTable:
+    """
+    One row per entity (indexed by GEC code), one masked column per indicator.
+    """
+
+    FORMAT_VERSION = 1
+
+    # Indicators materialized as columns
+    INDICATORS = CountryData.NUMERIC_FIELDS
+
+    # Arrays stored per indicator, one entry per row
+    ARRAYS = ('value', 'mask', 'multiplier', 'year', 'estimate', 'unit', 'text')
+
+    # Entities that are not countries: the World, the oceans and the European Union
+    AGGREGATE_REGIONS = ('world', 'oceans')
+    AGGREGATE_CODES = ('ee',)
+
+    # Seconds a table built from live data is served before it is rebuilt
+    LIVE_TTL = 3600
+
+    # Dataset version -> (table, expiry or None), shared by every fetcher serving that version
+    _tables: Dict[str, Tuple['CountryTable', Optional[float]]] = {}
+    _lock = threading.Lock()
+    # Held while a table is built, so concurrent callers don't build it twice
+    _build_lock = threading.Lock()
+
+    def __init__(self, codes: List[str], regions: List[str], columns: Dict[str, Dict[str, 'np.ndarray']],
+                 version: str):
+        """
+        Initialize the CountryTable.
+
+        Args:
+            codes: GEC code of each row
+            regions: Factbook region of each row ('' if unknown)
+            columns: Indicator -> {name: array} for each name in ARRAYS
+            version: Dataset version the table was built from
+
+        Raises:
+            ImportError: If numpy is not installed
+        """
+        if np is None:
+            raise ImportError("CountryTable requires numpy. Install it with: pip install numpy")
+
+        self.version = version
+        # Distinguishes rebuilds of a live table, which all share the version 'live'
+        self.built_at = time.time()
+        self.codes = np.asarray(codes, dtype=str)
+        self.regions = np.asarray(regions, dtype=str)
+        self._rows = {code: row for row, code in enumerate(codes)}
+        self.aggregates = np.isin(self.regions, self.AGGREGATE_REGIONS) | np.isin(self.codes, self.AGGREGATE_CODES)
+        self._columns = columns
+        self._masked = {
+            indicator: np.ma.MaskedArray(arrays['value'], mask=arrays['mask'])
+            for indicator, arrays in columns.items()
+        }
+        # Indicator -> unmasked rows in ascending value order, computed on first rank()
+        self._orders: Dict[str, 'np.ndarray'] = {}
+
+    @classmethod
+    def build(cls, countries: Iterable[Tuple[str, Dict]], version: str,
+              regions: Optional[Dict[str, str]] = None) -> 'CountryTable':
+        """
+        Parse the numeric fields of every country into columns.
+
+        Args:
+            countries: (GEC code, country data) pairs
+            version: Dataset version of the data
+            regions: GEC code -> factbook region (default: none recorded)
+
+        Returns:
+            CountryTable instance
+        """
+        if np is None:
+            raise ImportError("CountryTable requires numpy. Install it with: pip install numpy")
+
+        codes = []
+        parsed: Dict[str, List[Optional[NumericValue]]] = {indicator: [] for indicator in cls.INDICATORS}
+        for gec_code, data in countries:
+            country = CountryData(data=data or {})
+            codes.append(gec_code.lower())
+            for indicator in cls.INDICATORS:
+                parsed[indicator].append(country.numeric(indicator))
+
+        columns = {}
+        for indicator, values in parsed.items():
+            columns[indicator] = {
+                'value': np.array([v.value if v else np.nan for v in values], dtype=np.float64),
+                'mask': np.array([v is None for v in values], dtype=bool),
+                'multiplier': np.array([v.multiplier if v else 1.0 for v in values], dtype=np.float64),
+                'year': np.array([(v.year or 0) if v else 0 for v in values], dtype=np.int16),
+                'estimate': np.array([v.estimate if v else False for v in values], dtype=bool),
+                'unit': np.array([(v.unit or '') if v else '' for v in values], dtype=str),
+                'text': np.array([v.text if v else '' for v in values], dtype=str)
+            }
+
+        regions = regions or {}
+        return cls(codes, [regions.get(code, '') for code in codes], columns, version)
+
+    @classmethod
+    def from_snapshot(cls, snapshot) -> 'CountryTable':
+        """
+        Build a table from every entity in a snapshot.
+
+        Args:
+            snapshot: Snapshot instance
+
+        Returns:
+            CountryTable instance
+        """
+        countries = ((gec_code, snapshot.get(gec_code)) for gec_code in snapshot.codes())
+        return cls.build(countries, snapshot.version, snapshot.regions)
+
+    @classmethod
+    def for_fetcher(cls, fetcher, path: Optional[str] = None) -> 'CountryTable':
+        """
+        Get the table for a fetcher's dataset version.
+
+        Snapshot tables are built once per version, kept in memory and cached
+        on disk. Live data is fetched through get_many. Its version does not
+        identify the upstream content, so a live table is kept in memory for
+        LIVE_TTL seconds, and not at all if any country failed to fetch.
+
+        The build runs outside the table lock and one at a time. Callers
+        holding an expired live table keep getting it while another thread
+        rebuilds it.
+
+        Args:
+            fetcher: DataFetcher providing the data
+            path: .npz file to cache the table in (default: cache_path(fetcher))
+
+        Returns:
+            CountryTable instance
+        """
+        version = fetcher.dataset_version
+        with cls._lock:
+            cached = cls._tables.get(version)
+        if cached and (cached[1] is None or cached[1] > time.monotonic()):
+            return cached[0]
+
+        if not cls._build_lock.acquire(blocking=cached is None):
+            return cached[0]
+        try:
+            # Another caller may have built it while this one waited
+            with cls._lock:
+                current = cls._tables.get(version)
+            if current is not cached and current and (current[1] is None or current[1] > time.monotonic()):
+                return current[0]
+
+            table, complete = cls._build_for(fetcher, path or cls.cache_path(fetcher))
+            if complete:
+                expires_at = None if fetcher.snapshot else time.monotonic() + cls.LIVE_TTL
+                with cls._lock:
+                    cls._tables[version] = (table, expires_at)
+            return table
+        finally:
+            cls._build_lock.release()
+
+    @classmethod
+    def _build_for(cls, fetcher, path: Optional[str]) -> Tuple['CountryTable', bool]:
+        """
+        Load or build a fetcher's table.
+
+        Args:
+            fetcher: DataFetcher providing the data
+            path: .npz file to load from and save to, if any
+
+        Returns:
+            (table, complete) tuple; complete is False if any country failed to fetch
+        """
+        version = fetcher.dataset_version
+        if path:
+            table = cls.load(path, version)
+            if table is not None:
+                return table, True
+
+        if fetcher.snapshot:
+            table = cls.from_snapshot(fetcher.snapshot)
+            complete = True
+        else:
+            # The region index lists the entities that exist upstream; its GEC
+            # codes key the results, one row each
+            fetched = fetcher.get_many(fetcher.region_index.codes())
+            countries = sorted(fetched['results'].items())
+            regions = {code: fetcher.region_index.region_for(code) or '' for code, _ in countries}
+            table = cls.build(countries, version, regions)
+            complete = not fetched['errors']
+            if not complete:
+                logger.warning("Country table is missing %d countries that failed to fetch; not caching it",
+                               len(fetched['errors']))
+
+        if path and complete:
+            try:
+                table.save(path)
+            except OSError as e:
+                logger.warning("Could not save country table to %s: %s", path, e)
+        return table, complete
+
+    @staticmethod
+    def cache_path(fetcher) -> Optional[str]:
+        """
+        Get where to cache a fetcher's table on disk.
+
+        Args:
+            fetcher: DataFetcher instance
+
+        Returns:
+            country_table-<version>.npz in the HTTP cache directory, else next
+            to the snapshot; None for live data
+        """
+        if not fetcher.snapshot:
+            return None
+        if fetcher.http_cache:
+            directory = fetcher.http_cache.directory
+        elif os.path.isdir(fetcher.snapshot.path):
+            directory = fetcher.snapshot.path
+        else:
+            directory = os.path.dirname(fetcher.snapshot.path)
+        return os.path.join(directory, f'country_table-{fetcher.dataset_version}.npz')
+
+    @classmethod
+    def load(cls, path: str, version: Optional[str] = None) -> Optional['CountryTable']:
+        """
+        Load a table saved with save().
+
+        Args:
+            path: .npz file
+            version: Expected dataset version (default: accept any)
+
+        Returns:
+            CountryTable instance, or None if the file is missing, unreadable,
+            or written for another format or dataset version
+        """
+        if np is None:
+            raise ImportError("CountryTable requires numpy. Install it with: pip install numpy")
+
+        try:
+            with np.load(path, allow_pickle=False) as npz:
+                if int(npz['format']) != cls.FORMAT_VERSION:
+                    return None
+                stored_version = str(npz['version'])
+                if version is not None and stored_version != version:
+                    return None
+                columns = {
+                    indicator: {name: npz[f'{indicator}/{name}']
+                                for name in cls.ARRAYS}
+                    for indicator in cls.INDICATORS
+                }
+                return cls(npz['codes'].tolist(), npz['regions'].tolist(), columns, stored_version)
+        except (OSError, KeyError, ValueError):
+            return None
+
+    def save(self, path: str) -> None:
+        """
+        Write the table to an .npz file atomically.
+
+        Args:
+            path: Destination file
+        """
+        arrays = {
+            'format': np.array(self.FORMAT_VERSION),
+            'version': np.array(self.version),
+            'codes': self.codes,
+            'regions': self.regions
+        }
+        for indicator, column in self._columns.items():
+            for name, array in column.items():
+                arrays[f'{indicator}/{name}'] = array
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                np.savez(f, **arrays)
+            os.replace(temp_path, path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+    def column(self, indicator: str) -> 'np.ma.MaskedArray':
+        """
+        Get an indicator's values for every row.
+
+        Args:
+            indicator: Indicator name from INDICATORS (e.g., 'population')
+
+        Returns:
+            Masked float64 array; rows without a parsable value are masked
+
+        Raises:
+            ValueError: If indicator is not in INDICATORS
+        """
+        try:
+            return self._masked[indicator]
+        except KeyError:
+            raise ValueError(f"Unknown indicator '{indicator}'. "
+                             f"Available indicators: {', '.join(self.INDICATORS)}") from None
+
+    def row(self, gec_code: str) -> Optional[int]:
+        """
+        Get the row of an entity.
+
+        Args:
+            gec_code: GEC code (e.g., 'us')
+
+        Returns:
+            Row number or None if the entity is not in the table
+        """
+        return self._rows.get(gec_code.lower())
+
+    def rank(self, indicator: str, descending: bool = True, region: Optional[str] = None,
+             minimum: Optional[float] = None, maximum: Optional[float] = None,
+             include_aggregates: bool = False) -> 'np.ndarray':
+        """
+        Order the rows that have a value by an indicator.
+
+        The column is argsorted once; each call only filters that order.
+
+        Args:
+            indicator: Indicator name from INDICATORS
+            descending: Largest values first (default: True)
+            region: Only include rows of this factbook region (e.g., 'europe')
+            minimum: Only include values of at least this much
+            maximum: Only include values of at most this much
+            include_aggregates: Also rank the World, the oceans and the EU
+
+        Returns:
+            Array of row numbers in rank order
+
+        Raises:
+            ValueError: If indicator is not in INDICATORS
+        """
+        column = self.column(indicator)
+        order = self._orders.get(indicator)
+        if order is None:
+            rows = np.flatnonzero(~np.ma.getmaskarray(column))
+            order = self._orders[indicator] = rows[np.argsort(column.data[rows], kind='stable')]
+
+        if descending:
+            order = order[::-1]
+        values = column.data[order]
+        keep = np.ones(len(order), dtype=bool) if include_aggregates else ~self.aggregates[order]
+        if region is not None:
+            keep &= self.regions[order] == region
+        if minimum is not None:
+            keep &= values >= minimum
+        if maximum is not None:
+            keep &= values <= maximum
+        return order[keep]
+
+    def record(self, indicator: str, row: int) -> Optional[NumericValue]:
+        """
+        Get one cell as a typed value.
+
+        Args:
+            indicator: Indicator name from INDICATORS
+            row: Row number
+
+        Returns:
+            NumericValue or None if the cell is masked
+        """
+        self.column(indicator)
+        arrays = self._columns[indicator]
+        if arrays['mask'][row]:
+            return None
+        return NumericValue(
+            value=float(arrays['value'][row]),
+            unit=str(arrays['unit'][row]) or None,
+            multiplier=float(arrays['multiplier'][row]),
+            year=int(arrays['year'][row]) or None,
+            estimate=bool(arrays['estimate'][row]),
+            text=str(arrays['text'][row])
+        )
+
+    def __contains__(self, gec_code: str) -> bool:
+        return self.row(gec_code) is not None
+
+    def __len__(self) -> int:
+        return len(self.codes)
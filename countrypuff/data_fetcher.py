@@ -3,10 +3,27 @@ Data fetcher module for retrieving country data from various sources.
 """
 
 import json
+import logging
+import os
+import threading
 import requests
-from typing import Dict, List, Optional, Union
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
 from urllib.parse import urljoin
 from .country_codes import CountryCodeMapper
+from .alias_index import AliasIndex
+from .region_index import RegionIndex
+from .name_index import NameIndex
+from .http_cache import HTTPCache
+from .cache import LRUCache, country_cache, missing_cache
+from .snapshot import Snapshot
+from .text_index import TextIndex
+
+
+logger = logging.getLogger(__name__)
+
+_shared_lock = threading.Lock()
 
 
 class DataFetcher:
@@ -36,19 +53,154 @@ class DataFetcher:
         'world': 'world'
     }
     
-    def __init__(self, timeout: int = 30):
+    _shared: Optional['DataFetcher'] = None
+    
+    def __init__(self, timeout: int = 30, region_index: Optional[RegionIndex] = None,
+                 cache_dir: Optional[str] = None, memory_cache: Optional[LRUCache] = None,
+                 snapshot_path: Optional[str] = None, base_url: Optional[str] = None,
+                 probe_mode: str = 'sequential', probe_workers: int = 13,
+                 max_workers: int = 10, pool_size: Optional[int] = None,
+                 negative_cache: Optional[LRUCache] = None, text_index_path: Optional[str] = None,
+                 alias_index: Optional[AliasIndex] = None):
         """
         Initialize the DataFetcher.
         
         Args:
             timeout: Request timeout in seconds (default: 30)
+            region_index: GEC -> region index (default: the index shipped with the package)
+            cache_dir: Directory for the persistent HTTP cache
+                (default: $COUNTRYPUFF_CACHE_DIR, disabled if unset)
+            memory_cache: Cache of parsed country data keyed by cache_key()
+                (default: the process-wide cache shared by all fetchers)
+            snapshot_path: Local factbook.json directory or tarball to serve data from
+                instead of BASE_URL (default: $COUNTRYPUFF_SNAPSHOT, disabled if unset)
+            base_url: Dataset root URL (default: BASE_URL)
+            probe_mode: How to scan regions when the region is unknown:
+                'sequential' (one at a time) or 'parallel' (all at once, first success wins)
+            probe_workers: Maximum concurrent region probes in parallel mode (default: 13)
+            max_workers: Default maximum concurrent fetches for get_many (default: 10)
+            pool_size: Keep-alive connections to keep per host (default: enough for
+                the largest concurrency this fetcher uses)
+            negative_cache: Short-lived cache of region files known to be missing
+                (default: the process-wide cache shared by all fetchers)
+            text_index_path: File to persist the full-text index to (default:
+                $COUNTRYPUFF_TEXT_INDEX, else next to the snapshot, else in an
+                index/ subdirectory of the cache directory, away from the cached
+                responses; in memory only if none of these is set)
+            alias_index: Extra country names to resolve, such as local and former
+                names (default: built from the snapshot's "Country name" fields,
+                else the generated alias_index.json if present)
         """
+        if probe_mode not in ('sequential', 'parallel'):
+            raise ValueError(f"Invalid probe_mode '{probe_mode}'. Valid modes: ['sequential', 'parallel']")
+        
         self.timeout = timeout
+        self.base_url = (base_url or self.BASE_URL).rstrip('/') + '/'
+        self.probe_mode = probe_mode
+        self.probe_workers = probe_workers
+        self.max_workers = max_workers
+        self._probe_executor = None
+        self._probe_lock = threading.Lock()
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'CountryPuff/0.1.0 (https://github.com/pbertain/countrypuff)'
         })
+        # Every request goes to one host, so there is a single pool; keep one
+        # connection in it per concurrent request (get_many or region probes)
+        if pool_size is None:
+            pool_size = max(max_workers, probe_workers if probe_mode == 'parallel' else 0)
+        self.pool_size = pool_size
+        adapter = HTTPAdapter(pool_maxsize=pool_size)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         self.code_mapper = CountryCodeMapper()
+        self.name_index = NameIndex.default()
+        
+        snapshot_path = snapshot_path or os.environ.get('COUNTRYPUFF_SNAPSHOT')
+        self.snapshot = Snapshot.open(snapshot_path) if snapshot_path else None
+        
+        if region_index is None:
+            region_index = self.snapshot.region_index if self.snapshot else RegionIndex.default()
+        self.region_index = region_index
+        
+        if alias_index is None:
+            alias_index = AliasIndex.from_snapshot(self.snapshot) if self.snapshot else AliasIndex.default()
+        self.alias_index = alias_index
+        
+        cache_dir = cache_dir or os.environ.get('COUNTRYPUFF_CACHE_DIR')
+        self.http_cache = HTTPCache(cache_dir) if cache_dir else None
+        self.memory_cache = memory_cache if memory_cache is not None else country_cache
+        self.negative_cache = negative_cache if negative_cache is not None else missing_cache
+        # Identifier -> (GEC code, error); resolution only depends on static tables
+        self.resolution_cache = LRUCache(maxsize=4096, ttl=None)
+        
+        self.text_index_path = text_index_path or os.environ.get('COUNTRYPUFF_TEXT_INDEX')
+        if not self.text_index_path:
+            if self.snapshot and os.path.isdir(self.snapshot.path):
+                self.text_index_path = os.path.join(self.snapshot.path, '.countrypuff-text-index.json')
+            elif self.snapshot:
+                self.text_index_path = self.snapshot.path + '.text-index.json'
+            elif self.http_cache:
+                self.text_index_path = os.path.join(self.http_cache.directory, 'index', 'text_index.json')
+        self._text_index: Optional[TextIndex] = None
+        self._text_index_lock = threading.Lock()
+        # Held for the duration of a build, so only one build runs at a time
+        self._text_index_build_lock = threading.RLock()
+    
+    @classmethod
+    def shared(cls) -> 'DataFetcher':
+        """
+        Get the process-wide fetcher, creating it on first use.
+        
+        The shared fetcher is configured from the environment
+        (COUNTRYPUFF_SNAPSHOT, COUNTRYPUFF_CACHE_DIR, COUNTRYPUFF_POOL_SIZE) and
+        its connection pool is safe to use from several threads, so keep-alive
+        connections are reused across requests.
+        
+        Returns:
+            Shared DataFetcher instance
+        """
+        with _shared_lock:
+            if cls._shared is None:
+                pool_size = os.environ.get('COUNTRYPUFF_POOL_SIZE')
+                cls._shared = cls(pool_size=int(pool_size) if pool_size else None)
+            return cls._shared
+    
+    @classmethod
+    def set_shared(cls, fetcher: Optional['DataFetcher']) -> None:
+        """
+        Replace the process-wide fetcher.
+        
+        Args:
+            fetcher: Fetcher to share, or None to create a new one on next use
+        """
+        with _shared_lock:
+            cls._shared = fetcher
+    
+    @property
+    def dataset_version(self) -> str:
+        """
+        Identify the dataset this fetcher serves, for keying derived caches.
+        
+        Snapshot-backed fetchers report the snapshot's content hash. Fetchers
+        reading the live repository report 'live', since upstream changes are
+        only picked up file by file as cached entries are revalidated.
+        """
+        return self.snapshot.version if self.snapshot else 'live'
+    
+    def cache_key(self, country_code: str) -> Tuple[str, str]:
+        """
+        Key a country in the memory cache, which every fetcher shares.
+        
+        Args:
+            country_code: GEC code
+            
+        Returns:
+            (dataset, GEC code) tuple; the dataset is the snapshot's version, or
+            the base URL for live data, so fetchers on different datasets never
+            serve each other's entries
+        """
+        return (self.snapshot.version if self.snapshot else self.base_url, country_code)
     
     def get_country_data(self, country_identifier: str, region: Optional[str] = None) -> Dict:
         """
@@ -66,24 +218,295 @@ class DataFetcher:
             requests.RequestException: If network request fails
         """
         # Convert country name to code if needed
-        country_code = self._resolve_country_code(country_identifier.lower())
+        country_code = self.resolve_identifier(country_identifier)
+        
+        data = self.memory_cache.get(self.cache_key(country_code))
+        if data is None:
+            data = self._fetch_country(country_code, region, country_identifier)
+            self.memory_cache.set(self.cache_key(country_code), data)
+            # Keep a loaded full-text index in step with fresh data
+            if self._text_index is not None:
+                self._text_index.update_country(country_code, data)
+        return data
+    
+    def get_many(self, identifiers: Iterable[str], max_in_flight: Optional[int] = None,
+                 progress: Optional[Callable[[int, int], None]] = None) -> Dict[str, Dict]:
+        """
+        Fetch several countries concurrently over the pooled session.
         
+        Identifiers are resolved up front and de-duplicated by GEC code, so
+        'DE', 'gm' and 'Germany' cost a single fetch.
+        
+        Args:
+            identifiers: Country codes or names
+            max_in_flight: Maximum concurrent fetches (default: max_workers)
+            progress: Optional callback invoked as progress(done, total) after
+                each distinct country finishes
+            
+        Returns:
+            Dictionary with 'results' (identifier -> country data) and
+            'errors' (identifier -> error message)
+        """
+        results: Dict[str, Dict] = {}
+        errors: Dict[str, str] = {}
+        
+        by_code: Dict[str, List[str]] = {}
+        for identifier in identifiers:
+            try:
+                country_code = self.resolve_identifier(identifier)
+            except CountryNotFoundError as e:
+                errors[identifier] = str(e)
+                continue
+            by_code.setdefault(country_code, []).append(identifier)
+        
+        if not by_code:
+            return {'results': results, 'errors': errors}
+        
+        workers = min(max_in_flight or self.max_workers, len(by_code))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='countrypuff-fetch') as executor:
+            futures = {executor.submit(self.get_country_data, country_code): names
+                       for country_code, names in by_code.items()}
+            for done, future in enumerate(as_completed(futures), start=1):
+                names = futures[future]
+                try:
+                    data = future.result()
+                except (CountryNotFoundError, requests.RequestException) as e:
+                    for name in names:
+                        errors[name] = str(e)
+                else:
+                    for name in names:
+                        results[name] = data
+                if progress:
+                    progress(done, len(futures))
+        
+        return {'results': results, 'errors': errors}
+    
+    def warm_up(self, identifiers: Optional[Iterable[str]] = None, max_in_flight: Optional[int] = None,
+                progress: Optional[Callable[[int, int], None]] = None) -> Dict[str, Dict]:
+        """
+        Prefetch countries into the in-memory cache.
+        
+        Args:
+            identifiers: Countries to load (default: every GEC code in
+                CountryCodeMapper.ISO_TO_GEC plus the world and ocean entities)
+            max_in_flight: Maximum concurrent fetches (default: max_workers)
+            progress: Optional callback invoked as progress(done, total)
+            
+        Returns:
+            Same structure as get_many
+        """
+        if identifiers is None:
+            identifiers = self.warm_up_codes()
+        return self.get_many(identifiers, max_in_flight=max_in_flight, progress=progress)
+    
+    def warm_up_codes(self) -> List[str]:
+        """
+        Get the GEC codes loaded by a default warm-up.
+        
+        Returns:
+            Sorted list of GEC codes
+        """
+        codes = set(self.code_mapper.ISO_TO_GEC.values())
+        codes.update(self.region_index.codes_in_region('world'))
+        codes.update(self.region_index.codes_in_region('oceans'))
+        return sorted(codes)
+    
+    def cache_stats(self) -> Dict:
+        """
+        Get hit/miss/eviction counters for the parsed-country cache.
+        
+        Returns:
+            Dictionary of cache statistics
+        """
+        return self.memory_cache.stats()
+    
+    def text_index(self) -> TextIndex:
+        """
+        Get the full-text index, loading the persisted copy on first use.
+        
+        The index may be empty or partial; build_text_index fills it in.
+        
+        Returns:
+            TextIndex instance
+        """
+        with self._text_index_lock:
+            if self._text_index is None:
+                if self.text_index_path:
+                    self._text_index = TextIndex.load(self.text_index_path)
+                else:
+                    self._text_index = TextIndex()
+            return self._text_index
+    
+    def build_text_index(self, identifiers: Optional[Iterable[str]] = None,
+                         max_in_flight: Optional[int] = None,
+                         progress: Optional[Callable[[int, int], None]] = None) -> TextIndex:
+        """
+        Index the text of every country, re-indexing only countries whose data changed.
+        
+        With a snapshot the data is read locally; otherwise countries are
+        fetched through get_many (and therefore the caches). The index is
+        saved afterwards if anything changed. Only one build runs at a time;
+        concurrent callers wait for it.
+        
+        Args:
+            identifiers: Countries to index (default: every snapshot country,
+                or the warm-up set when fetching remotely)
+            max_in_flight: Maximum concurrent fetches (default: max_workers)
+            progress: Optional callback invoked as progress(done, total)
+            
+        Returns:
+            The updated TextIndex
+        """
+        index = self.text_index()
+        
+        with self._text_index_build_lock:
+            if identifiers is None and self.snapshot:
+                codes = self.snapshot.codes()
+                for done, country_code in enumerate(codes, start=1):
+                    index.update_country(country_code, self.snapshot.get(country_code))
+                    if progress:
+                        progress(done, len(codes))
+                for country_code in set(index.countries()) - set(codes):
+                    index.remove_country(country_code)
+            else:
+                if identifiers is None:
+                    identifiers = self.warm_up_codes()
+                fetched = self.get_many(identifiers, max_in_flight=max_in_flight, progress=progress)
+                for identifier, data in fetched['results'].items():
+                    index.update_country(self.resolve_identifier(identifier), data)
+            
+            if index.dirty and self.text_index_path:
+                try:
+                    index.save()
+                except OSError as e:
+                    logger.warning("Could not save text index to %s: %s", self.text_index_path, e)
+        return index
+    
+    def search_text(self, query: str, limit: Optional[int] = 20) -> List[Dict]:
+        """
+        Search the factbook text of every country.
+        
+        Builds the full-text index on first use if it has not been built or
+        loaded yet.
+        
+        Args:
+            query: Search text
+            limit: Maximum number of hits (default: 20, None for all)
+            
+        Returns:
+            Hits ranked by BM25, each with gec_code, iso_code, name, path,
+            field, snippet and score
+        """
+        index = self.text_index()
+        if not index.countries():
+            with self._text_index_build_lock:
+                # Concurrent first searches wait for one build instead of each running it
+                if not index.countries():
+                    index = self.build_text_index()
+        
+        hits = index.search(query, limit=limit)
+        for hit in hits:
+            info = self.code_mapper.get_country_info(hit['gec_code']) or {}
+            hit['iso_code'] = info.get('iso_code')
+            hit['name'] = info.get('name')
+        return hits
+    
+    def _fetch_country(self, country_code: str, region: Optional[str], country_identifier: str) -> Dict:
+        """
+        Fetch country data from upstream, using the region index when possible.
+        
+        Args:
+            country_code: GEC code
+            region: Optional region to try first
+            country_identifier: Original identifier (used in error messages)
+            
+        Returns:
+            Country data dictionary
+            
+        Raises:
+            CountryNotFoundError: If country is not found
+            requests.RequestException: If network request fails
+        """
+        if self.snapshot is not None:
+            data = self.snapshot.get(country_code)
+            if data is None:
+                raise CountryNotFoundError(f"Country '{country_identifier}' not found")
+            return data
+        
+        tried = set()
         if region:
             # Try specific region first
+            tried.add(region)
             try:
                 return self._fetch_from_region(country_code, region)
             except requests.RequestException:
                 pass
         
-        # Search all regions
-        for region_name in self.REGIONS.keys():
-            try:
-                return self._fetch_from_region(country_code, region_name)
-            except requests.RequestException:
-                continue
+        if len(self.region_index):
+            indexed_region = self.region_index.region_for(country_code)
+            if not indexed_region:
+                # Not part of the dataset, no need to ask upstream
+                raise CountryNotFoundError(f"Country '{country_identifier}' not found")
+            
+            if indexed_region not in tried:
+                tried.add(indexed_region)
+                try:
+                    return self._fetch_from_region(country_code, indexed_region)
+                except requests.HTTPError as e:
+                    # A 404 means the index is stale; fall back to a full scan
+                    if e.response is None or e.response.status_code != 404:
+                        raise
+        
+        # Search all remaining regions
+        candidates = [name for name in self.REGIONS.keys() if name not in tried]
+        if self.probe_mode == 'parallel':
+            data = self._probe_parallel(country_code, candidates)
+            if data is not None:
+                return data
+        else:
+            for region_name in candidates:
+                try:
+                    return self._fetch_from_region(country_code, region_name)
+                except requests.RequestException:
+                    continue
         
         raise CountryNotFoundError(f"Country '{country_identifier}' not found")
     
+    def _probe_parallel(self, country_code: str, regions: List[str]) -> Optional[Dict]:
+        """
+        Probe several regions concurrently and return the first successful response.
+        
+        Args:
+            country_code: GEC code
+            regions: Region names to probe
+            
+        Returns:
+            Country data dictionary or None if every probe failed
+        """
+        if not regions:
+            return None
+        
+        with self._probe_lock:
+            if self._probe_executor is None:
+                self._probe_executor = ThreadPoolExecutor(
+                    max_workers=self.probe_workers, thread_name_prefix='countrypuff-probe'
+                )
+        
+        futures = [self._probe_executor.submit(self._fetch_from_region, country_code, name)
+                   for name in regions]
+        try:
+            for future in as_completed(futures):
+                try:
+                    return future.result()
+                except requests.RequestException:
+                    continue
+        finally:
+            # Drop probes that have not started; running ones finish in the background
+            for future in futures:
+                future.cancel()
+        
+        return None
+    
     def get_countries_by_region(self, region: str) -> List[str]:
         """
         Get list of available countries in a specific region.
@@ -100,9 +523,7 @@ class DataFetcher:
         if region not in self.REGIONS:
             raise ValueError(f"Invalid region '{region}'. Valid regions: {list(self.REGIONS.keys())}")
         
-        # This would require additional API calls to list directory contents
-        # For now, return empty list - could be enhanced later
-        return []
+        return self.region_index.codes_in_region(region)
     
     def get_all_regions(self) -> List[str]:
         """
@@ -113,9 +534,16 @@ class DataFetcher:
         """
         return list(self.REGIONS.keys())
     
-    def _resolve_country_code(self, identifier: str) -> str:
+    def resolve_identifier(self, identifier: str) -> str:
         """
-        Resolve country identifier to GEC code using the comprehensive mapping.
+        Resolve any country identifier to its canonical GEC code, without network access.
+        
+        Accepts GEC codes, ISO alpha-2/alpha-3/numeric codes and names
+        (including the factbook's own long, local, former and abbreviated
+        forms from alias_index) in any case, with or without accents,
+        punctuation, a leading 'the' or '&' for 'and'. Entities without an
+        ISO code (e.g. 'xx' for World) resolve through the region index. Results, including failures, are
+        memoized in a bounded cache.
         
         Args:
             identifier: Country name, ISO code, or GEC code
@@ -126,12 +554,39 @@ class DataFetcher:
         Raises:
             CountryNotFoundError: If country cannot be resolved
         """
+        key = identifier.strip()
+        result = self.resolution_cache.get(key)
+        if result is None:
+            result = self._resolve(key)
+            self.resolution_cache.set(key, result)
+        
+        gec_code, error_message = result
+        if error_message:
+            raise CountryNotFoundError(error_message)
+        return gec_code
+    
+    def _resolve(self, identifier: str) -> Tuple[Optional[str], Optional[str]]:
+        # Lowercase and mixed-case pairs are GEC codes first: 'at' is Ashmore and
+        # Cartier Islands, not ISO 'AT' (Austria), even though it has no ISO code
+        if (len(identifier) == 2 and identifier.isascii() and not identifier.isupper()
+                and identifier.lower() in self.region_index):
+            return identifier.lower(), None
+        
         gec_code = self.code_mapper.resolve_country_code(identifier)
         if gec_code:
-            return gec_code
+            return gec_code, None
+        
+        # Long, local, former and abbreviated names from the factbook itself
+        gec_code = self.alias_index.resolve(identifier)
+        if gec_code:
+            return gec_code, None
         
-        # If no mapping found, raise an error with helpful message
-        raise CountryNotFoundError(
+        # Entities without an ISO code (e.g. 'xx' for World) are still valid GEC codes
+        if len(identifier) == 2 and identifier.isascii() and identifier.lower() in self.region_index:
+            return identifier.lower(), None
+        
+        # If no mapping found, report an error with helpful message
+        return None, (
             f"Could not resolve '{identifier}' to a valid country code. "
             f"Try using ISO codes (e.g., 'US', 'DE') or full country names (e.g., 'United States', 'Germany')"
         )
@@ -150,47 +605,87 @@ class DataFetcher:
         Raises:
             requests.RequestException: If request fails
         """
-        url = urljoin(self.BASE_URL, f"{region}/{country_code}.json")
+        url = urljoin(self.base_url, f"{region}/{country_code}.json")
         
-        response = self.session.get(url, timeout=self.timeout)
-        response.raise_for_status()
+        if self.negative_cache.get(('region', self.base_url, country_code, region)):
+            # Answer a recent 404 from memory
+            response = requests.Response()
+            response.status_code = 404
+            response.reason = 'Not Found (cached)'
+            response.url = url
+            response.raise_for_status()
         
-        return response.json()
+        try:
+            return self._request_json(url)
+        except requests.HTTPError as e:
+            if e.response is not None and e.response.status_code == 404:
+                self.negative_cache.set(('region', self.base_url, country_code, region), True)
+            raise
     
-    def search_countries(self, query: str) -> List[Dict]:
+    def _request_json(self, url: str) -> Dict:
+        """
+        GET a JSON document, revalidating against the HTTP cache if enabled.
+        
+        Args:
+            url: Document URL
+            
+        Returns:
+            Parsed JSON body
+            
+        Raises:
+            requests.RequestException: If request fails
+        """
+        if self.http_cache is None:
+            response = self.session.get(url, timeout=self.timeout)
+            response.raise_for_status()
+            return response.json()
+        
+        # Revalidate against the on-disk copy; a 304 reuses the parsed body
+        headers = self.http_cache.conditional_headers(url)
+        response = self.session.get(url, timeout=self.timeout, headers=headers)
+        if response.status_code == 304:
+            data = self.http_cache.load(url)
+            if data is not None:
+                return data
+            response = self.session.get(url, timeout=self.timeout)
+        
+        response.raise_for_status()
+        try:
+            return self.http_cache.store(
+                url,
+                response.content,
+                etag=response.headers.get('ETag'),
+                last_modified=response.headers.get('Last-Modified')
+            )
+        except ValueError as e:
+            # Report a malformed body like response.json() would, so region scans skip it
+            raise requests.RequestException(f"Invalid JSON from {url}: {e}", response=response) from e
+    
+    def search_countries(self, query: str, include_data: bool = False,
+                         limit: Optional[int] = None) -> List[Dict]:
         """
         Search for countries by name.
         
+        Matching uses the in-memory name index and results are ranked exact,
+        prefix, word-prefix, then substring. Country data is fetched
+        (concurrently) only when include_data is set.
+        
         Args:
             query: Search query
+            include_data: Also fetch each match's full country data (default: False)
+            limit: Maximum number of matches to return (default: no limit)
             
         Returns:
             List of matching countries with their information
         """
-        results = []
-        query_lower = query.lower()
-        
-        # Search through all country names in the mapping
-        for name, iso_code in self.code_mapper.NAME_TO_ISO.items():
-            if query_lower in name:
-                gec_code = self.code_mapper.iso_to_gec(iso_code)
-                if gec_code:
-                    try:
-                        data = self.get_country_data(gec_code)
-                        results.append({
-                            'iso_code': iso_code,
-                            'gec_code': gec_code,
-                            'name': name.title(),
-                            'data': data
-                        })
-                    except:
-                        # If we can't fetch data, still include basic info
-                        results.append({
-                            'iso_code': iso_code,
-                            'gec_code': gec_code,
-                            'name': name.title(),
-                            'data': None
-                        })
+        # Ranked matches: exact, then prefix, then word-prefix, then substring
+        results = self.name_index.search(query, limit=limit)
+        
+        if include_data and results:
+            fetched = self.get_many(result['gec_code'] for result in results)
+            for result in results:
+                # Countries that could not be fetched keep their basic info
+                result['data'] = fetched['results'].get(result['gec_code'])
         
         return results
     
@@ -0,0 +1,217 @@
+"""
+Declarative registry of the named fields CountryData exposes.
+
+Each FieldSpec lists where a field lives in the factbook data (candidate
+paths, tried in order), how to post-process the raw value, and the section
+it is grouped under. CountryData generates its properties, extract() and
+summary() from FIELDS, so adding a field is one entry here.
+"""
+
+from typing import Any, Callable, Dict, NamedTuple, Optional, Tuple
+
+
+class FieldSpec(NamedTuple):
+    """
+    Definition of one CountryData field.
+
+    Attributes:
+        name: Property name (e.g., 'population')
+        section: Group the field is listed under (e.g., 'Demographics')
+        paths: Candidate paths into the country data; the first truthy value wins
+        doc: Property docstring
+        post: Function applied to each raw value (default: returned as is)
+        numeric: Whether the text starts with a figure CountryData.numeric() can parse
+        summary_key: Key of the field in CountryData.summary(), if it is included
+        yearly: Whether the paths lead to year-keyed entries ('Exports 2024',
+            'Exports 2023', ...), of which the latest is used
+    """
+    name: str
+    section: str
+    paths: Tuple[Tuple[str, ...], ...]
+    doc: str
+    post: Optional[Callable[[Any], Any]] = None
+    numeric: bool = False
+    summary_key: Optional[str] = None
+    yearly: bool = False
+
+
+def text_of(section: str, *keys: str) -> Tuple[str, ...]:
+    """
+    Build the path of a factbook text value.
+
+    Args:
+        section: Section name
+        *keys: Field and subfield names
+
+    Returns:
+        Path tuple ending in 'text'
+    """
+    return (section,) + keys + ('text',)
+
+
+def not_none(value: Any) -> Any:
+    """Treat the factbook's literal 'none' as missing."""
+    if isinstance(value, str) and value.lower() == 'none':
+        return None
+    return value
+
+
+# Texts the factbook uses in place of a value
+PLACEHOLDERS = frozenset({'', 'na', 'none'})
+
+
+def is_placeholder(value: Any) -> bool:
+    """Whether a value is missing or one of the factbook's placeholders ('NA', 'none')."""
+    if value is None:
+        return True
+    if isinstance(value, str):
+        return value.strip().split('\n', 1)[0].strip().lower() in PLACEHOLDERS
+    return False
+
+
+def text_map(value: Any) -> Optional[Dict]:
+    """Reduce a dictionary of factbook entries to their texts."""
+    if isinstance(value, dict):
+        return {k: v.get('text') if isinstance(v, dict) else v for k, v in value.items()}
+    return None
+
+
+FIELDS = (
+    # Basic Information
+    FieldSpec('name', 'Basic Information',
+              (text_of('Government', 'Country name', 'conventional short form'),
+               text_of('Government', 'Country name', 'conventional long form')),
+              "Get the country's conventional short form name.", post=not_none, summary_key='name'),
+    FieldSpec('official_name', 'Basic Information',
+              (text_of('Government', 'Country name', 'conventional long form'),),
+              "Get the country's conventional long form name.", summary_key='official_name'),
+    FieldSpec('capital', 'Basic Information',
+              (text_of('Government', 'Capital', 'name'),),
+              "Get the country's capital city.", summary_key='capital'),
+    FieldSpec('population', 'Basic Information',
+              (text_of('People and Society', 'Population', 'total'),),
+              "Get the country's total population.", numeric=True, summary_key='population'),
+    FieldSpec('area_total', 'Basic Information',
+              (text_of('Geography', 'Area', 'total '), text_of('Geography', 'Area', 'total')),
+              "Get the country's total area.", numeric=True, summary_key='area'),
+    FieldSpec('gdp_per_capita', 'Basic Information',
+              (('Economy', 'Real GDP per capita'),),
+              "Get the country's GDP per capita.", numeric=True, summary_key='gdp_per_capita', yearly=True),
+
+    # Geography
+    FieldSpec('location', 'Geography',
+              (text_of('Geography', 'Location'),),
+              "Get the country's geographic location description.", summary_key='location'),
+    FieldSpec('coordinates', 'Geography',
+              (text_of('Geography', 'Geographic coordinates'),),
+              "Get the country's geographic coordinates."),
+    FieldSpec('climate', 'Geography',
+              (text_of('Geography', 'Climate'),),
+              "Get the country's climate description."),
+    FieldSpec('natural_resources', 'Geography',
+              (text_of('Geography', 'Natural resources'),),
+              "Get the country's natural resources."),
+
+    # Demographics
+    FieldSpec('ethnic_groups', 'Demographics',
+              (text_of('People and Society', 'Ethnic groups'),),
+              "Get the country's ethnic groups breakdown."),
+    FieldSpec('languages', 'Demographics',
+              (text_of('People and Society', 'Languages'),),
+              "Get the country's languages."),
+    FieldSpec('religions', 'Demographics',
+              (text_of('People and Society', 'Religions'),),
+              "Get the country's religions breakdown."),
+    FieldSpec('life_expectancy', 'Demographics',
+              (text_of('People and Society', 'Life expectancy at birth', 'total population'),),
+              "Get the country's life expectancy.", numeric=True),
+    FieldSpec('age_structure', 'Demographics',
+              (('People and Society', 'Age structure'),),
+              "Get the country's age structure breakdown.", post=text_map),
+    FieldSpec('birth_rate', 'Demographics',
+              (text_of('People and Society', 'Birth rate', 'births/1,000 population'),),
+              "Get the country's birth rate.", numeric=True),
+    FieldSpec('death_rate', 'Demographics',
+              (text_of('People and Society', 'Death rate', 'deaths/1,000 population'),),
+              "Get the country's death rate.", numeric=True),
+    FieldSpec('literacy_rate', 'Demographics',
+              (text_of('People and Society', 'Literacy', 'total population'),),
+              "Get the country's literacy rate.", numeric=True),
+
+    # Government
+    FieldSpec('government_type', 'Government',
+              (text_of('Government', 'Government type'),),
+              "Get the country's government type.", summary_key='government_type'),
+    FieldSpec('independence_date', 'Government',
+              (text_of('Government', 'Independence'),),
+              "Get the country's independence date."),
+
+    # Economy
+    FieldSpec('economic_overview', 'Economy',
+              (text_of('Economy', 'Economic overview'),),
+              "Get the country's economic overview."),
+    FieldSpec('currency', 'Economy',
+              (text_of('Economy', 'Exchange rates', 'Currency'),),
+              "Get the country's currency.", summary_key='currency'),
+    FieldSpec('exports', 'Economy',
+              (('Economy', 'Exports'),),
+              "Get the country's export value.", numeric=True, yearly=True),
+    FieldSpec('imports', 'Economy',
+              (('Economy', 'Imports'),),
+              "Get the country's import value.", numeric=True, yearly=True),
+    FieldSpec('unemployment_rate', 'Economy',
+              (('Economy', 'Unemployment rate'),),
+              "Get the country's unemployment rate.", numeric=True, yearly=True),
+
+    # Communications
+    FieldSpec('internet_users', 'Communications',
+              (text_of('Communications', 'Internet users', 'total'),),
+              "Get the country's internet users statistics.", numeric=True),
+    FieldSpec('mobile_phones', 'Communications',
+              (text_of('Communications', 'Telephones - mobile cellular', 'total subscriptions'),),
+              "Get the country's mobile phone subscriptions.", numeric=True),
+    FieldSpec('broadband_subscriptions', 'Communications',
+              (text_of('Communications', 'Broadband - fixed subscriptions', 'total'),),
+              "Get the country's broadband subscriptions.", numeric=True),
+
+    # Energy
+    FieldSpec('electricity_access', 'Energy',
+              (text_of('Energy', 'Electricity access', 'electrification - total population'),),
+              "Get the country's electricity access percentage.", numeric=True),
+    FieldSpec('energy_consumption_per_capita', 'Energy',
+              (('Energy', 'Energy consumption per capita'),),
+              "Get the country's energy consumption per capita.", numeric=True, yearly=True),
+    FieldSpec('electricity_generation_sources', 'Energy',
+              (('Energy', 'Electricity generation sources'),),
+              "Get the country's electricity generation sources breakdown.", post=text_map),
+
+    # Transportation
+    FieldSpec('airports', 'Transportation',
+              (text_of('Transportation', 'Airports', 'total'),),
+              "Get the country's number of airports.", numeric=True),
+    FieldSpec('railways', 'Transportation',
+              (text_of('Transportation', 'Railways', 'total'),),
+              "Get the country's railway length.", numeric=True),
+    FieldSpec('ports', 'Transportation',
+              (text_of('Transportation', 'Ports'),),
+              "Get the country's major ports."),
+
+    # Environment
+    FieldSpec('environment_issues', 'Environment',
+              (text_of('Environment', 'Environment - current issues'),),
+              "Get the country's environmental issues."),
+    FieldSpec('air_pollutants', 'Environment',
+              (('Environment', 'Air pollutants'),),
+              "Get the country's air pollutant data.", post=text_map),
+
+    # Military
+    FieldSpec('military_expenditure', 'Military',
+              (('Military and Security', 'Military expenditures'),),
+              "Get the country's military expenditure.", numeric=True, yearly=True),
+    FieldSpec('military_service_age', 'Military',
+              (text_of('Military and Security', 'Military service age and obligation'),),
+              "Get the country's military service age."),
+)
+
+# Field name -> slot in FIELDS (and in each CountryData's value cache)
+FIELD_INDEX = {spec.name: index for index, spec in enumerate(FIELDS)}
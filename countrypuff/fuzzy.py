@@ -0,0 +1,119 @@
+"""
+Edit-distance matching for typo-tolerant country name lookup.
+"""
+
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+def edit_distance(a: str, b: str, max_distance: Optional[int] = None) -> int:
+    """
+    Compute the optimal string alignment distance between two strings.
+
+    This is Levenshtein distance with adjacent transpositions counted as a
+    single edit, so 'Phillipines' -> 'Philippines' is 2 and 'Brazli' ->
+    'Brazil' is 1.
+
+    Args:
+        a: First string
+        b: Second string
+        max_distance: Stop early once the distance is known to exceed this
+
+    Returns:
+        Number of edits (max_distance + 1 if the early exit was taken)
+    """
+    if a == b:
+        return 0
+    if max_distance is not None and abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+
+    previous_previous = None
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if (previous_previous is not None and i > 1 and j > 1
+                    and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]):
+                current[j] = min(current[j], previous_previous[j - 2] + 1)
+        if max_distance is not None and min(current) > max_distance:
+            return max_distance + 1
+        previous_previous, previous = previous, current
+    return previous[-1]
+
+
+class BKTree:
+    """
+    Burkhard-Keller tree for finding words within an edit distance of a query.
+
+    Each node's children are keyed by their distance to the node, so the
+    triangle inequality lets a search skip every subtree that cannot hold a
+    match instead of comparing the query with every word.
+    """
+
+    def __init__(self, words: Iterable[str] = ()):
+        """
+        Initialize the BKTree.
+
+        Args:
+            words: Words to insert
+        """
+        self._root: Optional[Tuple[str, Dict[int, tuple]]] = None
+        self._size = 0
+        for word in words:
+            self.add(word)
+
+    def add(self, word: str) -> None:
+        """
+        Insert a word.
+
+        Args:
+            word: Word to insert (duplicates are ignored)
+        """
+        if self._root is None:
+            self._root = (word, {})
+            self._size = 1
+            return
+
+        node_word, children = self._root
+        while True:
+            distance = edit_distance(word, node_word)
+            if distance == 0:
+                return
+            child = children.get(distance)
+            if child is None:
+                children[distance] = (word, {})
+                self._size += 1
+                return
+            node_word, children = child
+
+    def search(self, query: str, max_distance: int) -> List[Tuple[int, str]]:
+        """
+        Find every word within max_distance edits of the query.
+
+        Args:
+            query: Query string
+            max_distance: Maximum edit distance
+
+        Returns:
+            List of (distance, word) tuples, closest first
+        """
+        if self._root is None:
+            return []
+
+        matches = []
+        pending = [self._root]
+        while pending:
+            node_word, children = pending.pop()
+            distance = edit_distance(query, node_word)
+            if distance <= max_distance:
+                matches.append((distance, node_word))
+            low, high = distance - max_distance, distance + max_distance
+            for child_distance, child in children.items():
+                if low <= child_distance <= high:
+                    pending.append(child)
+
+        return sorted(matches)
+
+    def __len__(self) -> int:
+        return self._size
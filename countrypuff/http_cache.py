@@ -0,0 +1,135 @@
+"""
+Persistent on-disk cache for factbook JSON responses.
+
+Bodies are stored next to their ETag / Last-Modified validators so that a
+restarted process can revalidate with a conditional request instead of
+downloading every country file again.
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from typing import Dict, Optional
+
+
+class HTTPCache:
+    """
+    Stores HTTP response bodies and validators under a directory.
+
+    Each URL is kept as two files named after the SHA-1 of the URL: the raw
+    body (``<key>.json``) and its metadata (``<key>.meta.json``). Parsed
+    bodies are not kept here; the fetcher's bounded memory cache holds them.
+    """
+
+    # Names of the files the cache writes: <sha1>.json and <sha1>.meta.json
+    FILE_PATTERN = re.compile(r'[0-9a-f]{40}(?:\.meta)?\.json')
+
+    def __init__(self, directory: str):
+        """
+        Initialize the HTTPCache.
+
+        Args:
+            directory: Directory to store cached responses in (created if missing)
+        """
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        """
+        Build revalidation headers for a URL.
+
+        Args:
+            url: Request URL
+
+        Returns:
+            Dictionary with If-None-Match / If-Modified-Since headers (empty if not cached)
+        """
+        meta = self._read_meta(url)
+        if not meta or not os.path.exists(self._body_path(url)):
+            return {}
+
+        headers = {}
+        if meta.get('etag'):
+            headers['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'):
+            headers['If-Modified-Since'] = meta['last_modified']
+        return headers
+
+    def load(self, url: str) -> Optional[Dict]:
+        """
+        Get the cached parsed body for a URL.
+
+        Args:
+            url: Request URL
+
+        Returns:
+            Parsed JSON body or None if it is not cached
+        """
+        try:
+            with open(self._body_path(url), 'rb') as f:
+                return json.loads(f.read())
+        except (OSError, ValueError):
+            return None
+
+    def store(self, url: str, body: bytes, etag: Optional[str] = None,
+              last_modified: Optional[str] = None) -> Dict:
+        """
+        Store a response body and its validators.
+
+        Args:
+            url: Request URL
+            body: Raw response body
+            etag: ETag response header
+            last_modified: Last-Modified response header
+
+        Returns:
+            Parsed JSON body
+
+        Raises:
+            ValueError: If the body is not valid JSON
+        """
+        data = json.loads(body)
+
+        self._write_atomic(self._body_path(url), body)
+        meta = {
+            'url': url,
+            'etag': etag,
+            'last_modified': last_modified,
+            'stored_at': time.time()
+        }
+        self._write_atomic(self._meta_path(url), json.dumps(meta).encode('utf-8'))
+        return data
+
+    def clear(self) -> None:
+        """Remove every cached response, leaving other files in the directory alone."""
+        for filename in os.listdir(self.directory):
+            if self.FILE_PATTERN.fullmatch(filename):
+                try:
+                    os.remove(os.path.join(self.directory, filename))
+                except OSError:
+                    pass
+
+    def _key(self, url: str) -> str:
+        return hashlib.sha1(url.encode('utf-8')).hexdigest()
+
+    def _body_path(self, url: str) -> str:
+        return os.path.join(self.directory, f"{self._key(url)}.json")
+
+    def _meta_path(self, url: str) -> str:
+        return os.path.join(self.directory, f"{self._key(url)}.meta.json")
+
+    def _read_meta(self, url: str) -> Optional[Dict]:
+        try:
+            with open(self._meta_path(url), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write_atomic(self, path: str, content: bytes) -> None:
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(content)
+        os.replace(tmp_path, path)
@@ -0,0 +1,215 @@
+"""
+Ranked name index for country search and autocomplete.
+
+Country names, aliases and codes are normalized once and stored in sorted
+tables so that a query can be answered with binary searches instead of a
+scan over every name. Results are ranked exact match first, then prefix,
+then word-prefix, then substring.
+"""
+
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .cache import LRUCache
+from .country_codes import CountryCodeMapper
+
+
+class NameIndex:
+    """
+    Precomputed lookup tables over country names, aliases and codes.
+    """
+
+    # Match ranks, best first
+    EXACT = 0
+    PREFIX = 1
+    WORD_PREFIX = 2
+    SUBSTRING = 3
+
+    MATCH_TYPES = {
+        EXACT: 'exact',
+        PREFIX: 'prefix',
+        WORD_PREFIX: 'word_prefix',
+        SUBSTRING: 'substring'
+    }
+
+    _default = None
+
+    def __init__(self, names: Iterable[Tuple[str, str]], codes: Iterable[Tuple[str, str]] = (),
+                 display_names: Optional[Dict[str, str]] = None):
+        """
+        Initialize the NameIndex.
+
+        Args:
+            names: (name, ISO code) pairs; names match by prefix and substring
+            codes: (code, ISO code) pairs; codes only match exactly
+            display_names: ISO code -> name to show in results
+                (default: the first name seen for each ISO code)
+        """
+        # Keystroke traffic repeats the same prefixes, so memoize ranked results
+        self._results = LRUCache(maxsize=4096, ttl=None)
+        self._display_names = dict(display_names or {})
+        self._exact: Dict[str, List[str]] = {}
+        keys = []
+        words = []
+
+        for name, iso_code in names:
+            key = self.normalize(name)
+            if not key:
+                continue
+            self._display_names.setdefault(iso_code, name.title())
+            self._exact.setdefault(key, []).append(iso_code)
+            keys.append((key, iso_code))
+            for position, word in enumerate(key.split()):
+                if position:
+                    words.append((word, iso_code, key))
+
+        for code, iso_code in codes:
+            key = self.normalize(code)
+            if key:
+                self._exact.setdefault(key, []).append(iso_code)
+
+        # Sorted tables answer prefix queries with a binary search
+        self._keys = sorted(set(keys))
+        self._words = sorted(set(words))
+
+        # Trigram -> positions in _keys, to narrow substring matches
+        self._trigrams: Dict[str, set] = {}
+        for position, (key, _) in enumerate(self._keys):
+            for start in range(len(key) - 2):
+                self._trigrams.setdefault(key[start:start + 3], set()).add(position)
+
+    @classmethod
+    def from_mapper(cls, mapper=CountryCodeMapper) -> 'NameIndex':
+        """
+        Build an index over a CountryCodeMapper's names and codes.
+
+        Display names (ISO_TO_NAME) are searchable alongside the aliases in
+        NAME_TO_ISO and are what results show.
+
+        Args:
+            mapper: CountryCodeMapper class or instance
+
+        Returns:
+            NameIndex instance
+        """
+        codes = []
+        for iso_code, gec_code in mapper.ISO_TO_GEC.items():
+            codes.append((iso_code, iso_code))
+            codes.append((gec_code, iso_code))
+        for iso_code, alpha3_code in mapper.ISO_TO_ALPHA3.items():
+            codes.append((alpha3_code, iso_code))
+            codes.append((mapper.ISO_TO_NUMERIC[iso_code], iso_code))
+        names = list(mapper.NAME_TO_ISO.items())
+        names.extend((name, iso_code) for iso_code, name in mapper.ISO_TO_NAME.items())
+        return cls(names, codes, display_names=mapper.ISO_TO_NAME)
+
+    @classmethod
+    def default(cls) -> 'NameIndex':
+        """
+        Get the index over CountryCodeMapper, building it on first use.
+
+        Returns:
+            Shared NameIndex instance
+        """
+        if cls._default is None:
+            cls._default = cls.from_mapper()
+        return cls._default
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        """
+        Normalize a name or query for lookup.
+
+        Args:
+            text: Raw text
+
+        Returns:
+            Lowercased text with collapsed whitespace
+        """
+        return ' '.join(text.lower().split())
+
+    def search(self, query: str, limit: Optional[int] = 10) -> List[Dict[str, str]]:
+        """
+        Find countries matching a query, best matches first.
+
+        Each country appears once, at its best rank. Within a rank, shorter
+        matched names come first, then alphabetical order.
+
+        Args:
+            query: Search text
+            limit: Maximum number of results (default: 10, None for all)
+
+        Returns:
+            List of dictionaries with iso_code, gec_code, name, matched and match
+        """
+        query = self.normalize(query)
+        if not query:
+            return []
+
+        key = (query, limit)
+        results = self._results.get(key)
+        if results is None:
+            results = self._rank(query, limit)
+            self._results.set(key, results)
+        # Callers may annotate results (e.g. with country data), so hand out copies
+        return [dict(result) for result in results]
+
+    def _rank(self, query: str, limit: Optional[int]) -> List[Dict[str, str]]:
+        best: Dict[str, Tuple[int, int, str]] = {}
+
+        def consider(iso_code: str, rank: int, key: str) -> None:
+            candidate = (rank, len(key), key)
+            if iso_code not in best or candidate < best[iso_code]:
+                best[iso_code] = candidate
+
+        for iso_code in self._exact.get(query, ()):
+            consider(iso_code, self.EXACT, query)
+
+        for key, iso_code in self._prefix_range(self._keys, query):
+            consider(iso_code, self.PREFIX, key)
+
+        for word, iso_code, key in self._prefix_range(self._words, query):
+            consider(iso_code, self.WORD_PREFIX, key)
+
+        for key, iso_code in self._substring_candidates(query):
+            if iso_code not in best and query in key:
+                consider(iso_code, self.SUBSTRING, key)
+
+        ranked = sorted(best.items(), key=lambda item: item[1])
+        if limit is not None:
+            ranked = ranked[:limit]
+
+        results = []
+        for iso_code, (rank, _, key) in ranked:
+            gec_code = CountryCodeMapper.iso_to_gec(iso_code)
+            if not gec_code:
+                continue
+            results.append({
+                'iso_code': iso_code,
+                'gec_code': gec_code,
+                'name': self._display_names.get(iso_code, key.title()),
+                'matched': key,
+                'match': self.MATCH_TYPES[rank]
+            })
+        return results
+
+    def _substring_candidates(self, query: str) -> Iterable[Tuple[str, str]]:
+        if len(query) < 3:
+            return self._keys
+
+        positions = None
+        for start in range(len(query) - 2):
+            matches = self._trigrams.get(query[start:start + 3])
+            if not matches:
+                return []
+            positions = set(matches) if positions is None else positions & matches
+        return [self._keys[position] for position in sorted(positions)]
+
+    @staticmethod
+    def _prefix_range(table: List[tuple], prefix: str) -> Iterable[tuple]:
+        start = bisect_left(table, (prefix,))
+        for position in range(start, len(table)):
+            entry = table[position]
+            if not entry[0].startswith(prefix):
+                break
+            yield entry
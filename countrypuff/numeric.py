@@ -0,0 +1,140 @@
+"""
+Typed parsing of the numeric text fields in factbook data.
+
+Factbook values are free text such as ``338,289,857 (2024 est.)``,
+``$73.637 trillion (2023 est.)`` or ``11.6 births/1,000 population``. This
+module turns the leading figure of such a string into a NumericValue with a
+float value, a normalized unit, the scale multiplier, the reference year and
+whether the figure is an estimate.
+"""
+
+import re
+from functools import lru_cache
+from typing import Any, Dict, NamedTuple, Optional
+
+
+class NumericValue(NamedTuple):
+    """
+    A figure parsed from a factbook text field.
+
+    Attributes:
+        value: The figure with its multiplier applied (73.637 trillion -> 7.3637e13)
+        unit: Normalized unit ('USD', '%', 'sq km', 'years', ...) or None
+        multiplier: Scale written after the number (1, 1e3, 1e6, 1e9 or 1e12)
+        year: Reference year, if given
+        estimate: Whether the figure is marked as an estimate ('est.')
+        text: The text the figure was parsed from
+    """
+    value: float
+    unit: Optional[str]
+    multiplier: float
+    year: Optional[int]
+    estimate: bool
+    text: str
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Get the value as a JSON-serializable dictionary.
+
+        Returns:
+            Dictionary with value, unit, multiplier, year, estimate and text
+        """
+        return self._asdict()
+
+
+MULTIPLIERS = {
+    'thousand': 1e3,
+    'million': 1e6,
+    'billion': 1e9,
+    'trillion': 1e12
+}
+
+CURRENCIES = {
+    '$': 'USD',
+    '€': 'EUR',
+    '£': 'GBP'
+}
+
+# Leading figure: optional sign and currency symbol, digits with thousands
+# separators, optional scale word, then the unit text up to a note or year
+NUMBER_PATTERN = re.compile(
+    r'(?P<sign>-)?\s*(?P<currency>[$€£])?\s*(?P<inner_sign>-)?'
+    r'(?P<number>\d[\d,]*(?:\.\d+)?|\.\d+)'
+    r'(?:\s*(?P<scale>thousand|million|billion|trillion)\b)?'
+    r'\s*(?P<unit>[^(;\n]*)',
+    re.IGNORECASE
+)
+
+# '(2024 est.)', '(2023)', '(FY2022/23 est.)', '(2019 est.)'
+YEAR_PATTERN = re.compile(
+    r'\((?:FY)?\s*(?P<year>(?:19|20)\d{2})(?:/\d{2,4})?\s*(?P<estimate>est\.?)?\s*\)',
+    re.IGNORECASE
+)
+
+UNIT_ALIASES = {
+    'percent': '%',
+    'sq km': 'sq km',
+    'km': 'km',
+    'years': 'years',
+    'year': 'years'
+}
+
+
+@lru_cache(maxsize=65536)
+def parse_numeric(text: Optional[str]) -> Optional[NumericValue]:
+    """
+    Parse the leading figure of a factbook text field.
+
+    Results are memoized by text, since the same strings recur across
+    requests and countries.
+
+    Args:
+        text: Field text (e.g. '$73.637 trillion (2023 est.)')
+
+    Returns:
+        NumericValue or None if the text has no leading figure ('NA', 'none')
+    """
+    if not isinstance(text, str):
+        return None
+
+    first_line = text.strip().split('\n', 1)[0]
+    match = NUMBER_PATTERN.match(first_line)
+    if not match:
+        return None
+
+    number = float(match.group('number').replace(',', ''))
+    if match.group('sign') or match.group('inner_sign'):
+        number = -number
+
+    scale = match.group('scale')
+    multiplier = MULTIPLIERS[scale.lower()] if scale else 1.0
+
+    unit = _normalize_unit(match.group('unit'))
+    currency = match.group('currency')
+    if currency:
+        unit = CURRENCIES[currency] if not unit else f"{CURRENCIES[currency]} {unit}"
+
+    year = None
+    estimate = False
+    year_match = YEAR_PATTERN.search(first_line)
+    if year_match:
+        year = int(year_match.group('year'))
+        estimate = year_match.group('estimate') is not None
+
+    return NumericValue(
+        value=number * multiplier,
+        unit=unit,
+        multiplier=multiplier,
+        year=year,
+        estimate=estimate,
+        text=text
+    )
+
+
+def _normalize_unit(unit: str) -> Optional[str]:
+    unit = ' '.join(unit.split()).strip(' ,.:;')
+    if not unit:
+        return None
+    if unit.startswith('%'):
+        return '%' + unit[1:]
+    return UNIT_ALIASES.get(unit.lower(), unit)
@@ -0,0 +1,170 @@
+"""
+GEC code to factbook region index.
+
+The factbook.json repository stores every entity as ``<region>/<gec>.json``.
+Knowing the region up front lets the fetcher make exactly one request per
+lookup instead of probing every region directory until one does not 404.
+
+A pre-built index ships with the package as ``region_index.json``. It can be
+regenerated from the upstream repository listing with::
+
+    python -m countrypuff.region_index [output_path]
+"""
+
+import json
+import os
+import sys
+from typing import Dict, Iterable, List, Optional
+
+import requests
+
+
+class RegionIndex:
+    """
+    Maps GEC codes to the factbook.json region directory that contains them.
+    """
+
+    DEFAULT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'region_index.json')
+    TREE_URL = "https://api.github.com/repos/factbook/factbook.json/git/trees/master?recursive=1"
+
+    _default = None
+
+    def __init__(self, mapping: Optional[Dict[str, str]] = None):
+        """
+        Initialize the RegionIndex.
+
+        Args:
+            mapping: Dictionary of GEC code -> region name
+        """
+        self._regions = {gec.lower(): region for gec, region in (mapping or {}).items()}
+
+    @classmethod
+    def load(cls, path: Optional[str] = None) -> 'RegionIndex':
+        """
+        Load an index from a JSON file.
+
+        Args:
+            path: Path to the index file (default: the index shipped with the package)
+
+        Returns:
+            RegionIndex instance (empty if the file does not exist)
+        """
+        path = path or cls.DEFAULT_PATH
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return cls(json.load(f))
+        except FileNotFoundError:
+            return cls()
+
+    @classmethod
+    def default(cls) -> 'RegionIndex':
+        """
+        Get the index shipped with the package, loading it on first use.
+
+        Returns:
+            Shared RegionIndex instance
+        """
+        if cls._default is None:
+            cls._default = cls.load()
+        return cls._default
+
+    @classmethod
+    def from_listing(cls, paths: Iterable[str]) -> 'RegionIndex':
+        """
+        Build an index from a dataset listing.
+
+        Args:
+            paths: Relative file paths such as 'europe/gm.json'
+
+        Returns:
+            RegionIndex instance
+        """
+        mapping = {}
+        for path in paths:
+            parts = path.replace('\\', '/').strip('/').split('/')
+            if len(parts) != 2 or not parts[1].endswith('.json'):
+                continue
+            region, filename = parts
+            mapping[filename[:-len('.json')]] = region
+        return cls(mapping)
+
+    @classmethod
+    def fetch(cls, session: Optional[requests.Session] = None, timeout: int = 30) -> 'RegionIndex':
+        """
+        Build an index from the upstream repository tree listing.
+
+        Args:
+            session: Optional requests session to use
+            timeout: Request timeout in seconds (default: 30)
+
+        Returns:
+            RegionIndex instance
+
+        Raises:
+            requests.RequestException: If the listing cannot be retrieved
+        """
+        session = session or requests.Session()
+        response = session.get(cls.TREE_URL, timeout=timeout)
+        response.raise_for_status()
+        tree = response.json().get('tree', [])
+        return cls.from_listing(entry['path'] for entry in tree if entry.get('type') == 'blob')
+
+    def save(self, path: Optional[str] = None) -> None:
+        """
+        Write the index to a JSON file.
+
+        Args:
+            path: Destination path (default: the index shipped with the package)
+        """
+        path = path or self.DEFAULT_PATH
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self._regions, f, indent=2, sort_keys=True)
+            f.write('\n')
+        os.replace(tmp_path, path)
+
+    def region_for(self, gec_code: str) -> Optional[str]:
+        """
+        Get the region directory for a GEC code.
+
+        Args:
+            gec_code: GEC code (e.g., 'us', 'gm')
+
+        Returns:
+            Region name or None if the code is not in the index
+        """
+        return self._regions.get(gec_code.lower())
+
+    def codes_in_region(self, region: str) -> List[str]:
+        """
+        Get all GEC codes stored under a region.
+
+        Args:
+            region: Region name (e.g., 'africa', 'europe')
+
+        Returns:
+            Sorted list of GEC codes
+        """
+        return sorted(gec for gec, name in self._regions.items() if name == region)
+
+    def codes(self) -> List[str]:
+        """
+        Get every GEC code in the index.
+
+        Returns:
+            Sorted list of GEC codes
+        """
+        return sorted(self._regions)
+
+    def __contains__(self, gec_code: str) -> bool:
+        return gec_code.lower() in self._regions
+
+    def __len__(self) -> int:
+        return len(self._regions)
+
+
+if __name__ == '__main__':
+    output_path = sys.argv[1] if len(sys.argv) > 1 else None
+    index = RegionIndex.fetch()
+    index.save(output_path)
+    print(f"Wrote {len(index)} entries to {output_path or RegionIndex.DEFAULT_PATH}")
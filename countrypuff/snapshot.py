@@ -0,0 +1,154 @@
+"""
+Offline snapshot source for factbook.json data.
+
+A snapshot is a local copy of the factbook.json repository, either a plain
+directory (e.g. a git checkout) or a tarball such as the archive GitHub
+serves for the repository. Every ``<region>/<gec>.json`` file is loaded
+into memory up front so lookups never touch the network.
+"""
+
+import hashlib
+import json
+import os
+import re
+import tarfile
+import threading
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .region_index import RegionIndex
+
+
+class Snapshot:
+    """
+    In-memory copy of the whole factbook dataset.
+    """
+
+    # Matches '<region>/<gec>.json' at the end of a path
+    FILE_PATTERN = re.compile(r'(?:^|/)([a-z0-9-]+)/([a-z]{2})\.json$')
+
+    _loaded: Dict[str, 'Snapshot'] = {}
+    _lock = threading.Lock()
+
+    def __init__(self, countries: Dict[str, Dict], regions: Dict[str, str],
+                 version: str, path: Optional[str] = None):
+        """
+        Initialize the Snapshot.
+
+        Args:
+            countries: Dictionary of GEC code -> country data
+            regions: Dictionary of GEC code -> region name
+            version: Content hash identifying this dataset
+            path: Location the snapshot was loaded from
+        """
+        self.countries = countries
+        self.regions = regions
+        self.version = version
+        self.path = path
+        self.region_index = RegionIndex(regions)
+
+    @classmethod
+    def open(cls, path: str) -> 'Snapshot':
+        """
+        Load a snapshot, reusing an already loaded copy of the same path.
+
+        Args:
+            path: Directory, git checkout or tarball (.tar, .tar.gz, .tgz)
+
+        Returns:
+            Snapshot instance
+        """
+        path = os.path.abspath(path)
+        with cls._lock:
+            if path not in cls._loaded:
+                cls._loaded[path] = cls.load(path)
+            return cls._loaded[path]
+
+    @classmethod
+    def load(cls, path: str) -> 'Snapshot':
+        """
+        Read every country file from a directory or tarball.
+
+        Args:
+            path: Directory, git checkout or tarball (.tar, .tar.gz, .tgz)
+
+        Returns:
+            Snapshot instance
+
+        Raises:
+            FileNotFoundError: If the path does not exist
+            ValueError: If no country files are found
+        """
+        if os.path.isdir(path):
+            files = cls._iter_directory(path)
+        elif os.path.isfile(path):
+            files = cls._iter_tarball(path)
+        else:
+            raise FileNotFoundError(f"Snapshot '{path}' does not exist")
+
+        countries = {}
+        regions = {}
+        digest = hashlib.sha1()
+        for relative_path, content in sorted(files):
+            match = cls.FILE_PATTERN.search(relative_path)
+            if not match:
+                continue
+            region, gec_code = match.groups()
+            countries[gec_code] = json.loads(content)
+            regions[gec_code] = region
+            digest.update(f"{region}/{gec_code}".encode('utf-8'))
+            digest.update(content)
+
+        if not countries:
+            raise ValueError(f"No '<region>/<gec>.json' files found in snapshot '{path}'")
+
+        return cls(countries, regions, digest.hexdigest()[:12], path)
+
+    def get(self, gec_code: str) -> Optional[Dict]:
+        """
+        Get a country's data.
+
+        Args:
+            gec_code: GEC code (e.g., 'us', 'gm')
+
+        Returns:
+            Country data dictionary or None if not in the snapshot
+        """
+        return self.countries.get(gec_code.lower())
+
+    def codes(self) -> List[str]:
+        """
+        Get every GEC code in the snapshot.
+
+        Returns:
+            Sorted list of GEC codes
+        """
+        return sorted(self.countries)
+
+    def __contains__(self, gec_code: str) -> bool:
+        return gec_code.lower() in self.countries
+
+    def __len__(self) -> int:
+        return len(self.countries)
+
+    @staticmethod
+    def _iter_directory(root: str) -> Iterator[Tuple[str, bytes]]:
+        for dirpath, dirnames, filenames in os.walk(root):
+            # Skip .git and other hidden directories
+            dirnames[:] = [d for d in dirnames if not d.startswith('.')]
+            for filename in filenames:
+                if not filename.endswith('.json'):
+                    continue
+                full_path = os.path.join(dirpath, filename)
+                relative_path = os.path.relpath(full_path, root).replace(os.sep, '/')
+                with open(full_path, 'rb') as f:
+                    yield relative_path, f.read()
+
+    @staticmethod
+    def _iter_tarball(path: str) -> Iterator[Tuple[str, bytes]]:
+        with tarfile.open(path, 'r:*') as archive:
+            for member in archive:
+                if not member.isfile() or not member.name.endswith('.json'):
+                    continue
+                f = archive.extractfile(member)
+                if f is not None:
+                    yield member.name, f.read()
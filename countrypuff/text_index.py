@@ -0,0 +1,334 @@
+"""
+Full-text index over the factbook text of every country.
+
+Each text leaf of a country's data (e.g. Economy > Exports - commodities) is
+a document. Documents are tokenized into an inverted index and ranked with
+BM25, so a corpus-wide query touches only the postings of its terms instead
+of fetching and scanning every country.
+"""
+
+import hashlib
+import json
+import math
+import os
+import re
+import tempfile
+import threading
+import unicodedata
+from collections import Counter
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+
+class TextIndex:
+    """
+    Inverted index with BM25 ranking, updated one country at a time.
+    """
+
+    # BM25 parameters
+    K1 = 1.2
+    B = 0.75
+
+    FORMAT_VERSION = 1
+    SNIPPET_RADIUS = 80
+
+    TOKEN_PATTERN = re.compile(r'[a-z0-9]+')
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Initialize the TextIndex.
+
+        Args:
+            path: JSON file to persist the index to (default: in memory only)
+        """
+        self.path = path
+        self._lock = threading.RLock()
+        self._dirty = False
+        self._next_id = 0
+        self._hashes: Dict[str, str] = {}
+        self._country_docs: Dict[str, List[int]] = {}
+        # doc id -> (GEC code, field path, text, token count)
+        self._docs: Dict[int, Tuple[str, Tuple[str, ...], str, int]] = {}
+        # term -> {doc id: term frequency}
+        self._postings: Dict[str, Dict[int, int]] = {}
+        self._total_length = 0
+
+    @classmethod
+    def load(cls, path: str) -> 'TextIndex':
+        """
+        Load a persisted index, or start an empty one if the file is missing
+        or was written by an incompatible version.
+
+        Args:
+            path: Index file
+
+        Returns:
+            TextIndex instance that saves back to path
+        """
+        index = cls(path)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                payload = json.load(f)
+        except (OSError, ValueError):
+            return index
+
+        if payload.get('format') != cls.FORMAT_VERSION:
+            return index
+
+        for country_code, entry in payload.get('countries', {}).items():
+            documents = [(tuple(path), text) for path, text in entry['docs']]
+            index._add_documents(country_code, entry['hash'], documents)
+        return index
+
+    def save(self, path: Optional[str] = None) -> None:
+        """
+        Write the index to disk atomically.
+
+        Args:
+            path: Index file (default: the path the index was created with)
+        """
+        path = path or self.path
+        if not path:
+            return
+
+        with self._lock:
+            payload = {
+                'format': self.FORMAT_VERSION,
+                'countries': {
+                    country_code: {
+                        'hash': self._hashes[country_code],
+                        'docs': [[list(self._docs[doc_id][1]), self._docs[doc_id][2]]
+                                 for doc_id in doc_ids]
+                    }
+                    for country_code, doc_ids in sorted(self._country_docs.items())
+                }
+            }
+            self._dirty = False
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(payload, f, ensure_ascii=False, separators=(',', ':'))
+            os.replace(temp_path, path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+    @property
+    def dirty(self) -> bool:
+        """Whether the index has changed since it was loaded or saved."""
+        return self._dirty
+
+    @staticmethod
+    def content_hash(data: Dict) -> str:
+        """
+        Hash a country's data so unchanged countries can be skipped.
+
+        Args:
+            data: Country data
+
+        Returns:
+            Hex digest of the canonical JSON encoding
+        """
+        encoded = json.dumps(data, sort_keys=True, separators=(',', ':')).encode('utf-8')
+        return hashlib.sha1(encoded).hexdigest()
+
+    @classmethod
+    def tokenize(cls, text: str) -> List[str]:
+        """
+        Split text into lowercase, accent-folded terms.
+
+        Args:
+            text: Raw text
+
+        Returns:
+            List of terms
+        """
+        text = text.lower()
+        if not text.isascii():
+            text = unicodedata.normalize('NFKD', text)
+            text = ''.join(char for char in text if not unicodedata.combining(char))
+        return cls.TOKEN_PATTERN.findall(text)
+
+    @staticmethod
+    def text_leaves(data: Any, path: Tuple[str, ...] = ()) -> Iterator[Tuple[Tuple[str, ...], str]]:
+        """
+        Yield every non-empty string in a country's data with its field path.
+
+        The factbook stores values under 'text' keys, which are left out of
+        the path (so a hit reads Economy > Exports - commodities, not
+        Economy > Exports - commodities > text).
+
+        Args:
+            data: Country data or a nested part of it
+            path: Path of data within the country
+
+        Yields:
+            (field path, text) tuples
+        """
+        if isinstance(data, dict):
+            for key, value in data.items():
+                child_path = path if key == 'text' else path + (key,)
+                yield from TextIndex.text_leaves(value, child_path)
+        elif isinstance(data, list):
+            for item in data:
+                yield from TextIndex.text_leaves(item, path)
+        elif isinstance(data, str) and data.strip():
+            yield path, data
+
+    def update_country(self, country_code: str, data: Dict) -> bool:
+        """
+        Index a country's data, replacing its previous documents.
+
+        Countries whose content hash has not changed are left untouched.
+
+        Args:
+            country_code: GEC code
+            data: Country data
+
+        Returns:
+            True if the index changed
+        """
+        content_hash = self.content_hash(data)
+        with self._lock:
+            if self._hashes.get(country_code) == content_hash:
+                return False
+            self._remove_documents(country_code)
+            self._add_documents(country_code, content_hash, list(self.text_leaves(data)))
+            self._dirty = True
+            return True
+
+    def remove_country(self, country_code: str) -> None:
+        """
+        Drop a country from the index.
+
+        Args:
+            country_code: GEC code
+        """
+        with self._lock:
+            if country_code in self._hashes:
+                self._remove_documents(country_code)
+                self._dirty = True
+
+    def countries(self) -> List[str]:
+        """
+        Get the GEC codes of every indexed country.
+
+        Returns:
+            Sorted list of GEC codes
+        """
+        with self._lock:
+            return sorted(self._hashes)
+
+    def search(self, query: str, limit: Optional[int] = 20) -> List[Dict[str, Any]]:
+        """
+        Find the fields that best match a query, ranked by BM25.
+
+        Args:
+            query: Search text; every term contributes to the score
+            limit: Maximum number of hits (default: 20, None for all)
+
+        Returns:
+            List of dictionaries with gec_code, path, field, snippet and score
+        """
+        terms = list(dict.fromkeys(self.tokenize(query)))
+        if not terms:
+            return []
+
+        with self._lock:
+            document_count = len(self._docs)
+            if not document_count:
+                return []
+            average_length = self._total_length / document_count
+
+            scores: Dict[int, float] = {}
+            for term in terms:
+                postings = self._postings.get(term)
+                if not postings:
+                    continue
+                frequency = len(postings)
+                idf = math.log(1 + (document_count - frequency + 0.5) / (frequency + 0.5))
+                for doc_id, term_frequency in postings.items():
+                    length = self._docs[doc_id][3]
+                    norm = self.K1 * (1 - self.B + self.B * length / average_length)
+                    scores[doc_id] = scores.get(doc_id, 0.0) + (
+                        idf * term_frequency * (self.K1 + 1) / (term_frequency + norm)
+                    )
+
+            ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+            if limit is not None:
+                ranked = ranked[:limit]
+            hits = [(self._docs[doc_id], score) for doc_id, score in ranked]
+
+        return [{
+            'gec_code': country_code,
+            'path': list(path),
+            'field': ' > '.join(path),
+            'snippet': self.snippet(text, terms),
+            'score': round(score, 4)
+        } for (country_code, path, text, _), score in hits]
+
+    @classmethod
+    def snippet(cls, text: str, terms: List[str]) -> str:
+        """
+        Cut the part of a text around the first matching term.
+
+        Args:
+            text: Document text
+            terms: Query terms
+
+        Returns:
+            Excerpt of at most about twice SNIPPET_RADIUS characters
+        """
+        lowered = text.lower()
+        positions = [match.start() for match in
+                     (re.search(r'\b' + re.escape(term), lowered) for term in terms) if match]
+        center = min(positions) if positions else 0
+        start = max(center - cls.SNIPPET_RADIUS, 0)
+        end = min(center + cls.SNIPPET_RADIUS, len(text))
+        excerpt = ' '.join(text[start:end].split())
+        if start > 0:
+            excerpt = '…' + excerpt
+        if end < len(text):
+            excerpt += '…'
+        return excerpt
+
+    def _add_documents(self, country_code: str, content_hash: str,
+                       documents: List[Tuple[Tuple[str, ...], str]]) -> None:
+        doc_ids = []
+        for path, text in documents:
+            tokens = self.tokenize(text)
+            if not tokens:
+                continue
+            doc_id = self._next_id
+            self._next_id += 1
+            self._docs[doc_id] = (country_code, path, text, len(tokens))
+            self._total_length += len(tokens)
+            for term, frequency in Counter(tokens).items():
+                postings = self._postings.get(term)
+                if postings is None:
+                    postings = self._postings[term] = {}
+                postings[doc_id] = frequency
+            doc_ids.append(doc_id)
+        self._country_docs[country_code] = doc_ids
+        self._hashes[country_code] = content_hash
+
+    def _remove_documents(self, country_code: str) -> None:
+        for doc_id in self._country_docs.pop(country_code, ()):
+            _, _, text, length = self._docs.pop(doc_id)
+            self._total_length -= length
+            for term in set(self.tokenize(text)):
+                postings = self._postings[term]
+                del postings[doc_id]
+                if not postings:
+                    del self._postings[term]
+        self._hashes.pop(country_code, None)
+
+    def __contains__(self, country_code: str) -> bool:
+        with self._lock:
+            return country_code in self._hashes
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._docs)
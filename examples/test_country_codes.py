@@ -67,6 +67,8 @@ def test_country_code_mappings():
         'ZA',  # ISO for South Africa
         'sf',  # GEC for South Africa
         'South Africa',  # Name
+        'KOR',  # ISO alpha-3 for South Korea
+        '410',  # ISO numeric for South Korea
     ]
     
     for identifier in resolution_tests:
@@ -142,6 +144,27 @@ def test_edge_cases():
         result = mapper.resolve_country_code(input_code)
         status = "✅" if result == expected else "❌"
         print(f"{status} '{input_code}' -> {result} (expected: {expected})")
+    
+    # Test typo-tolerant resolution
+    fuzzy_tests = [
+        ('Phillipines', 'rp'),  # misspelling
+        ("Côte d'Ivoire", 'iv'),  # accent and apostrophe
+        ("Cote d'Ivoire", 'iv'),  # apostrophe only
+        ('Korea, South', 'ks'),  # inverted name
+        ('Germny', 'gm'),  # missing letter
+    ]
+    
+    print("\n📋 Testing fuzzy resolution:")
+    for name, expected in fuzzy_tests:
+        strict = mapper.resolve_country_code(name)
+        match = mapper.fuzzy_match(name)
+        result = match['gec_code'] if match else None
+        status = "✅" if result == expected else "❌"
+        score = match['score'] if match else None
+        print(f"{status} '{name}' -> {result} (expected: {expected}, score: {score}, strict: {strict})")
+    
+    suggestions = [s['name'] for s in mapper.suggest('Austrlia')]
+    print(f"💡 Did you mean for 'Austrlia': {suggestions}")
 
 
 if __name__ == "__main__":
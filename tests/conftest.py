@@ -0,0 +1,110 @@
+"""Shared fixtures: a small on-disk factbook snapshot and a stub factbook server."""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from countrypuff import DataFetcher
+from countrypuff.cache import LRUCache
+
+
+def country(name, population=None, gdp=None, local=None):
+    data = {'Government': {'Country name': {'conventional short form': {'text': name}}}}
+    if local:
+        data['Government']['Country name']['local short form'] = {'text': local}
+    if population:
+        data['People and Society'] = {'Population': {'total': {'text': population}}}
+    if gdp:
+        data['Economy'] = {'Real GDP per capita': {'Real GDP per capita 2024': {'text': gdp}}}
+    return data
+
+
+SNAPSHOT = {
+    'europe': {
+        'gm': country('Germany', '84,119,100 (2024 est.)', '$53,900 (2024 est.)', local='Deutschland'),
+        'fr': country('France', '68,374,591 (2024 est.)', '$55,500 (2024 est.)'),
+        'ee': country('European Union', '449,206,579 (2024 est.)', '$48,800 (2024 est.)'),
+    },
+    'north-america': {
+        'us': country('United States', '341,963,408 (2024 est.)', '$73,637 (2024 est.)'),
+    },
+    'world': {
+        'xx': country('World', '8,090,872,812 (2024 est.)', '$21,000 (2024 est.)'),
+    },
+    'oceans': {
+        'zh': country('Atlantic Ocean'),
+    },
+}
+
+
+@pytest.fixture
+def snapshot_path(tmp_path):
+    root = tmp_path / 'factbook.json'
+    for region, countries in SNAPSHOT.items():
+        (root / region).mkdir(parents=True)
+        for gec_code, data in countries.items():
+            (root / region / f'{gec_code}.json').write_text(json.dumps(data), encoding='utf-8')
+    return str(root)
+
+
+@pytest.fixture
+def fetcher(snapshot_path):
+    return DataFetcher(snapshot_path=snapshot_path, memory_cache=LRUCache(), negative_cache=LRUCache())
+
+
+class StubFactbook:
+    """A local factbook.json server recording the requests it receives."""
+
+    def __init__(self):
+        self.files = {}
+        self.hang = set()
+        self.requests = []
+        handler = self._handler()
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+        self.base_url = f"http://127.0.0.1:{self.server.server_address[1]}/"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def add(self, path, data, etag=None):
+        self.files[path] = (json.dumps(data).encode('utf-8'), etag)
+
+    def _handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                path = self.path.lstrip('/')
+                stub.requests.append((path, dict(self.headers)))
+                if path in stub.hang:
+                    time.sleep(2)
+                if path not in stub.files:
+                    self.send_response(404)
+                    self.end_headers()
+                    return
+                body, etag = stub.files[path]
+                if etag and self.headers.get('If-None-Match') == etag:
+                    self.send_response(304)
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                if etag:
+                    self.send_header('ETag', etag)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+
+@pytest.fixture
+def factbook_server():
+    stub = StubFactbook()
+    yield stub
+    stub.server.shutdown()
+    stub.server.server_close()
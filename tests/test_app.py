@@ -0,0 +1,161 @@
+"""Tests for the Flask API."""
+
+import gzip
+import json
+
+import pytest
+
+import app as app_module
+from countrypuff import DataFetcher
+
+
+@pytest.fixture
+def client(fetcher, monkeypatch):
+    monkeypatch.setattr(app_module, 'data_fetcher', fetcher)
+    DataFetcher.set_shared(fetcher)
+    app_module.ranking_cache.invalidate()
+    app_module.country_list_cache.clear()
+    yield app_module.app.test_client()
+    DataFetcher.set_shared(None)
+
+
+def test_country_list_etag_and_304(client):
+    response = client.get('/api/countries')
+    assert response.status_code == 200
+    assert response.headers['Vary'] == 'Accept-Encoding'
+    assert 'Content-Encoding' not in response.headers
+    etag = response.headers['ETag']
+    names = {entry['name'] for entry in response.get_json()['countries']}
+    assert {'Germany', 'France', 'United States'} <= names
+
+    revalidated = client.get('/api/countries', headers={'If-None-Match': etag})
+    assert revalidated.status_code == 304
+    assert revalidated.data == b''
+    assert revalidated.headers['ETag'] == etag
+
+    assert client.get('/api/countries', headers={'If-None-Match': '"stale"'}).status_code == 200
+
+
+def test_country_list_gzip_variant(client):
+    plain = client.get('/api/countries')
+    response = client.get('/api/countries', headers={'Accept-Encoding': 'gzip'})
+    assert response.status_code == 200
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert response.headers['Vary'] == 'Accept-Encoding'
+    assert response.headers['ETag'] == plain.headers['ETag'][:-1] + '-gzip"'
+    assert json.loads(gzip.decompress(response.data)) == plain.get_json()
+
+    # Either variant's ETag validates the client's copy
+    revalidated = client.get('/api/countries', headers={
+        'Accept-Encoding': 'gzip', 'If-None-Match': plain.headers['ETag']
+    })
+    assert revalidated.status_code == 304
+    assert revalidated.headers['ETag'] == response.headers['ETag']
+
+
+def test_rankings_exclude_aggregates_by_default(client):
+    pytest.importorskip('numpy')
+    body = client.get('/api/rankings/population').get_json()
+    assert [entry['gec_code'] for entry in body['rankings']] == ['us', 'gm', 'fr']
+    assert body['rankings'][0]['text'] == '341,963,408 (2024 est.)'
+    assert body['rankings'][0]['value'] == 341963408.0
+
+    body = client.get('/api/rankings/population?include_aggregates=1').get_json()
+    assert [entry['gec_code'] for entry in body['rankings']][:2] == ['xx', 'ee']
+
+
+def test_rankings_filters(client):
+    pytest.importorskip('numpy')
+    body = client.get('/api/rankings/gdp_per_capita?order=asc&region=europe&min=54000').get_json()
+    assert [entry['gec_code'] for entry in body['rankings']] == ['fr']
+    assert body['total'] == 1
+
+
+@pytest.mark.parametrize('query', ['limit=0', 'limit=-1', 'min=nan', 'max=abc', 'order=up', 'region=mars'])
+def test_rankings_reject_invalid_parameters(client, query):
+    assert client.get(f'/api/rankings/population?{query}').status_code == 400
+
+
+def test_rankings_unknown_indicator(client):
+    assert client.get('/api/rankings/capital').status_code == 404
+
+
+def test_search_is_unavailable_until_warm_up_builds_the_index(client, monkeypatch):
+    monkeypatch.setitem(app_module.warm_up_state, 'ready', False)
+    response = client.get('/api/search?q=germany')
+    assert response.status_code == 503
+    assert response.headers['Retry-After'] == '30'
+
+    monkeypatch.setitem(app_module.warm_up_state, 'ready', True)
+    body = client.get('/api/search?q=germany').get_json()
+    assert body['countries'][0] == 'gm'
+
+
+def test_unknown_country_has_no_unrelated_suggestions(client):
+    response = client.get('/api/countries/zz')
+    assert response.status_code == 404
+    assert response.get_json()['did_you_mean'] == []
+
+    response = client.get('/api/countries/Germny')
+    assert [s['gec_code'] for s in response.get_json()['did_you_mean']] == ['gm']
+
+
+@pytest.mark.parametrize('limit, status', [('1', 200), ('0', 400), ('-1', 400), ('x', 400)])
+def test_country_search_limit(client, limit, status):
+    response = client.get(f'/api/countries/search?q=a&limit={limit}')
+    assert response.status_code == status
+    if status == 200:
+        assert len(response.get_json()['results']) == 1
+
+
+@pytest.mark.parametrize('limit, status', [('1', 200), ('500', 200), ('0', 400), ('-3', 400), ('x', 400)])
+def test_suggest_limit(client, limit, status):
+    response = client.get(f'/api/countries/suggest?q=ger&limit={limit}')
+    assert response.status_code == status
+    if status == 200:
+        suggestions = response.get_json()['suggestions']
+        assert 1 <= len(suggestions) <= min(int(limit), 50)
+
+
+@pytest.mark.parametrize('limit, status', [('1', 200), ('0', 400), ('-1', 400), ('x', 400)])
+def test_text_search_limit(client, monkeypatch, limit, status):
+    monkeypatch.setitem(app_module.warm_up_state, 'ready', True)
+    response = client.get(f'/api/search?q=germany&limit={limit}')
+    assert response.status_code == status
+    if status == 200:
+        assert len(response.get_json()['hits']) == 1
+
+
+@pytest.mark.parametrize('query, status', [
+    ('q=germany&limit=1', 200),
+    ('q=germany&limit=0', 400),
+    ('q=germany&limit=-1', 400),
+    ('q=(a%2B)%2B$&regex=1', 400),
+])
+def test_country_field_search_parameters(client, query, status):
+    response = client.get(f'/api/countries/gm/search?{query}')
+    assert response.status_code == status
+    if status == 200:
+        assert len(response.get_json()['results']) == 1
+
+
+def test_country_search_caps_hydrated_matches(client, monkeypatch):
+    requested = []
+    original = app_module.data_fetcher.get_many
+
+    def counting_get_many(identifiers, *args, **kwargs):
+        identifiers = list(identifiers)
+        requested.append(len(identifiers))
+        return original(identifiers, *args, **kwargs)
+
+    monkeypatch.setattr(app_module.data_fetcher, 'get_many', counting_get_many)
+
+    response = client.get('/api/countries/search?q=a&include=data')
+    assert response.status_code == 200
+    assert len(response.get_json()['results']) <= 10
+    assert requested and requested[-1] <= 10
+
+    assert client.get('/api/countries/search?q=a&include=data&limit=50').status_code == 200
+    assert client.get('/api/countries/search?q=a&include=data&limit=51').status_code == 400
+    # Without data, matches are cheap and uncapped
+    assert len(client.get('/api/countries/search?q=a').get_json()['results']) > 10
@@ -0,0 +1,53 @@
+"""Tests for the aiohttp-based AsyncDataFetcher."""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip('aiohttp')
+
+from countrypuff import CountryNotFoundError, RegionIndex
+from countrypuff.async_fetcher import AsyncDataFetcher
+from countrypuff.cache import LRUCache
+
+from .conftest import country
+
+GERMANY = country('Germany')
+
+
+def make_fetcher(server, tmp_path, regions=None):
+    return AsyncDataFetcher(timeout=0.5, base_url=server.base_url, cache_dir=str(tmp_path),
+                            region_index=RegionIndex(regions or {}),
+                            memory_cache=LRUCache(), negative_cache=LRUCache())
+
+
+def fetch(fetcher, identifier, region=None):
+    async def run():
+        try:
+            return await fetcher.get_country_data(identifier, region)
+        finally:
+            await AsyncDataFetcher.close()
+    return asyncio.run(run())
+
+
+def test_region_hint_timeout_falls_back_to_index(factbook_server, tmp_path):
+    factbook_server.add('europe/gm.json', GERMANY)
+    factbook_server.hang.add('africa/gm.json')
+
+    fetcher = make_fetcher(factbook_server, tmp_path, {'gm': 'europe'})
+    assert fetch(fetcher, 'gm', region='africa') == GERMANY
+
+
+def test_region_scan_skips_timeouts(factbook_server, tmp_path):
+    factbook_server.hang.add('africa/gm.json')
+
+    with pytest.raises(CountryNotFoundError):
+        fetch(make_fetcher(factbook_server, tmp_path), 'gm')
+
+
+def test_revalidates_through_http_cache(factbook_server, tmp_path):
+    factbook_server.add('europe/gm.json', GERMANY, etag='"v1"')
+
+    assert fetch(make_fetcher(factbook_server, tmp_path, {'gm': 'europe'}), 'gm') == GERMANY
+    assert fetch(make_fetcher(factbook_server, tmp_path, {'gm': 'europe'}), 'gm') == GERMANY
+    assert factbook_server.requests[-1][1]['If-None-Match'] == '"v1"'
@@ -0,0 +1,113 @@
+"""Tests for the in-memory LRU cache."""
+
+import json
+
+import pytest
+
+from countrypuff import CountryData, DataFetcher
+from countrypuff import cache as cache_module
+from countrypuff.cache import LRUCache
+
+from .conftest import country
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, 'monotonic', lambda: now[0])
+    return now
+
+
+def test_evicts_least_recently_used():
+    cache = LRUCache(maxsize=2, ttl=None)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    assert cache.get('a') == 1  # 'b' is now the least recently used
+    cache.set('c', 3)
+
+    assert 'b' not in cache
+    assert cache.get('a') == 1
+    assert cache.get('c') == 3
+    assert cache.stats()['evictions'] == 1
+    assert len(cache) == 2
+
+
+def test_set_existing_key_refreshes_recency():
+    cache = LRUCache(maxsize=2, ttl=None)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    cache.set('a', 10)
+    cache.set('c', 3)
+
+    assert cache.get('a') == 10
+    assert 'b' not in cache
+
+
+def test_entries_expire_after_ttl(clock):
+    cache = LRUCache(maxsize=4, ttl=60)
+    cache.set('a', 1)
+
+    clock[0] += 59
+    assert cache.get('a') == 1
+    assert 'a' in cache
+
+    clock[0] += 1
+    assert 'a' not in cache
+    assert cache.get('a', 'missing') == 'missing'
+    stats = cache.stats()
+    assert stats['expirations'] == 1
+    assert stats['size'] == 0
+
+
+def test_set_restarts_ttl(clock):
+    cache = LRUCache(ttl=60)
+    cache.set('a', 1)
+    clock[0] += 50
+    cache.set('a', 2)
+    clock[0] += 50
+    assert cache.get('a') == 2
+
+
+def test_no_ttl_never_expires(clock):
+    cache = LRUCache(ttl=None)
+    cache.set('a', 1)
+    clock[0] += 10 ** 9
+    assert cache.get('a') == 1
+
+
+def test_invalidate_and_stats():
+    cache = LRUCache(maxsize=8, ttl=None)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    cache.get('a')
+    cache.get('x')
+
+    cache.invalidate('a')
+    assert 'a' not in cache and 'b' in cache
+    cache.invalidate()
+    assert len(cache) == 0
+
+    stats = cache.stats()
+    assert (stats['hits'], stats['misses']) == (1, 1)
+    assert (stats['maxsize'], stats['ttl']) == (8, None)
+
+
+def test_shared_cache_separates_datasets(tmp_path):
+    shared = LRUCache()
+    fetchers = []
+    for population in ('84,119,100 (2024 est.)', '83,294,633 (2023 est.)'):
+        root = tmp_path / population[:2] / 'europe'
+        root.mkdir(parents=True)
+        (root / 'gm.json').write_text(json.dumps(country('Germany', population)), encoding='utf-8')
+        fetchers.append(DataFetcher(snapshot_path=str(root.parent), memory_cache=shared))
+
+    first, second = fetchers
+    assert first.dataset_version != second.dataset_version
+    assert CountryData.from_code('gm', first).population == '84,119,100 (2024 est.)'
+    assert CountryData.from_code('gm', second).population == '83,294,633 (2023 est.)'
+    assert len(shared) == 2
+
+
+def test_live_fetchers_key_by_base_url():
+    assert (DataFetcher(base_url='https://a.example/').cache_key('gm')
+            != DataFetcher(base_url='https://b.example/').cache_key('gm'))
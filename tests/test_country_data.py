@@ -0,0 +1,74 @@
+"""Tests for CountryData field resolution."""
+
+import pytest
+
+from countrypuff import CountryData, DataFetcher
+
+
+def test_latest_year_skips_placeholders():
+    country = CountryData(data={'Economy': {'Real GDP per capita': {
+        'Real GDP per capita 2023': {'text': '$72,000 (2023 est.)'},
+        'Real GDP per capita 2024': {'text': '$73,637 (2024 est.)'},
+        'Real GDP per capita 2025': {'text': 'NA'},
+    }}})
+
+    assert country.gdp_per_capita == '$73,637 (2024 est.)'
+    assert country.latest('Economy', 'Real GDP per capita') == (2024, '$73,637 (2024 est.)')
+    assert country.numeric('gdp_per_capita').value == 73637.0
+    # The series itself still reports every year
+    assert country.for_year(2025, 'Economy', 'Real GDP per capita') == 'NA'
+
+
+def test_latest_year_with_only_placeholders():
+    country = CountryData(data={'Economy': {'Exports': {
+        'Exports 2024': {'text': 'none'},
+        'Exports 2025': {'text': ''},
+    }}})
+
+    assert country.exports is None
+    assert country.latest('Economy', 'Exports') is None
+
+
+def test_series_is_ordered_by_year():
+    country = CountryData(data={'Economy': {'Imports': {
+        'Imports 2024': {'text': '$2 billion'},
+        'Imports 2022': {'text': '$1 billion'},
+        'note': {'text': 'data are in current dollars'},
+    }}})
+
+    assert list(country.series('Economy', 'Imports')) == [2022, 2024]
+    assert country.imports == '$2 billion'
+
+
+def test_shared_fetcher_is_only_created_to_fetch(fetcher, monkeypatch):
+    def no_shared_fetcher(cls):
+        raise AssertionError('DataFetcher.shared() called')
+
+    monkeypatch.setattr(DataFetcher, 'shared', classmethod(no_shared_fetcher))
+    assert CountryData(data={'Government': {'Capital': {'name': {'text': 'Berlin'}}}}).capital == 'Berlin'
+    with pytest.raises(AssertionError):
+        CountryData(country_code='gm')
+
+    monkeypatch.setattr(DataFetcher, 'shared', classmethod(lambda cls: fetcher))
+    assert CountryData(country_code='gm').name == 'Germany'
+
+
+@pytest.mark.parametrize('query, regex, expected', [
+    ('$58', False, True),
+    ('$5', False, False),
+    ('58,900', False, True),
+    ('export', False, False),
+    ('exports', False, True),
+    (r'\$58', True, True),
+    (r'\$5', True, False),
+])
+def test_search_fields_whole_word(query, regex, expected):
+    country = CountryData(data={'Economy': {'Exports': {'text': '$58,900 million exports (2024 est.)'}}})
+    assert bool(country.search_fields(query, regex=regex, whole_word=True)) is expected
+
+
+@pytest.mark.parametrize('limit', [0, -1])
+def test_search_fields_rejects_non_positive_limit(limit):
+    country = CountryData(data={'Economy': {'Exports': {'text': '$58,900 million'}}})
+    with pytest.raises(ValueError):
+        country.search_fields('58', limit=limit)
@@ -0,0 +1,141 @@
+"""Tests for the NumPy-backed CountryTable."""
+
+import threading
+
+import pytest
+
+pytest.importorskip('numpy')
+
+from countrypuff import CountryNotFoundError, CountryTable, DataFetcher, RegionIndex
+from countrypuff.cache import LRUCache
+
+
+class LiveFetcher:
+    """Stands in for a DataFetcher reading the live repository."""
+
+    dataset_version = 'live'
+    snapshot = None
+
+    def __init__(self, countries, failing=()):
+        self.countries = countries
+        self.failing = set(failing)
+        self.region_index = RegionIndex({code: 'europe' for code in list(countries) + list(failing)})
+        # Identifiers resolve exactly as they would for a real fetcher
+        self._resolver = DataFetcher(region_index=self.region_index,
+                                     memory_cache=LRUCache(), negative_cache=LRUCache())
+        self.fetches = 0
+
+    def get_many(self, identifiers):
+        self.fetches += 1
+        results, errors = {}, {}
+        for identifier in identifiers:
+            try:
+                code = self.resolve_identifier(identifier)
+            except CountryNotFoundError as e:
+                errors[identifier] = str(e)
+                continue
+            if code in self.failing:
+                errors[identifier] = 'timed out'
+            elif code in self.countries:
+                results[identifier] = self.countries[code]
+        return {'results': results, 'errors': errors}
+
+    def resolve_identifier(self, identifier):
+        return self._resolver.resolve_identifier(identifier)
+
+
+def population(text):
+    return {'People and Society': {'Population': {'total': {'text': text}}}}
+
+
+@pytest.fixture(autouse=True)
+def clear_tables():
+    CountryTable._tables.clear()
+    yield
+    CountryTable._tables.clear()
+
+
+def test_live_table_is_cached_until_ttl(monkeypatch):
+    fetcher = LiveFetcher({'gm': population('84,119,100 (2024 est.)')})
+
+    table = CountryTable.for_fetcher(fetcher)
+    assert CountryTable.for_fetcher(fetcher) is table
+    assert fetcher.fetches == 1
+
+    monkeypatch.setattr(CountryTable, 'LIVE_TTL', -1)
+    CountryTable._tables.clear()
+    first = CountryTable.for_fetcher(fetcher)
+    assert CountryTable.for_fetcher(fetcher) is not first
+    assert fetcher.fetches == 3
+
+
+def test_live_table_with_fetch_errors_is_not_cached():
+    fetcher = LiveFetcher({'gm': population('84,119,100 (2024 est.)')}, failing=['fr'])
+
+    table = CountryTable.for_fetcher(fetcher)
+    assert 'gm' in table and 'fr' not in table
+    CountryTable.for_fetcher(fetcher)
+    assert fetcher.fetches == 2
+
+    fetcher.failing.clear()
+    fetcher.countries['fr'] = population('68,374,591 (2024 est.)')
+    assert 'fr' in CountryTable.for_fetcher(fetcher)
+
+
+def test_expired_table_is_served_while_rebuilding():
+    fetcher = LiveFetcher({'gm': population('84,119,100 (2024 est.)')})
+    stale = CountryTable.for_fetcher(fetcher)
+    CountryTable._tables['live'] = (stale, 0.0)
+
+    with CountryTable._build_lock:
+        # Another thread is rebuilding: the stale table is served without waiting
+        result = []
+        thread = threading.Thread(target=lambda: result.append(CountryTable.for_fetcher(fetcher)))
+        thread.start()
+        thread.join(timeout=5)
+        assert result == [stale]
+
+
+def test_npz_round_trip(fetcher, tmp_path):
+    table = CountryTable.from_snapshot(fetcher.snapshot)
+    path = str(tmp_path / 'tables' / 'country_table.npz')
+    table.save(path)
+
+    loaded = CountryTable.load(path, table.version)
+    assert loaded.version == table.version
+    assert loaded.codes.tolist() == table.codes.tolist()
+    assert loaded.regions.tolist() == table.regions.tolist()
+    assert loaded.aggregates.tolist() == table.aggregates.tolist()
+    for indicator in CountryTable.INDICATORS:
+        for row in range(len(table)):
+            assert loaded.record(indicator, row) == table.record(indicator, row)
+    assert loaded.rank('population').tolist() == table.rank('population').tolist()
+
+    germany = loaded.record('gdp_per_capita', loaded.row('gm'))
+    assert (germany.value, germany.unit, germany.year, germany.estimate) == (53900.0, 'USD', 2024, True)
+    assert loaded.record('population', loaded.row('zh')) is None
+
+
+def test_load_rejects_other_versions_and_bad_files(fetcher, tmp_path):
+    path = str(tmp_path / 'country_table.npz')
+    CountryTable.from_snapshot(fetcher.snapshot).save(path)
+
+    assert CountryTable.load(path, 'another-version') is None
+    assert CountryTable.load(path) is not None
+    assert CountryTable.load(str(tmp_path / 'missing.npz')) is None
+
+    (tmp_path / 'corrupt.npz').write_bytes(b'not a zip file')
+    assert CountryTable.load(str(tmp_path / 'corrupt.npz')) is None
+
+
+def test_live_table_has_one_row_per_entity():
+    fetcher = LiveFetcher({
+        'au': population('8,967,982 (2024 est.)'),
+        'at': population('no indigenous inhabitants'),
+        'gm': population('84,119,100 (2024 est.)'),
+    })
+
+    table = CountryTable.for_fetcher(fetcher)
+    assert sorted(table.codes.tolist()) == ['at', 'au', 'gm']
+    assert table.codes[table.rank('population')].tolist() == ['gm', 'au']
+    assert table.record('population', table.row('at')) is None
@@ -0,0 +1,12 @@
+"""Tests for DataFetcher configuration."""
+
+from countrypuff import DataFetcher
+
+
+def test_connection_pool_matches_concurrency():
+    fetcher = DataFetcher(max_workers=4)
+    assert fetcher.pool_size == 4
+    assert fetcher.session.get_adapter('https://raw.githubusercontent.com/')._pool_maxsize == 4
+
+    assert DataFetcher(max_workers=4, probe_mode='parallel', probe_workers=13).pool_size == 13
+    assert DataFetcher(pool_size=32).session.get_adapter('http://localhost/')._pool_maxsize == 32
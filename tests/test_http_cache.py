@@ -0,0 +1,94 @@
+"""Tests for the on-disk HTTP cache and conditional revalidation."""
+
+import pytest
+import requests
+
+from countrypuff import DataFetcher, RegionIndex
+from countrypuff.cache import LRUCache
+from countrypuff.http_cache import HTTPCache
+
+GERMANY = {'Government': {'Country name': {'conventional short form': {'text': 'Germany'}}}}
+
+
+def make_fetcher(server, cache_dir):
+    return DataFetcher(base_url=server.base_url, cache_dir=str(cache_dir),
+                       region_index=RegionIndex({'gm': 'europe'}),
+                       memory_cache=LRUCache(), negative_cache=LRUCache())
+
+
+def test_store_and_load_round_trip(tmp_path):
+    cache = HTTPCache(str(tmp_path))
+    url = 'https://example.com/europe/gm.json'
+
+    assert cache.load(url) is None
+    assert cache.conditional_headers(url) == {}
+
+    data = cache.store(url, b'{"a": 1}', etag='"v1"', last_modified='Wed, 01 Jan 2025 00:00:00 GMT')
+    assert data == {'a': 1}
+    assert cache.load(url) == {'a': 1}
+    assert cache.conditional_headers(url) == {
+        'If-None-Match': '"v1"',
+        'If-Modified-Since': 'Wed, 01 Jan 2025 00:00:00 GMT'
+    }
+
+    cache.clear()
+    assert cache.load(url) is None
+
+
+def test_revalidation_answers_304_from_disk(factbook_server, tmp_path):
+    factbook_server.add('europe/gm.json', GERMANY, etag='"v1"')
+
+    fetcher = make_fetcher(factbook_server, tmp_path)
+    assert fetcher.get_country_data('gm') == GERMANY
+
+    # A restarted process revalidates its on-disk copy instead of downloading it
+    restarted = make_fetcher(factbook_server, tmp_path)
+    assert restarted.get_country_data('gm') == GERMANY
+
+    first, second = factbook_server.requests
+    assert 'If-None-Match' not in first[1]
+    assert second[1]['If-None-Match'] == '"v1"'
+
+
+def test_changed_document_is_downloaded_again(factbook_server, tmp_path):
+    factbook_server.add('europe/gm.json', GERMANY, etag='"v1"')
+    make_fetcher(factbook_server, tmp_path).get_country_data('gm')
+
+    updated = {'Government': {'Capital': {'name': {'text': 'Berlin'}}}}
+    factbook_server.add('europe/gm.json', updated, etag='"v2"')
+    assert make_fetcher(factbook_server, tmp_path).get_country_data('gm') == updated
+    assert HTTPCache(str(tmp_path)).conditional_headers(factbook_server.base_url + 'europe/gm.json') == {
+        'If-None-Match': '"v2"'
+    }
+
+
+def test_304_without_stored_body_refetches(factbook_server, tmp_path):
+    factbook_server.add('europe/gm.json', GERMANY, etag='"v1"')
+    make_fetcher(factbook_server, tmp_path).get_country_data('gm')
+
+    # Validators survive but the body was lost: the fetcher has to download it again
+    for path in tmp_path.iterdir():
+        if path.name.endswith('.json') and not path.name.endswith('.meta.json'):
+            path.unlink()
+    assert make_fetcher(factbook_server, tmp_path).get_country_data('gm') == GERMANY
+
+
+def test_clear_only_removes_cache_files(tmp_path):
+    cache = HTTPCache(str(tmp_path))
+    cache.store('https://example.com/europe/gm.json', b'{}', etag='"v1"')
+    (tmp_path / 'notes.json').write_text('{}')
+    (tmp_path / 'country_table-live.npz').write_bytes(b'')
+
+    cache.clear()
+    assert sorted(path.name for path in tmp_path.iterdir()) == ['country_table-live.npz', 'notes.json']
+
+
+def test_malformed_body_is_skipped_by_the_region_scan(factbook_server, tmp_path):
+    factbook_server.files['africa/gm.json'] = (b'<html>rate limited</html>', None)
+    factbook_server.add('europe/gm.json', GERMANY)
+
+    fetcher = DataFetcher(base_url=factbook_server.base_url, cache_dir=str(tmp_path),
+                          region_index=RegionIndex(), memory_cache=LRUCache(), negative_cache=LRUCache())
+    assert fetcher.get_country_data('gm') == GERMANY
+    with pytest.raises(requests.RequestException):
+        fetcher._request_json(factbook_server.base_url + 'africa/gm.json')
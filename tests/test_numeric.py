@@ -0,0 +1,55 @@
+"""Tests for typed parsing of numeric factbook text."""
+
+import pytest
+
+from countrypuff import CountryData
+from countrypuff.numeric import parse_numeric
+
+
+@pytest.mark.parametrize('text, value, unit, multiplier, year, estimate', [
+    ('338,289,857 (2024 est.)', 338289857.0, None, 1.0, 2024, True),
+    ('$73.637 trillion (2023 est.)', 73.637e12, 'USD', 1e12, 2023, True),
+    ('$85,800 (2023 est.)', 85800.0, 'USD', 1.0, 2023, True),
+    ('€12.5 million', 12.5e6, 'EUR', 1e6, None, False),
+    ('£3 thousand (2020)', 3000.0, 'GBP', 1e3, 2020, False),
+    ('28.4 million (2023 est.)', 28.4e6, None, 1e6, 2023, True),
+    ('281.777 million Btu/person (2023 est.)', 281.777e6, 'Btu/person', 1e6, 2023, True),
+    ('4.1% (2023 est.)', 4.1, '%', 1.0, 2023, True),
+    ('4.3% of GDP (2023 est.)', 4.3, '% of GDP', 1.0, 2023, True),
+    ('99.2%', 99.2, '%', 1.0, None, False),
+    ('-0.3% (2023 est.)', -0.3, '%', 1.0, 2023, True),
+    ('$-1.2 billion (2022 est.)', -1.2e9, 'USD', 1e9, 2022, True),
+    ('-$1.2 billion (2022 est.)', -1.2e9, 'USD', 1e9, 2022, True),
+    ('4.1% (FY2022/23 est.)', 4.1, '%', 1.0, 2022, True),
+    ('13,513 (2024)', 13513.0, None, 1.0, 2024, False),
+    ('9,833,517 sq km', 9833517.0, 'sq km', 1.0, None, False),
+    ('11.6 births/1,000 population (2024 est.)', 11.6, 'births/1,000 population', 1.0, 2024, True),
+    ('79.7 years', 79.7, 'years', 1.0, None, False),
+    ('$85,800 (2023 est.)\nnote: data are in 2021 dollars (2019 est.)', 85800.0, 'USD', 1.0, 2023, True),
+    ('$3.052 trillion; note: includes re-exports (2024 est.)', 3.052e12, 'USD', 1e12, 2024, True),
+])
+def test_parse_numeric(text, value, unit, multiplier, year, estimate):
+    parsed = parse_numeric(text)
+
+    assert parsed.value == pytest.approx(value)
+    assert parsed.unit == unit
+    assert parsed.multiplier == multiplier
+    assert parsed.year == year
+    assert parsed.estimate is estimate
+    assert parsed.text == text
+
+
+@pytest.mark.parametrize('text', ['NA', 'none', '', 'NA\nnote: no data reported', None, 42])
+def test_parse_numeric_without_a_figure(text):
+    assert parse_numeric(text) is None
+
+
+def test_to_dict():
+    assert parse_numeric('4.1% (2023 est.)').to_dict() == {
+        'value': 4.1, 'unit': '%', 'multiplier': 1.0, 'year': 2023, 'estimate': True, 'text': '4.1% (2023 est.)'
+    }
+
+
+def test_country_numeric_rejects_unknown_fields():
+    with pytest.raises(ValueError):
+        CountryData(data={}).numeric('capital')
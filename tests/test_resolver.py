@@ -0,0 +1,59 @@
+"""Tests for resolving country identifiers to GEC codes."""
+
+import pytest
+
+from countrypuff import CountryCodeMapper, CountryNotFoundError, DataFetcher, RegionIndex
+
+
+@pytest.mark.parametrize('identifier, gec_code', [
+    ('US', 'us'),                 # ISO alpha-2
+    ('de', 'gm'),                 # ISO alpha-2, lowercase
+    ('DEU', 'gm'),                # ISO alpha-3
+    ('276', 'gm'),                # ISO numeric
+    ('gm', 'gm'),                 # GEC
+    ('Germany', 'gm'),            # name
+    ('  united states ', 'us'),   # name, case and whitespace
+    ('Deutschland', 'gm'),        # alias from the snapshot's Country name fields
+    ('deutschland', 'gm'),
+    ('xx', 'xx'),                 # GEC without an ISO code, via the region index
+])
+def test_resolve_identifier(fetcher, identifier, gec_code):
+    assert fetcher.resolve_identifier(identifier) == gec_code
+
+
+@pytest.mark.parametrize('identifier, gec_code', [
+    # GEC codes of entities without an ISO code that collide with ISO alpha-2 codes
+    ('at', 'at'),   # Ashmore and Cartier Islands, not Austria
+    ('cr', 'cr'),   # Coral Sea Islands, not Costa Rica
+    ('pf', 'pf'),   # Paracel Islands, not French Polynesia
+    ('pg', 'pg'),   # Spratly Islands, not Papua New Guinea
+    ('Pg', 'pg'),
+    ('AT', 'au'),   # uppercase pairs are still ISO codes
+    ('CR', 'cs'),
+    ('PF', 'fp'),
+    ('PG', 'pp'),
+])
+def test_gec_codes_win_over_iso_codes(identifier, gec_code):
+    fetcher = DataFetcher(region_index=RegionIndex.default())
+    assert fetcher.resolve_identifier(identifier) == gec_code
+
+
+@pytest.mark.parametrize('identifier', ['Atlantis', 'QQQ', '999', ''])
+def test_unknown_identifier_raises(fetcher, identifier):
+    with pytest.raises(CountryNotFoundError):
+        fetcher.resolve_identifier(identifier)
+    # Failures are memoized and raise again
+    with pytest.raises(CountryNotFoundError):
+        fetcher.resolve_identifier(identifier)
+
+
+def test_suggest_offers_near_misses():
+    suggestions = CountryCodeMapper.suggest('Germny')
+    assert suggestions[0]['gec_code'] == 'gm'
+    assert suggestions[0]['distance'] == 1
+    assert all(s['score'] > 0 and s['distance'] < len('germny') for s in suggestions)
+
+
+@pytest.mark.parametrize('identifier', ['zz', 'q', '', '!!'])
+def test_suggest_skips_unrelated_candidates(identifier):
+    assert CountryCodeMapper.suggest(identifier) == []
@@ -0,0 +1,97 @@
+"""Tests for the full-text index and its use by DataFetcher."""
+
+import threading
+import time
+
+from countrypuff import DataFetcher, RegionIndex
+from countrypuff.text_index import TextIndex
+
+from .conftest import country
+
+GERMANY = country('Germany')
+GERMANY['Economy'] = {'Exports - commodities': {'text': 'cars, machinery, pharmaceuticals'}}
+FRANCE = country('France')
+FRANCE['Economy'] = {'Exports - commodities': {'text': 'aircraft, machinery, wine'}}
+
+
+def test_update_search_and_remove():
+    index = TextIndex()
+    assert index.update_country('gm', GERMANY)
+    assert index.update_country('fr', FRANCE)
+
+    hits = index.search('wine')
+    assert [(hit['gec_code'], hit['field']) for hit in hits] == [('fr', 'Economy > Exports - commodities')]
+    assert hits[0]['snippet'] == 'aircraft, machinery, wine'
+    assert {hit['gec_code'] for hit in index.search('machinery')} == {'gm', 'fr'}
+
+    # Unchanged content is skipped; changed content replaces the old documents
+    assert not index.update_country('gm', GERMANY)
+    updated = country('Germany')
+    updated['Economy'] = {'Exports - commodities': {'text': 'cars, wine'}}
+    assert index.update_country('gm', updated)
+    assert {hit['gec_code'] for hit in index.search('wine')} == {'gm', 'fr'}
+    assert [hit['gec_code'] for hit in index.search('pharmaceuticals')] == []
+
+    index.remove_country('fr')
+    assert index.countries() == ['gm']
+    assert 'fr' not in index
+    assert [hit['gec_code'] for hit in index.search('aircraft')] == []
+    assert len(index) == 2
+
+
+def test_save_and_load_round_trip(tmp_path):
+    path = str(tmp_path / 'index' / 'text.json')
+    index = TextIndex(path)
+    index.update_country('gm', GERMANY)
+    index.update_country('fr', FRANCE)
+    index.remove_country('fr')
+    assert index.dirty
+    index.save()
+    assert not index.dirty
+
+    loaded = TextIndex.load(path)
+    assert loaded.countries() == ['gm']
+    assert not loaded.dirty
+    assert loaded.search('pharmaceuticals') == index.search('pharmaceuticals')
+    assert not loaded.update_country('gm', GERMANY)
+
+
+def test_load_ignores_missing_or_incompatible_files(tmp_path):
+    assert len(TextIndex.load(str(tmp_path / 'missing.json'))) == 0
+
+    path = tmp_path / 'old.json'
+    path.write_text('{"format": 0, "countries": {"gm": {"hash": "x", "docs": [[["a"], "text"]]}}}')
+    assert TextIndex.load(str(path)).countries() == []
+
+
+def test_concurrent_first_searches_build_once(fetcher, monkeypatch):
+    updates = []
+    original = TextIndex.update_country
+
+    def slow_update(self, country_code, data):
+        updates.append(country_code)
+        time.sleep(0.01)
+        return original(self, country_code, data)
+
+    monkeypatch.setattr(TextIndex, 'update_country', slow_update)
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(fetcher.search_text('germany')))
+               for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(updates) == sorted(fetcher.snapshot.codes())
+    assert all(hits and hits[0]['gec_code'] == 'gm' for hits in results)
+
+
+def test_index_survives_clearing_the_http_cache(tmp_path):
+    fetcher = DataFetcher(cache_dir=str(tmp_path), region_index=RegionIndex({'gm': 'europe'}))
+    index = fetcher.text_index()
+    index.update_country('gm', GERMANY)
+    index.save()
+
+    fetcher.http_cache.clear()
+    assert TextIndex.load(fetcher.text_index_path).countries() == ['gm']